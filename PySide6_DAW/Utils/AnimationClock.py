@@ -0,0 +1,163 @@
+"""Animation clock class implementation."""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+
+#: Frame interval in milliseconds if the refresh rate of the screen is unknown
+_DEFAULT_FRAME_INTERVAL = 16
+
+#: Step function of an animation, called with the progress from 0.0 to 1.0 once per frame
+AnimationStep = Callable[[float], None]
+
+
+class AnimationClock(QObject):
+    """Frame clock shared by the animations of all DAW widgets
+
+    A single timer, ticking at the refresh rate of the primary screen, steps all running animations, e.g. the color
+    fades of the side bar buttons. Widgets only register while they are transitioning and the timer is stopped as soon
+    as the last animation finished, so an idle application has no animation timer running at all.
+
+    While motion is reduced, see :meth:`setReducedMotion`, animations jump to their end immediately.
+    """
+
+    _instance: Optional["AnimationClock"] = None
+
+    #: Whether animations are skipped process-wide, e.g. for accessibility or to save power
+    reduced_motion = False
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._animations: Dict[QObject, Tuple[float, float, AnimationStep]] = {}
+        self._frames = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._timerCallback)  # type: ignore[attr-defined]
+
+    @classmethod
+    def instance(cls) -> "AnimationClock":
+        """Returns the process-wide animation clock."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def setReducedMotion(cls, enabled: bool) -> None:
+        """Enable or disable reduced motion process-wide, running animations jump to their end when it is enabled.
+
+        Args:
+            enabled: Whether animations are skipped.
+        """
+        cls.reduced_motion = enabled
+        if enabled and cls._instance is not None:
+            cls._instance.finishAll()
+
+    def start(self, owner: QObject, duration: int, step: AnimationStep) -> None:
+        """Start an animation, replacing the running animation of the same owner.
+
+        The step function is called once per frame until the progress reached 1.0. Without a duration or while motion
+        is reduced, it is only called with a progress of 1.0 right away.
+
+        Args:
+            owner: The object owning the animation, e.g. the transitioning widget.
+            duration: The duration of the animation in milliseconds.
+            step: The step function of the animation.
+        """
+        if duration <= 0 or AnimationClock.reduced_motion:
+            self._animations.pop(owner, None)
+            self._stopIfIdle()
+            step(1.0)
+            return
+        self._animations[owner] = (time.perf_counter(), duration / 1000.0, step)
+        if not self._timer.isActive():
+            self._timer.start(self.frameInterval())
+
+    @staticmethod
+    def frameInterval() -> int:
+        """Returns the frame interval in milliseconds, derived from the refresh rate of the primary screen."""
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0.0
+        return max(1, round(1000.0 / refresh_rate)) if refresh_rate > 0.0 else _DEFAULT_FRAME_INTERVAL
+
+    def stop(self, owner: QObject) -> None:
+        """Stop the animation of an owner without completing it.
+
+        Args:
+            owner: The object owning the animation.
+        """
+        if self._animations.pop(owner, None) is not None:
+            self._stopIfIdle()
+
+    def finishAll(self) -> None:
+        """Complete all running animations immediately."""
+        animations = list(self._animations.values())
+        self._animations.clear()
+        self._timer.stop()
+        for _, _, step in animations:
+            self._step(step, 1.0)
+
+    def isRunning(self, owner: Optional[QObject] = None) -> bool:
+        """Returns whether an animation of the given owner or, without an owner, any animation is running.
+
+        Args:
+            owner: The object owning the animation.
+        """
+        return owner in self._animations if owner is not None else bool(self._animations)
+
+    def isTicking(self) -> bool:
+        """Returns whether the frame timer of the clock is running."""
+        return self._timer.isActive()
+
+    def runningCount(self) -> int:
+        """Returns the number of running animations."""
+        return len(self._animations)
+
+    def frameCount(self) -> int:
+        """Returns the number of frames the clock ticked so far."""
+        return self._frames
+
+    def _timerCallback(self) -> None:
+        """Timer callback
+
+        Step all running animations and drop the finished ones.
+        """
+        self._frames += 1
+        now = time.perf_counter()
+        for owner, (start, duration, step) in list(self._animations.items()):
+            progress = min(1.0, (now - start) / duration)
+            if progress >= 1.0:
+                del self._animations[owner]
+            if not self._step(step, progress):
+                self._animations.pop(owner, None)
+        self._stopIfIdle()
+
+    def _stopIfIdle(self) -> None:
+        """Stop the frame timer if no animation is running."""
+        if not self._animations:
+            self._timer.stop()
+
+    @staticmethod
+    def _step(step: AnimationStep, progress: float) -> bool:
+        """Call the step function of an animation.
+
+        Args:
+            step: The step function.
+            progress: The progress of the animation.
+
+        Returns:
+            Whether the owner of the animation is still alive.
+        """
+        try:
+            step(progress)
+        except RuntimeError:
+            # The widget of the animation was deleted meanwhile
+            return False
+        return True
@@ -0,0 +1,287 @@
+"""Icon rasterizer class implementation."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from PySide6.QtCore import QObject, QRectF, QRunnable, QSize, QStandardPaths, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+#: Icon source which can be rasterized off the main thread: an image or the path of an image file, e.g. an SVG file
+IconSource = Union[QImage, str, "os.PathLike[str]"]
+
+#: Icon key: (source kind, source, width in device pixels, height in device pixels, device pixel ratio)
+_IconKey = Tuple[str, Hashable, int, int, float]
+
+#: Callback called with the key of a requested icon once it is rasterized
+IconCallback = Callable[[_IconKey], None]
+
+#: Maximum number of rasterized icons kept in memory
+_MAX_ENTRIES = 256
+
+
+class IconRasterizerStats(NamedTuple):
+    """Snapshot of the icon rasterizer counters"""
+
+    memory_hits: int
+    disk_hits: int
+    rasterizations: int
+    pending: int
+
+
+class _RasterizeTask(QRunnable):
+    """Task rasterizing an icon on a thread pool"""
+
+    def __init__(self, rasterizer: "IconRasterizer", key: _IconKey, source: IconSource, size: QSize) -> None:
+        """Constructor
+
+        Args:
+            rasterizer: The rasterizer receiving the result.
+            key: The key of the rasterized icon.
+            source: The icon source.
+            size: The size of the rasterized icon in device pixels.
+        """
+        super().__init__()
+
+        self._rasterizer = rasterizer
+        self._key = key
+        self._source = source
+        self._size = size
+        self._cache_dir = rasterizer.cacheDirectory()
+
+    def run(self) -> None:
+        """Load the icon from the on-disk cache or rasterize it and report it to the main thread."""
+        image: Optional[QImage] = None
+        from_disk = False
+        try:
+            cache_path = self._cachePath()
+            if cache_path is not None and cache_path.is_file():
+                image = QImage(str(cache_path))
+                from_disk = not image.isNull()
+            if not from_disk:
+                image = IconRasterizer.rasterize(self._source, self._size)
+                if cache_path is not None and not image.isNull():
+                    # Write atomically, another process may read the same cache entry
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    temp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.png")
+                    if image.save(str(temp_path)):
+                        os.replace(temp_path, cache_path)
+        except Exception:  # pylint: disable=broad-exception-caught; Unreadable icons are reported as null image.
+            image = QImage()
+        try:
+            self._rasterizer.finished.emit(self._key, image, from_disk)  # type: ignore[attr-defined]
+        except RuntimeError:
+            # The rasterizer was destroyed meanwhile
+            pass
+
+    def _cachePath(self) -> Optional[Path]:
+        """Returns the path of the icon in the on-disk cache, keyed by the hash of the icon file and the size."""
+        if self._cache_dir is None or isinstance(self._source, QImage):
+            return None
+        digest = hashlib.sha256(Path(self._source).read_bytes()).hexdigest()
+        return self._cache_dir.joinpath(f"{digest}_{self._size.width()}x{self._size.height()}.png")
+
+
+class IconRasterizer(QObject):
+    """Rasterizer of icons at their target size on a thread pool
+
+    Icons given as image or image file, e.g. an SVG file, are rasterized once per size and device pixel ratio on a
+    worker thread. File based icons are additionally kept in an on-disk cache keyed by the hash of the file and the
+    size, so later application starts only load a small PNG. The rasterizer is shared process-wide, see
+    :meth:`instance`.
+
+    Requesters of an icon should pass a callback to :meth:`pixmap`, which is only called for that icon. Slots connected
+    to ``rasterized`` are called for every rasterized icon, so they do not scale to hundreds of requesters.
+
+    Signals:
+        rasterized: Emitted with the key of an icon once it is rasterized, see :meth:`key`.
+        finished: Emitted by the worker threads with the key, the rasterized image and whether it was loaded from disk.
+    """
+
+    rasterized = Signal(object)
+    finished = Signal(object, QImage, bool)
+
+    _instance: Optional["IconRasterizer"] = None
+
+    def __init__(self, cache_dir: Optional[Path] = None, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            cache_dir: The directory of the on-disk cache, a directory in the user cache location by default.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        if cache_dir is None:
+            location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+            cache_dir = Path(location or tempfile.gettempdir()).joinpath("PySide6_DAW", "icons")
+        self._cache_dir: Optional[Path] = cache_dir
+        self._thread_pool = QThreadPool.globalInstance()
+        self._entries: "OrderedDict[_IconKey, QPixmap]" = OrderedDict()
+        self._pending: Set[_IconKey] = set()
+        self._callbacks: Dict[_IconKey, List[IconCallback]] = {}
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._rasterizations = 0
+        self.finished.connect(self._finishedCallback)  # type: ignore[attr-defined]
+
+    @classmethod
+    def instance(cls) -> "IconRasterizer":
+        """Returns the process-wide icon rasterizer."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def cacheDirectory(self) -> Optional[Path]:
+        """Returns the directory of the on-disk cache or ``None`` if the on-disk cache is disabled."""
+        return self._cache_dir
+
+    def setCacheDirectory(self, cache_dir: Optional[Path]) -> None:
+        """Set the directory of the on-disk cache.
+
+        Args:
+            cache_dir: The directory or ``None`` to disable the on-disk cache.
+        """
+        self._cache_dir = cache_dir
+
+    def stats(self) -> IconRasterizerStats:
+        """Returns a snapshot of the rasterizer counters."""
+        return IconRasterizerStats(
+            memory_hits=self._memory_hits,
+            disk_hits=self._disk_hits,
+            rasterizations=self._rasterizations,
+            pending=len(self._pending),
+        )
+
+    @staticmethod
+    def key(source: IconSource, size: QSize, device_pixel_ratio: float) -> _IconKey:
+        """Returns the key of an icon rasterized at a size.
+
+        Args:
+            source: The icon source.
+            size: The size of the icon in device independent pixels.
+            device_pixel_ratio: The device pixel ratio.
+        """
+        pixel_size = IconRasterizer._pixelSize(size, device_pixel_ratio)
+        if isinstance(source, QImage):
+            return ("image", source.cacheKey(), pixel_size.width(), pixel_size.height(), device_pixel_ratio)
+        return ("file", os.path.abspath(source), pixel_size.width(), pixel_size.height(), device_pixel_ratio)
+
+    def pixmap(
+        self, source: IconSource, size: QSize, device_pixel_ratio: float, callback: Optional[IconCallback] = None
+    ) -> Optional[QPixmap]:
+        """Returns an icon rasterized at a size or start rasterizing it in the background.
+
+        Args:
+            source: The icon source.
+            size: The size of the icon in device independent pixels.
+            device_pixel_ratio: The device pixel ratio.
+            callback: Called once with the key of the icon when it is rasterized, if it is not rasterized yet.
+
+        Returns:
+            The rasterized icon or ``None`` if it is not rasterized yet. ``rasterized`` is emitted once it is.
+        """
+        key = IconRasterizer.key(source, size, device_pixel_ratio)
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+            self._memory_hits += 1
+            return pixmap
+        if callback is not None:
+            callbacks = self._callbacks.setdefault(key, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+        if key not in self._pending:
+            self._pending.add(key)
+            if isinstance(source, QImage):
+                source = source.copy()
+            pixel_size = IconRasterizer._pixelSize(size, device_pixel_ratio)
+            self._thread_pool.start(_RasterizeTask(self, key, source, pixel_size))
+        return None
+
+    @staticmethod
+    def rasterize(source: IconSource, size: Optional[QSize] = None) -> QImage:
+        """Rasterize an icon, keeping its aspect ratio. Thread-safe, so it can be called on worker threads.
+
+        Args:
+            source: The icon source.
+            size: The size in device pixels or ``None`` for the native size of the icon.
+
+        Returns:
+            The rasterized icon or a null image if the source cannot be read.
+        """
+        if isinstance(source, QImage):
+            if size is None or source.isNull():
+                return source.copy()
+            return source.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+        path = os.fspath(source)
+        if path.lower().endswith(".svg"):
+            renderer = QSvgRenderer(path)
+            if not renderer.isValid():
+                return QImage()
+            image_size = renderer.defaultSize() if size is None else size
+            image = QImage(image_size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            target = renderer.defaultSize().scaled(image_size, Qt.AspectRatioMode.KeepAspectRatio)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            renderer.render(
+                painter,
+                QRectF(
+                    (image_size.width() - target.width()) / 2,
+                    (image_size.height() - target.height()) / 2,
+                    target.width(),
+                    target.height(),
+                ),
+            )
+            painter.end()
+            return image
+
+        reader = QImageReader(path)
+        if size is not None and reader.size().isValid():
+            reader.setScaledSize(reader.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+        return reader.read()
+
+    def _finishedCallback(self, key: _IconKey, image: QImage, from_disk: bool) -> None:
+        """Finished callback
+
+        Convert the rasterized icon into a pixmap on the main thread and keep it in memory.
+
+        Args:
+            key: The key of the icon.
+            image: The rasterized icon.
+            from_disk: Whether the icon was loaded from the on-disk cache.
+        """
+        self._pending.discard(key)
+        if from_disk:
+            self._disk_hits += 1
+        else:
+            self._rasterizations += 1
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[-1])
+        self._entries[key] = pixmap
+        while len(self._entries) > _MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        for callback in self._callbacks.pop(key, []):
+            try:
+                callback(key)
+            except RuntimeError:
+                # The widget which requested the icon was deleted meanwhile
+                pass
+        self.rasterized.emit(key)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _pixelSize(size: QSize, device_pixel_ratio: float) -> QSize:
+        """Returns a size in device pixels.
+
+        Args:
+            size: The size in device independent pixels.
+            device_pixel_ratio: The device pixel ratio.
+        """
+        return QSize(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
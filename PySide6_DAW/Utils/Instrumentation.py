@@ -0,0 +1,196 @@
+"""Instrumentation class implementation."""
+
+import bisect
+import functools
+import itertools
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from PySide6.QtCore import QObject, Signal
+
+#: Upper bounds of the duration histogram buckets in milliseconds, the last bucket collects all longer durations
+HISTOGRAM_BUCKETS_MS = [0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0]
+
+#: Maximum number of widget instances recorded, the data of the least recently recorded widgets is dropped beyond it
+MAX_WIDGETS = 1000
+
+#: Dynamic property holding the number identifying a widget instance, as the address of a widget is reused once it is
+#: deleted
+_ID_PROPERTY = "_instrumentation_id"
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+class _Metric:
+    """Count and duration histogram of a single event type of a single widget"""
+
+    def __init__(self) -> None:
+        """Constructor"""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def add(self, duration: float) -> None:
+        """Add a measured duration.
+
+        Args:
+            duration: The duration in seconds.
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, duration * 1e3)] += 1
+
+    def toDict(self) -> Dict[str, Any]:
+        """Returns the metric as JSON serializable dictionary."""
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1e3,
+            "mean_ms": self.total * 1e3 / self.count if self.count else 0.0,
+            "max_ms": self.max * 1e3,
+            "histogram": self.histogram.copy(),
+        }
+
+
+class Instrumentation(QObject):
+    """Opt-in recorder of paint, resize and page switch timings per widget instance
+
+    Widgets report their events via the :func:`instrumented` decorator. While the instrumentation is disabled, which is
+    the default, the decorator only adds a single attribute lookup to the wrapped event handler. The data of at most
+    :data:`MAX_WIDGETS` widget instances is kept, so creating and destroying widgets does not grow it without bound.
+
+    Signals:
+        recorded: Emitted with the widget key, the event type and the duration in seconds for each recorded event.
+    """
+
+    recorded = Signal(str, str, float)
+
+    _instance: Optional["Instrumentation"] = None
+
+    #: Whether the process-wide instrumentation is enabled, checked by the instrumented event handlers
+    enabled = False
+
+    #: Numbers identifying the widget instances, see :meth:`widgetKey`
+    _ids = itertools.count(1)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent object.
+        """
+        super().__init__(parent)
+        self._metrics: "OrderedDict[str, Dict[str, _Metric]]" = OrderedDict()
+
+    @classmethod
+    def instance(cls) -> "Instrumentation":
+        """Returns the process-wide instrumentation."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def setEnabled(cls, enabled: bool) -> None:
+        """Enable or disable the process-wide instrumentation.
+
+        Args:
+            enabled: Whether to record events.
+        """
+        cls.instance()
+        cls.enabled = enabled
+
+    @classmethod
+    def widgetKey(cls, widget: QObject) -> str:
+        """Returns the key identifying a widget instance in the recorded data.
+
+        Widgets are numbered in the order they are first recorded, so a new widget never takes over the recorded data of
+        a deleted widget at the same address.
+
+        Args:
+            widget: The widget.
+        """
+        widget_id = widget.property(_ID_PROPERTY)
+        if widget_id is None:
+            widget_id = next(cls._ids)
+            widget.setProperty(_ID_PROPERTY, widget_id)
+        name = f"{type(widget).__name__}({widget.objectName()})" if widget.objectName() else type(widget).__name__
+        return f"{name}#{widget_id}"
+
+    def record(self, widget: QObject, event: str, duration: float) -> None:
+        """Record an event of a widget.
+
+        Args:
+            widget: The widget handling the event.
+            event: The event type, e.g. ``paint``, ``resize`` or ``pageSwitch``.
+            duration: The duration of the event handler in seconds.
+        """
+        key = self.widgetKey(widget)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = {}
+            if len(self._metrics) > MAX_WIDGETS:
+                self._metrics.popitem(last=False)
+        else:
+            self._metrics.move_to_end(key)
+        metrics.setdefault(event, _Metric()).add(duration)
+        self.recorded.emit(key, event, duration)  # type: ignore[attr-defined]
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Returns the recorded data by widget key and event type."""
+        return {
+            key: {event: metric.toDict() for event, metric in metrics.items()} for key, metrics in self._metrics.items()
+        }
+
+    def widgetStats(self, widget: QObject) -> Dict[str, Dict[str, Any]]:
+        """Returns the recorded data of a single widget by event type.
+
+        Args:
+            widget: The widget.
+        """
+        metrics = self._metrics.get(self.widgetKey(widget), {})
+        return {event: metric.toDict() for event, metric in metrics.items()}
+
+    def reset(self) -> None:
+        """Discard all recorded data."""
+        self._metrics.clear()
+
+    def toJson(self) -> str:
+        """Returns the recorded data as JSON document."""
+        return json.dumps({"histogram_buckets_ms": HISTOGRAM_BUCKETS_MS, "widgets": self.stats()}, indent=4)
+
+    def dump(self, path: str) -> None:
+        """Write the recorded data as JSON document to a file.
+
+        Args:
+            path: The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.toJson())
+
+
+def instrumented(event: str) -> Callable[[_Method], _Method]:
+    """Decorator recording the duration of a widget method while the instrumentation is enabled.
+
+    Args:
+        event: The event type to record.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        def wrapper(self: QObject, *args: Any, **kwargs: Any) -> Any:
+            if not Instrumentation.enabled:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            result = method(self, *args, **kwargs)
+            Instrumentation.instance().record(self, event, time.perf_counter() - start)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
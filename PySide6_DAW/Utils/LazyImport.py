@@ -0,0 +1,64 @@
+"""Lazy import helper implementation."""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Dict, List
+
+
+class LazyModule(ModuleType):
+    """Package importing the modules of its exported names on first attribute access
+
+    Importing the package itself stays cheap, e.g. for command line tools or type checking, as Qt is only imported once
+    a widget class is accessed. Submodules named like their class, e.g. ``PySide6_DAW.Widgets.SideBar``, are bound as
+    class instead of module once they are imported, just like with eager imports in the package.
+    """
+
+    _lazy_exports: Dict[str, str]
+
+    def __getattr__(self, name: str) -> Any:  # pylint: disable=invalid-name; Module attribute protocol.
+        """Returns an exported name and import its module if necessary.
+
+        Args:
+            name: The name of the attribute.
+
+        Raises:
+            AttributeError: If the package does not export the name.
+        """
+        module_name = self.__dict__.get("_lazy_exports", {}).get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(module_name), name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:  # pylint: disable=invalid-name; Module attribute protocol.
+        """Set an attribute, submodules of exported names are replaced by the exported name.
+
+        Args:
+            name: The name of the attribute.
+            value: The value of the attribute.
+        """
+        if isinstance(value, ModuleType) and name in self.__dict__.get("_lazy_exports", {}):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:  # pylint: disable=invalid-name; Module attribute protocol.
+        """Returns the attributes of the package including the exported names, which are not imported yet."""
+        return sorted(set(super().__dir__()) | set(self.__dict__.get("_lazy_exports", {})))
+
+
+def lazyImport(package_name: str, exports: Dict[str, str]) -> None:
+    """Make a package import the modules of its exported names lazily.
+
+    Must be called by the ``__init__`` module of the package. Type checkers should additionally see the exported names
+    via imports guarded by ``typing.TYPE_CHECKING``.
+
+    Args:
+        package_name: The name of the package, i.e. ``__name__``.
+        exports: The module of each exported name.
+    """
+    package = sys.modules[package_name]
+    package.__dict__["_lazy_exports"] = exports
+    package.__dict__["__all__"] = list(exports)
+    package.__class__ = LazyModule
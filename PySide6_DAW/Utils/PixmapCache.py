@@ -0,0 +1,163 @@
+"""Pixmap cache class implementation."""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QPainter, QPixmap
+
+#: Default byte budget of the shared pixmap cache (4 MiB)
+_DEFAULT_BYTE_BUDGET = 4 * 1024 * 1024
+
+#: Cache key: (pixmap key, width, height, device pixel ratio)
+_CacheKey = Tuple[Hashable, int, int, float]
+
+#: Callable painting the content of a pixmap in device independent pixels
+PixmapRenderer = Callable[[QPainter], None]
+
+
+class PixmapCacheStats(NamedTuple):
+    """Snapshot of the pixmap cache counters"""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    byte_budget: int
+
+
+class PixmapCache:
+    """Bounded LRU cache of pre-rendered pixmaps, e.g. tinted icons and button state sprites
+
+    The cache is shared process-wide (see :meth:`instance`), so buttons with the same icon, colors and size share a
+    single pixmap. Entries are evicted in least-recently-used order once the byte budget is exceeded.
+    """
+
+    _instance: Optional["PixmapCache"] = None
+
+    def __init__(self, byte_budget: int = _DEFAULT_BYTE_BUDGET) -> None:
+        """Constructor
+
+        Args:
+            byte_budget: Maximum number of bytes occupied by the cached pixmaps.
+        """
+        self._entries: "OrderedDict[_CacheKey, Tuple[QPixmap, int]]" = OrderedDict()
+        self._byte_budget = byte_budget
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def instance(cls) -> "PixmapCache":
+        """Returns the process-wide pixmap cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def byteBudget(self) -> int:
+        """Returns the maximum number of bytes occupied by the cached pixmaps."""
+        return self._byte_budget
+
+    def setByteBudget(self, byte_budget: int) -> None:
+        """Set the maximum number of bytes occupied by the cached pixmaps.
+
+        Args:
+            byte_budget: The new byte budget.
+
+        Raises:
+            ValueError: If the byte budget is negative.
+        """
+        if byte_budget < 0:
+            raise ValueError("Invalid value for 'byte_budget'! The byte budget must not be negative.")
+        self._byte_budget = byte_budget
+        self._evict()
+
+    def stats(self) -> PixmapCacheStats:
+        """Returns a snapshot of the cache counters."""
+        return PixmapCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            byte_budget=self._byte_budget,
+        )
+
+    def resetStats(self) -> None:
+        """Reset the hit, miss and eviction counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def clear(self) -> None:
+        """Remove all cached pixmaps."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def pixmap(self, key: Hashable, size: QSize, device_pixel_ratio: float, renderer: PixmapRenderer) -> QPixmap:
+        """Returns a cached pixmap and render it first if necessary.
+
+        Args:
+            key: The key identifying the pixmap content, it must cover everything the renderer depends on.
+            size: The size of the pixmap in device independent pixels.
+            device_pixel_ratio: The device pixel ratio of the paint device.
+            renderer: The callable painting the pixmap content on a cache miss.
+
+        Returns:
+            The pixmap, with the given size in device independent pixels.
+        """
+        cache_key: _CacheKey = (key, size.width(), size.height(), device_pixel_ratio)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(cache_key)
+            return entry[0]
+
+        self._misses += 1
+        pixmap = QPixmap(size * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        renderer(painter)
+        painter.end()
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        if cost <= self._byte_budget:
+            self._entries[cache_key] = (pixmap, cost)
+            self._bytes += cost
+            self._evict()
+        return pixmap
+
+    def tintedPixmap(self, source: QPixmap, color: QColor, size: QSize, device_pixel_ratio: float) -> QPixmap:
+        """Returns the source pixmap tinted with the given color and scaled into the given size.
+
+        The returned pixmap has the given size in device independent pixels, with the scaled icon centered within it,
+        and can be blitted with a single ``QPainter.drawPixmap`` call.
+
+        Args:
+            source: The source pixmap, whose alpha channel defines the icon shape.
+            color: The tint color.
+            size: The target size in device independent pixels.
+            device_pixel_ratio: The device pixel ratio of the paint device.
+
+        Returns:
+            The tinted and scaled pixmap.
+        """
+
+        def render(painter: QPainter) -> None:
+            tinted = QPixmap(source)
+            tinted_painter = QPainter(tinted)
+            tinted_painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            tinted_painter.fillRect(tinted.rect(), color)
+            tinted_painter.end()
+            QIcon(tinted).paint(painter, QRect(0, 0, size.width(), size.height()))
+
+        return self.pixmap(("tinted", source.cacheKey(), color.rgba()), size, device_pixel_ratio, render)
+
+    def _evict(self) -> None:
+        """Evict least recently used pixmaps until the byte budget is met."""
+        while self._entries and self._bytes > self._byte_budget:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            self._evictions += 1
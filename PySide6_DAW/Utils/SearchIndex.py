@@ -0,0 +1,180 @@
+"""Search index class implementation."""
+
+import re
+from collections import defaultdict
+from itertools import islice
+from typing import DefaultDict, Dict, Hashable, Iterable, List, Set, Tuple
+
+#: Minimum share of the trigrams of a query word an indexed word must contain to match it fuzzily
+_MIN_TRIGRAM_SHARE = 0.5
+
+#: Words of an indexed text or query
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _trigrams(word: str) -> Set[str]:
+    """Returns the trigrams of a word, padded so that the beginning of the word weighs more.
+
+    Args:
+        word: The lower case word.
+    """
+    padded = f"  {word} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Incremental fuzzy search index over short texts, e.g. page titles and keywords
+
+    Every word is indexed by its prefixes and its trigrams. A query matches an entry if each query word is a prefix of
+    one of its words or shares enough trigrams with one of them, so typos are tolerated. Only the candidates of the
+    posting lists are scored, so searching hundreds of entries takes well below a millisecond.
+    """
+
+    def __init__(self) -> None:
+        """Constructor"""
+        self._texts: Dict[Hashable, str] = {}
+        self._words: Dict[Hashable, Set[str]] = {}
+        self._positions: Dict[Hashable, int] = {}
+        self._next_position = 0
+        self._word_keys: DefaultDict[str, Set[Hashable]] = defaultdict(set)
+        self._prefixes: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._trigram_words: DefaultDict[str, Set[str]] = defaultdict(set)
+
+    def count(self) -> int:
+        """Returns the number of indexed entries."""
+        return len(self._texts)
+
+    def contains(self, key: Hashable) -> bool:
+        """Returns whether an entry is indexed.
+
+        Args:
+            key: The key of the entry.
+        """
+        return key in self._texts
+
+    def add(self, key: Hashable, text: str, keywords: Iterable[str] = ()) -> None:
+        """Index an entry, an entry with the same key is replaced.
+
+        Args:
+            key: The key of the entry.
+            text: The text of the entry, e.g. the page title, returned by :meth:`text`.
+            keywords: Additional words the entry is found by.
+        """
+        if key in self._texts:
+            self.remove(key)
+        words = set(_WORD_PATTERN.findall(" ".join([text, *keywords]).lower()))
+        self._texts[key] = text
+        self._words[key] = words
+        self._positions[key] = self._next_position
+        self._next_position += 1
+        for word in words:
+            if not self._word_keys[word]:
+                for length in range(1, len(word) + 1):
+                    self._prefixes[word[:length]].add(word)
+                for trigram in _trigrams(word):
+                    self._trigram_words[trigram].add(word)
+            self._word_keys[word].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove an entry from the index.
+
+        Args:
+            key: The key of the entry.
+
+        Raises:
+            KeyError: If the entry is not indexed.
+        """
+        del self._texts[key]
+        del self._positions[key]
+        for word in self._words.pop(key):
+            keys = self._word_keys[word]
+            keys.discard(key)
+            if keys:
+                continue
+            del self._word_keys[word]
+            for length in range(1, len(word) + 1):
+                self._discard(self._prefixes, word[:length], word)
+            for trigram in _trigrams(word):
+                self._discard(self._trigram_words, trigram, word)
+
+    def text(self, key: Hashable) -> str:
+        """Returns the text of an entry.
+
+        Args:
+            key: The key of the entry.
+        """
+        return self._texts[key]
+
+    def search(self, query: str, limit: int = 50) -> List[Hashable]:
+        """Search entries, the best matches first.
+
+        Args:
+            query: The query, an empty query matches all entries in the order they were added.
+            limit: The maximum number of results.
+
+        Returns:
+            The keys of the matching entries.
+        """
+        query_words = _WORD_PATTERN.findall(query.lower())
+        if not query_words:
+            return list(islice(self._texts, limit))
+
+        scores: Dict[Hashable, float] = {}
+        for index, query_word in enumerate(query_words):
+            word_scores = self._matchWord(query_word)
+            keys: Dict[Hashable, float] = {}
+            for word, score in word_scores.items():
+                for key in self._word_keys[word]:
+                    if score > keys.get(key, 0.0):
+                        keys[key] = score
+            if index == 0:
+                scores = keys
+            else:
+                scores = {key: scores[key] + score for key, score in keys.items() if key in scores}
+            if not scores:
+                return []
+
+        # Equal scores are ranked in the order the entries were added
+        ranked: List[Tuple[float, int, Hashable]] = []
+        for key, score in scores.items():
+            ranked.append((-score, self._positions[key], key))
+        ranked.sort(key=lambda entry: entry[:2])
+        return [key for _, _, key in ranked[:limit]]
+
+    def _matchWord(self, query_word: str) -> Dict[str, float]:
+        """Returns the indexed words matching a query word with their score.
+
+        Exact words score highest, followed by words starting with the query word and words sharing enough trigrams.
+
+        Args:
+            query_word: The lower case query word.
+        """
+        scores: Dict[str, float] = {}
+        if len(query_word) >= 3:
+            query_trigrams = _trigrams(query_word)
+            shared: DefaultDict[str, int] = defaultdict(int)
+            for trigram in query_trigrams:
+                for word in self._trigram_words.get(trigram, ()):
+                    shared[word] += 1
+            for word, count in shared.items():
+                share = count / len(query_trigrams)
+                if share >= _MIN_TRIGRAM_SHARE:
+                    scores[word] = share
+        for word in self._prefixes.get(query_word, ()):
+            scores[word] = 3.0 if word == query_word else 2.0
+        return scores
+
+    @staticmethod
+    def _discard(postings: DefaultDict[str, Set[str]], token: str, word: str) -> None:
+        """Remove a word from a posting list and drop the list once it is empty.
+
+        Args:
+            postings: The posting lists by token.
+            token: The token, i.e. a prefix or trigram.
+            word: The word.
+        """
+        words = postings.get(token)
+        if words is not None:
+            words.discard(word)
+            if not words:
+                del postings[token]
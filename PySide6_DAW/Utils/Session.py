@@ -0,0 +1,83 @@
+"""Session class implementation."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+#: Version of the session file format, files with another version are ignored
+SESSION_VERSION = 1
+
+
+class Session(NamedTuple):
+    """Saved session of a desktop application
+
+    A session holds the page keys in side bar order with the name of their button alignment, the key of the current
+    page and the opaque state of each page. It is stored as compact, versioned JSON file, so page states must be JSON
+    serializable.
+    """
+
+    alignments: Dict[str, str]
+    current: Optional[str]
+    states: Dict[str, Any]
+
+    @staticmethod
+    def isSerializable(state: Any) -> bool:
+        """Returns whether a page state can be stored in a session, i.e. whether it is JSON serializable.
+
+        Args:
+            state: The page state.
+        """
+        try:
+            json.dumps(state)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def write(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write the session to a file, atomically replacing an existing file.
+
+        Args:
+            path: The path of the session file.
+
+        Raises:
+            OSError: If the file cannot be written.
+            TypeError: If a page state is not JSON serializable.
+        """
+        data = {
+            "version": SESSION_VERSION,
+            "pages": self.alignments,
+            "current": self.current,
+            "states": self.states,
+        }
+        text = json.dumps(data, separators=(",", ":"))
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+
+    @classmethod
+    def read(cls, path: Union[str, "os.PathLike[str]"]) -> Optional["Session"]:
+        """Read a session from a file.
+
+        Args:
+            path: The path of the session file.
+
+        Returns:
+            The session or ``None`` if the file is missing, malformed or of another version.
+        """
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != SESSION_VERSION:
+            return None
+        alignments, current, states = data.get("pages"), data.get("current"), data.get("states")
+        if not isinstance(alignments, dict) or not isinstance(states, dict):
+            return None
+        if current is not None and not isinstance(current, str):
+            return None
+        return cls(
+            alignments={str(key): str(value) for key, value in alignments.items()}, current=current, states=states
+        )
@@ -0,0 +1,246 @@
+"""Stall watchdog class implementation."""
+
+import collections
+import json
+import sys
+import threading
+import time
+import traceback
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+#: Default time in milliseconds the GUI thread must be blocked to be reported as stall
+DEFAULT_THRESHOLD = 200
+
+#: Default number of incidents kept, older incidents are dropped
+DEFAULT_CAPACITY = 64
+
+#: Number of heartbeats of the GUI thread and polls of the monitor thread per threshold
+_RESOLUTION = 4
+
+
+class _Capture(NamedTuple):
+    """Stack and attribution of an ongoing stall, captured by the monitor thread"""
+
+    beat: float
+    page: str
+    action: str
+    stack: Tuple[str, ...]
+
+
+class StallWatchdog(QObject):
+    """Opt-in detector of event loop stalls, i.e. the GUI thread being blocked longer than a threshold
+
+    A timer on the GUI thread records a heartbeat several times per threshold. A monitor thread checks the heartbeat
+    and, once it is overdue, captures the Python stack of the GUI thread while it is still blocked. As soon as the GUI
+    thread resumes, the stall is recorded as :class:`Incident`, attributed to the active page and the side bar action
+    which triggered it, see :meth:`setPage` and :meth:`setAction`. The latest incidents are kept in a ring buffer.
+
+    The watchdog is disabled by default. While it is disabled, no thread and no timer is running and the widgets only
+    check :attr:`enabled` before reporting the active page and the triggering action.
+
+    Signals:
+        stalled: Emitted with the :class:`Incident` once the GUI thread resumed from a stall.
+    """
+
+    class Incident(NamedTuple):
+        """Stall of the GUI thread
+
+        The duration is measured between two heartbeats and is accurate to a heartbeat interval. The action is only set
+        if it was triggered within the stall, the stack is empty if the GUI thread resumed before it was captured.
+        """
+
+        started: float
+        duration: float
+        page: str
+        action: str
+        stack: Tuple[str, ...]
+
+    stalled = Signal(object)
+
+    _instance: Optional["StallWatchdog"] = None
+
+    #: Whether the process-wide watchdog is enabled, checked by the widgets reporting pages and actions
+    enabled = False
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._threshold = DEFAULT_THRESHOLD / 1000.0
+        self._interval = self._threshold / _RESOLUTION
+        self._incidents: Deque[StallWatchdog.Incident] = collections.deque(maxlen=DEFAULT_CAPACITY)
+        self._page = ""
+        self._action = ("", 0.0)
+        self._beat = time.perf_counter()
+        self._gui_thread = threading.get_ident()
+        self._lock = threading.Lock()
+        self._capture: Optional[_Capture] = None
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._heartbeat)  # type: ignore[attr-defined]
+
+    @classmethod
+    def instance(cls) -> "StallWatchdog":
+        """Returns the process-wide stall watchdog."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def setEnabled(cls, enabled: bool, threshold: int = DEFAULT_THRESHOLD, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Enable or disable the process-wide watchdog, must be called from the GUI thread.
+
+        Args:
+            enabled: Whether to detect stalls.
+            threshold: The time in milliseconds the GUI thread must be blocked to be reported as stall.
+            capacity: The number of incidents kept, older incidents are dropped.
+
+        Raises:
+            ValueError: If the threshold or the capacity is not positive.
+        """
+        if threshold <= 0:
+            raise ValueError("Invalid value for 'threshold'! The threshold must be positive.")
+        if capacity <= 0:
+            raise ValueError("Invalid value for 'capacity'! The capacity must be positive.")
+        watchdog = cls.instance()
+        watchdog.stop()
+        if enabled:
+            watchdog.start(threshold, capacity)
+
+    def threshold(self) -> int:
+        """Returns the time in milliseconds the GUI thread must be blocked to be reported as stall."""
+        return round(self._threshold * 1000.0)
+
+    def setPage(self, page: str) -> None:
+        """Set the active page stalls are attributed to.
+
+        Args:
+            page: The key of the active page.
+        """
+        self._page = page
+
+    def setAction(self, action: str) -> None:
+        """Set the action a stall is attributed to if it starts before the GUI thread returns to the event loop.
+
+        Args:
+            action: The action, e.g. the clicked side bar entry.
+        """
+        self._action = (action, time.perf_counter())
+
+    def incidents(self) -> List["StallWatchdog.Incident"]:
+        """Returns the recorded incidents, the oldest first."""
+        with self._lock:
+            return list(self._incidents)
+
+    def clear(self) -> None:
+        """Discard all recorded incidents."""
+        with self._lock:
+            self._incidents.clear()
+
+    def toJson(self) -> str:
+        """Returns the recorded incidents as JSON document."""
+        incidents = [incident._asdict() for incident in self.incidents()]
+        return json.dumps({"threshold_ms": self.threshold(), "incidents": incidents}, indent=4)
+
+    def dump(self, path: str) -> None:
+        """Write the recorded incidents as JSON document to a file.
+
+        Args:
+            path: The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.toJson())
+
+    def start(self, threshold: int, capacity: int) -> None:
+        """Start the heartbeat timer and the monitor thread, see :meth:`setEnabled`.
+
+        Args:
+            threshold: The time in milliseconds the GUI thread must be blocked to be reported as stall.
+            capacity: The number of incidents kept.
+        """
+        self._threshold = threshold / 1000.0
+        self._interval = self._threshold / _RESOLUTION
+        with self._lock:
+            self._incidents = collections.deque(self._incidents, maxlen=capacity)
+            self._capture = None
+        self._gui_thread = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._timer.start(max(1, round(self._interval * 1000.0)))
+        self._stop = threading.Event()
+        self._monitor = threading.Thread(
+            target=self._monitorLoop, args=(self._stop,), name="StallWatchdog", daemon=True
+        )
+        self._monitor.start()
+        StallWatchdog.enabled = True
+
+    def stop(self) -> None:
+        """Stop the heartbeat timer and the monitor thread, the recorded incidents are kept."""
+        StallWatchdog.enabled = False
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+    def _monitorLoop(self, stop: threading.Event) -> None:
+        """Monitor thread, captures the stack of the GUI thread once per stall while it is blocked.
+
+        Args:
+            stop: Set to stop the monitor thread.
+        """
+        captured = 0.0
+        while not stop.wait(self._interval):
+            beat = self._beat
+            if beat == captured or time.perf_counter() - beat - self._interval < self._threshold:
+                continue
+            captured = beat
+            frame = sys._current_frames().get(self._gui_thread)  # pylint: disable=protected-access; Public in effect.
+            stack = tuple(traceback.format_stack(frame)) if frame is not None else ()
+            del frame
+            capture = _Capture(beat, self._page, self._attributedAction(beat), stack)
+            with self._lock:
+                self._capture = capture
+
+    def _heartbeat(self) -> None:
+        """Heartbeat timer callback
+
+        Record an incident if the GUI thread was blocked since the previous heartbeat.
+        """
+        now = time.perf_counter()
+        beat = self._beat
+        self._beat = now
+        duration = now - beat - self._interval
+        if duration < self._threshold:
+            return
+        with self._lock:
+            capture = self._capture
+            self._capture = None
+        if capture is None or capture.beat != beat:
+            capture = _Capture(beat, self._page, self._attributedAction(beat), ())
+        incident = StallWatchdog.Incident(
+            started=time.time() - duration,
+            duration=duration,
+            page=capture.page,
+            action=capture.action,
+            stack=capture.stack,
+        )
+        with self._lock:
+            self._incidents.append(incident)
+        self.stalled.emit(incident)  # type: ignore[attr-defined]
+
+    def _attributedAction(self, beat: float) -> str:
+        """Returns the action triggered since a heartbeat, or an empty string if there was none.
+
+        Args:
+            beat: The time of the heartbeat.
+        """
+        action, triggered = self._action
+        return action if triggered >= beat else ""
@@ -0,0 +1,198 @@
+"""Theme class implementation."""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QColor
+
+#: Colors by theme section and color name
+ThemeColors = Mapping[str, Mapping[str, Union[QColor, str]]]
+
+#: Default colors of the DAW widgets
+DEFAULT_COLORS: Dict[str, Dict[str, str]] = {
+    "DesktopApplication": {
+        "bg_color": "#282D32",
+    },
+    "LoadingPage": {
+        "hl_color": "#0066FF",
+        "text_color": "#A0A0A0",
+    },
+    "QuickSwitcher": {
+        "bg_color": "#191E23",
+        "hl_color": "#0066FF",
+        "text_color": "#A0A0A0",
+    },
+    "SideBar": {
+        "bg_color": "#191E23",
+    },
+    "SideBarButton": {
+        "bg_color": "#191E23",
+        "on_color": "#282D32",
+        "hl_color": "#0066FF",
+        "icon_off_color": "#808080",
+        "icon_on_color": "#FFFFFF",
+    },
+    "ToolTip": {
+        "bg_color": "#191E23",
+        "hl_color": "#0066FF",
+        "text_color": "#A0A0A0",
+    },
+}
+
+
+class Theme(QObject):
+    """Color theme shared by the DAW widgets
+
+    The colors are grouped in sections, one per widget class, e.g. ``theme.color("SideBarButton", "on_color")``.
+    Changes can be grouped in a :meth:`transaction`, so the widgets are only repainted once per transaction.
+
+    Signals:
+        changed: Emitted once after colors of the theme changed.
+    """
+
+    changed = Signal()
+
+    _instance: Optional["Theme"] = None
+
+    def __init__(self, colors: Optional[ThemeColors] = None, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            colors: Colors overriding the default colors.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._colors: Dict[str, Dict[str, QColor]] = {
+            section: {name: QColor(color) for name, color in section_colors.items()}
+            for section, section_colors in DEFAULT_COLORS.items()
+        }
+        self._transaction_depth = 0
+        self._changed = False
+        if colors:
+            self.apply(colors)
+
+    @classmethod
+    def instance(cls) -> "Theme":
+        """Returns the process-wide theme used by all DAW widgets by default."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def color(self, section: str, name: str) -> QColor:
+        """Returns a color of the theme.
+
+        Args:
+            section: The theme section, i.e. the widget class name.
+            name: The name of the color, i.e. the widget property name.
+        """
+        return self._colors[section][name]
+
+    def colors(self) -> Dict[str, Dict[str, QColor]]:
+        """Returns a copy of all colors by theme section and color name."""
+        return {section: dict(section_colors) for section, section_colors in self._colors.items()}
+
+    def setColor(self, section: str, name: str, color: Union[QColor, str]) -> None:
+        """Set a color of the theme.
+
+        Args:
+            section: The theme section, i.e. the widget class name.
+            name: The name of the color, i.e. the widget property name.
+            color: The new color.
+        """
+        color = QColor(color)
+        section_colors = self._colors.setdefault(section, {})
+        if section_colors.get(name) == color:
+            return
+        section_colors[name] = color
+        self._changed = True
+        if self._transaction_depth == 0:
+            self._emitChanged()
+
+    def apply(self, colors: ThemeColors) -> None:
+        """Set several colors of the theme in a single transaction.
+
+        Args:
+            colors: The colors by theme section and color name.
+        """
+        with self.transaction():
+            for section, section_colors in colors.items():
+                for name, color in section_colors.items():
+                    self.setColor(section, name, color)
+
+    @contextmanager
+    def transaction(self) -> Iterator["Theme"]:
+        """Context manager grouping color changes, ``changed`` is emitted once when the outermost transaction ends.
+
+        Yields:
+            The theme.
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._emitChanged()
+
+    def _emitChanged(self) -> None:
+        """Emit ``changed`` if colors changed since the last emission."""
+        if self._changed:
+            self._changed = False
+            self.changed.emit()  # type: ignore[attr-defined]
+
+
+class Themed:  # pylint: disable=attribute-defined-outside-init; Attributes are defined by _initTheme().
+    """Mixin for DAW widgets taking their colors from a theme
+
+    Colors set directly on a widget, e.g. via its properties or ``qproperty-*`` style sheet values, override the colors
+    of the theme for this widget only.
+    """
+
+    #: Theme section holding the colors of the widget class
+    theme_section = ""
+
+    def _initTheme(self) -> None:
+        """Reference the shared theme, must be called by the widget constructor."""
+        self._theme = Theme.instance()
+        self._color_overrides: Dict[str, QColor] = {}
+        self._theme.changed.connect(self._themeChanged)  # type: ignore[attr-defined]
+
+    def theme(self) -> Theme:
+        """Returns the theme of the widget."""
+        return self._theme
+
+    def setTheme(self, theme: Theme) -> None:
+        """Set the theme of the widget.
+
+        Args:
+            theme: The new theme.
+        """
+        self._theme.changed.disconnect(self._themeChanged)  # type: ignore[attr-defined]
+        self._theme = theme
+        self._theme.changed.connect(self._themeChanged)  # type: ignore[attr-defined]
+        self._themeChanged()
+
+    def _themeColor(self, name: str) -> QColor:
+        """Returns a color of the widget.
+
+        Args:
+            name: The name of the color.
+        """
+        color = self._color_overrides.get(name)
+        return color if color is not None else self._theme.color(self.theme_section, name)
+
+    def _setThemeColor(self, name: str, color: QColor) -> None:
+        """Override a color of the theme for this widget.
+
+        Args:
+            name: The name of the color.
+            color: The new color.
+        """
+        self._color_overrides[name] = QColor(color)
+        self._themeChanged()
+
+    def _themeChanged(self) -> None:
+        """Theme changed callback, schedules a repaint of the widget."""
+        self.update()  # type: ignore[attr-defined]  # pylint: disable=no-member; Themed is mixed into widgets.
@@ -0,0 +1,261 @@
+"""Theme file class implementation."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from PySide6_DAW.Utils.Theme import DEFAULT_COLORS, Theme
+
+#: Version of the compiled property map format, cache entries with another version are compiled again
+_CACHE_VERSION = 2
+
+#: Comments, rules and declarations of a theme file
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_SELECTOR_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)?(?:#([A-Za-z_][A-Za-z0-9_]*))?$")
+_DECLARATION_PATTERN = re.compile(r"^qproperty-([A-Za-z_][A-Za-z0-9_]*)\s*:\s*(.+)$")
+
+#: Compiled property map: property values by selector and property name
+PropertyMap = Dict[str, Dict[str, str]]
+
+
+class ThemeFileStats(NamedTuple):
+    """Timings of a theme file"""
+
+    from_cache: bool
+    load_time: float
+    apply_time: float
+
+
+class ThemeFile:
+    """DAW theme file compiled into a property map
+
+    DAW themes, like ``example/style.qss``, only set ``qproperty-*`` values of the DAW widgets. Instead of running Qt's
+    style sheet parser and re-polishing every widget of the application via ``QApplication.setStyleSheet``, a theme
+    file is parsed once into a property map, which is cached on disk and compiled again once the file is modified.
+
+    Rules selecting a widget class, e.g. ``SideBarButton``, are applied to the shared :class:`Theme` in a single
+    transaction. Rules selecting an object name, e.g. ``SideBarButton#mixer_button``, are applied via the properties of
+    the matching widgets. Only the theme colors of the DAW widgets are supported, see :data:`DEFAULT_COLORS`. Other
+    selectors and declarations, e.g. ``qproperty-fade_duration``, still need a style sheet.
+    """
+
+    def __init__(self, path: Path, properties: PropertyMap, from_cache: bool = False, load_time: float = 0.0) -> None:
+        """Constructor
+
+        Args:
+            path: The path of the theme file.
+            properties: The compiled property map.
+            from_cache: Whether the property map was loaded from the on-disk cache.
+            load_time: The duration of loading the theme file in seconds.
+        """
+        self._path = path
+        self._properties = properties
+        self._from_cache = from_cache
+        self._load_time = load_time
+        self._apply_time = 0.0
+
+    @classmethod
+    def load(
+        cls, path: Union[str, "os.PathLike[str]"], cache_dir: Optional[Path] = None, use_cache: bool = True
+    ) -> "ThemeFile":
+        """Load a theme file from the on-disk cache or compile it.
+
+        Args:
+            path: The path of the theme file.
+            cache_dir: The directory of the on-disk cache, a directory in the user cache location by default.
+            use_cache: Whether to use the on-disk cache.
+
+        Returns:
+            The theme file.
+
+        Raises:
+            OSError: If the theme file cannot be read.
+            ValueError: If the theme file contains unsupported selectors or declarations.
+        """
+        start = time.perf_counter()
+        path = Path(path).resolve()
+        status = path.stat()
+        cache_path = cls._cachePath(path, cache_dir) if use_cache else None
+
+        properties = cls._readCache(cache_path, status) if cache_path is not None else None
+        from_cache = properties is not None
+        if properties is None:
+            properties = cls.compile(path.read_text(encoding="utf-8"))
+            if cache_path is not None:
+                cls._writeCache(cache_path, status, properties)
+        return cls(path, properties, from_cache, time.perf_counter() - start)
+
+    @staticmethod
+    def compile(text: str) -> PropertyMap:
+        """Compile the text of a theme file into a property map.
+
+        Args:
+            text: The text of the theme file.
+
+        Returns:
+            The property values by selector and property name.
+
+        Raises:
+            ValueError: If the text contains unsupported selectors or declarations, or unknown widget classes or colors.
+        """
+        text = _COMMENT_PATTERN.sub("", text)
+        properties: PropertyMap = {}
+        end = 0
+        for match in _RULE_PATTERN.finditer(text):
+            if text[end : match.start()].strip():
+                raise ValueError(f"Invalid theme file! Unexpected text '{text[end:match.start()].strip()}'.")
+            end = match.end()
+            declarations: Dict[str, str] = {}
+            for declaration in filter(None, (part.strip() for part in match.group(2).split(";"))):
+                declaration_match = _DECLARATION_PATTERN.match(declaration)
+                if declaration_match is None:
+                    raise ValueError(
+                        f"Invalid theme file! Only 'qproperty-*' declarations are supported: '{declaration}'."
+                    )
+                declarations[declaration_match.group(1)] = declaration_match.group(2).strip()
+            for selector in (part.strip() for part in match.group(1).split(",")):
+                selector_match = _SELECTOR_PATTERN.match(selector) if selector else None
+                if selector_match is None:
+                    raise ValueError(f"Invalid theme file! Unsupported selector '{selector}'.")
+                ThemeFile._checkDeclarations(selector, selector_match.group(1), declarations)
+                properties.setdefault(selector, {}).update(declarations)
+        if text[end:].strip():
+            raise ValueError(f"Invalid theme file! Unexpected text '{text[end:].strip()}'.")
+        return properties
+
+    def path(self) -> Path:
+        """Returns the path of the theme file."""
+        return self._path
+
+    def properties(self) -> PropertyMap:
+        """Returns a copy of the compiled property map."""
+        return {selector: dict(values) for selector, values in self._properties.items()}
+
+    def stats(self) -> ThemeFileStats:
+        """Returns the load and apply timings of the theme file."""
+        return ThemeFileStats(from_cache=self._from_cache, load_time=self._load_time, apply_time=self._apply_time)
+
+    def apply(self, theme: Optional[Theme] = None) -> None:
+        """Apply the theme file without re-polishing any widget.
+
+        Args:
+            theme: The theme receiving the widget class rules, the shared theme by default.
+        """
+        start = time.perf_counter()
+        theme = theme if theme is not None else Theme.instance()
+        named = {selector: values for selector, values in self._properties.items() if "#" in selector}
+        with theme.transaction():
+            theme.apply({selector: values for selector, values in self._properties.items() if "#" not in selector})
+            if named:
+                for widget in QApplication.allWidgets():
+                    if not widget.objectName():
+                        continue
+                    for selector in self._matchingSelectors(type(widget).__name__, widget.objectName(), named):
+                        for name, value in named[selector].items():
+                            widget.setProperty(name, QColor(value))
+        self._apply_time = time.perf_counter() - start
+
+    @staticmethod
+    def _checkDeclarations(selector: str, class_name: Optional[str], declarations: Dict[str, str]) -> None:
+        """Check that a rule selects a DAW widget class and only sets its theme colors to valid colors.
+
+        Args:
+            selector: The selector of the rule.
+            class_name: The widget class of the selector or ``None`` if it only selects an object name.
+            declarations: The property values of the rule by property name.
+
+        Raises:
+            ValueError: If the widget class or a color is unknown, or a value is not a color.
+        """
+        if class_name is None:
+            names = {name for section_colors in DEFAULT_COLORS.values() for name in section_colors}
+        elif class_name in DEFAULT_COLORS:
+            names = set(DEFAULT_COLORS[class_name])
+        else:
+            raise ValueError(f"Invalid theme file! Unknown widget class '{class_name}' in selector '{selector}'.")
+        for name, value in declarations.items():
+            if name not in names:
+                raise ValueError(
+                    f"Invalid theme file! Unknown property '{name}' for '{selector}', only theme colors are supported."
+                )
+            if not QColor(value).isValid():
+                raise ValueError(f"Invalid theme file! '{value}' is not a color.")
+
+    @staticmethod
+    def _matchingSelectors(class_name: str, object_name: str, named: PropertyMap) -> List[str]:
+        """Returns the object name selectors matching a widget.
+
+        Args:
+            class_name: The class name of the widget.
+            object_name: The object name of the widget.
+            named: The object name rules by selector.
+        """
+        return [selector for selector in (f"#{object_name}", f"{class_name}#{object_name}") if selector in named]
+
+    @staticmethod
+    def _cachePath(path: Path, cache_dir: Optional[Path]) -> Path:
+        """Returns the path of the compiled property map of a theme file in the on-disk cache.
+
+        Args:
+            path: The resolved path of the theme file.
+            cache_dir: The directory of the on-disk cache or ``None`` for the default directory.
+        """
+        if cache_dir is None:
+            location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+            cache_dir = Path(location or tempfile.gettempdir()).joinpath("PySide6_DAW", "themes")
+        return cache_dir.joinpath(f"{hashlib.sha256(str(path).encode('utf-8')).hexdigest()}.json")
+
+    @staticmethod
+    def _readCache(cache_path: Path, status: os.stat_result) -> Optional[PropertyMap]:
+        """Returns the cached property map if it was compiled from the current version of the theme file.
+
+        Args:
+            cache_path: The path of the cache entry.
+            status: The status of the theme file.
+        """
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _CACHE_VERSION
+            or data.get("mtime_ns") != status.st_mtime_ns
+            or data.get("size") != status.st_size
+        ):
+            return None
+        properties = data.get("properties")
+        return properties if isinstance(properties, dict) else None
+
+    @staticmethod
+    def _writeCache(cache_path: Path, status: os.stat_result, properties: PropertyMap) -> None:
+        """Write a compiled property map to the on-disk cache, failures only cost a compilation next time.
+
+        Args:
+            cache_path: The path of the cache entry.
+            status: The status of the theme file.
+            properties: The compiled property map.
+        """
+        data = {
+            "version": _CACHE_VERSION,
+            "mtime_ns": status.st_mtime_ns,
+            "size": status.st_size,
+            "properties": properties,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
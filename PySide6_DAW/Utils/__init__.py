@@ -0,0 +1,41 @@
+"""Utils module
+
+Imports classes from their modules to shorten the namespace. The modules are imported on first access of a class, so
+importing the package itself does not import Qt.
+"""
+
+from typing import TYPE_CHECKING
+
+from PySide6_DAW.Utils.LazyImport import lazyImport
+
+if TYPE_CHECKING:
+    from PySide6_DAW.Utils.AnimationClock import AnimationClock
+    from PySide6_DAW.Utils.IconRasterizer import IconRasterizer, IconRasterizerStats, IconSource
+    from PySide6_DAW.Utils.Instrumentation import Instrumentation, instrumented
+    from PySide6_DAW.Utils.PixmapCache import PixmapCache, PixmapCacheStats
+    from PySide6_DAW.Utils.SearchIndex import SearchIndex
+    from PySide6_DAW.Utils.Session import Session
+    from PySide6_DAW.Utils.StallWatchdog import StallWatchdog
+    from PySide6_DAW.Utils.Theme import Theme, Themed
+    from PySide6_DAW.Utils.ThemeFile import ThemeFile, ThemeFileStats
+
+lazyImport(
+    __name__,
+    {
+        "AnimationClock": "PySide6_DAW.Utils.AnimationClock",
+        "IconRasterizer": "PySide6_DAW.Utils.IconRasterizer",
+        "IconRasterizerStats": "PySide6_DAW.Utils.IconRasterizer",
+        "IconSource": "PySide6_DAW.Utils.IconRasterizer",
+        "Instrumentation": "PySide6_DAW.Utils.Instrumentation",
+        "instrumented": "PySide6_DAW.Utils.Instrumentation",
+        "PixmapCache": "PySide6_DAW.Utils.PixmapCache",
+        "PixmapCacheStats": "PySide6_DAW.Utils.PixmapCache",
+        "SearchIndex": "PySide6_DAW.Utils.SearchIndex",
+        "Session": "PySide6_DAW.Utils.Session",
+        "StallWatchdog": "PySide6_DAW.Utils.StallWatchdog",
+        "Theme": "PySide6_DAW.Utils.Theme",
+        "Themed": "PySide6_DAW.Utils.Theme",
+        "ThemeFile": "PySide6_DAW.Utils.ThemeFile",
+        "ThemeFileStats": "PySide6_DAW.Utils.ThemeFile",
+    },
+)
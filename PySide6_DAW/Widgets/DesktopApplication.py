@@ -1,25 +1,218 @@
 """Application widget class implementation."""
 
-from typing import Optional
+import os
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
-from PySide6.QtCore import Property, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Property, QEvent, QObject, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QColor, QKeySequence, QPainter, QPaintEvent, QPalette, QPixmap, QShortcut, QShowEvent
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QStackedWidget, QWidget
 
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.Session import Session
+from PySide6_DAW.Utils.StallWatchdog import StallWatchdog
+from PySide6_DAW.Utils.Theme import Themed
+from PySide6_DAW.Widgets.LoadingPage import LoadingPage
+from PySide6_DAW.Widgets.PageEntry import (
+    PageFactory,
+    _Page,
+    _pageFootprint,
+    _pageState,
+    _pauseObjects,
+    _restorePageState,
+    _resumeObjects,
+)
+from PySide6_DAW.Widgets.PageLoader import PageLoad, PageLoader
+from PySide6_DAW.Widgets.PagePrefetcher import PagePrefetcher
+from PySide6_DAW.Widgets.QuickSwitcher import QuickSwitcher
 from PySide6_DAW.Widgets.SideBar import SideBar
 from PySide6_DAW.Widgets.SideBarButton import SideBarButton
 
-#: Template for background frame stylesheet
-_BG_FRAME_STYLESHEET = """\
-QFrame#desktop_application_bg_frame {{
-    background-color: {bg_color};
-}}
-"""
+#: Page added in bulk: (side bar button, button alignment, page, page factory or page loader)
+PageSpec = Tuple[SideBarButton, SideBarButton.Alignment, Union[QWidget, PageFactory, PageLoader]]
+
+#: Default byte budget of the page snapshots (64 MiB)
+_DEFAULT_SNAPSHOT_BYTES = 64 * 1024 * 1024
+
+#: Key sequence opening the quick switcher
+_QUICK_SWITCHER_SHORTCUT = "Ctrl+K"
+
+
+def _pixmapBytes(pixmap: Optional[QPixmap]) -> int:
+    """Returns the number of bytes occupied by a pixmap.
+
+    Args:
+        pixmap: The pixmap or ``None``.
+    """
+    if pixmap is None:
+        return 0
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class _SnapshotView(QWidget):
+    """Widget showing the snapshot of a page until the page itself is shown
+
+    Signals:
+        painted: Emitted after the snapshot has been painted.
+    """
+
+    painted = Signal()
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent widget.
+        """
+        super().__init__(parent)
+
+        self._snapshot = QPixmap()
+
+    def setSnapshot(self, snapshot: QPixmap) -> None:
+        """Set the snapshot to show.
+
+        Args:
+            snapshot: The snapshot, it is scaled to the size of the widget.
+        """
+        self._snapshot = snapshot
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint event
+
+        Args:
+            event: The event.
+        """
+        super().paintEvent(event)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(self.rect(), self._snapshot)
+        painter.end()
+        self.painted.emit()  # type: ignore[attr-defined]
+
+
+class _PageSnapshots(QObject):
+    """Bounded snapshots of the pages of a desktop application, taken one page per event loop iteration"""
+
+    def __init__(self, pages: Dict[int, _Page], parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            pages: The pages of the desktop application by side bar index.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self.enabled = False
+        self.scale = 1.0
+        self.max_bytes = _DEFAULT_SNAPSHOT_BYTES
+        self._pages = pages
+        self._bytes = 0
+        self._queue: List[_Page] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._timerCallback)  # type: ignore[attr-defined]
+
+    def configure(self, enabled: bool, max_bytes: int, scale: float) -> None:
+        """Configure the snapshots, existing snapshots are dropped if they are disabled or the scale changes.
+
+        Args:
+            enabled: Whether page snapshots are enabled.
+            max_bytes: Maximum number of bytes occupied by all snapshots.
+            scale: Scale of the snapshots relative to the page size.
+        """
+        if not enabled or scale != self.scale:
+            for entry in self._pages.values():
+                entry.snapshot = None
+            self._bytes = 0
+            self._queue.clear()
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.scale = scale
+        self._evict()
+
+    def queue(self, entry: _Page) -> None:
+        """Queue a page to take a snapshot of in idle time.
+
+        Args:
+            entry: The page.
+        """
+        if entry not in self._queue:
+            self._queue.append(entry)
+            self._timer.start(0)
+
+    def _timerCallback(self) -> None:
+        """Timer callback
+
+        Take the snapshot of a single queued page per event loop iteration.
+        """
+        if not self._queue:
+            return
+        entry = self._queue.pop(0)
+        if self.enabled and entry.created:
+            snapshot = entry.widget.grab()
+            if self.scale < 1.0:
+                snapshot = snapshot.scaled(
+                    snapshot.size() * self.scale,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            self._bytes += _pixmapBytes(snapshot) - _pixmapBytes(entry.snapshot)
+            entry.snapshot = snapshot
+            entry.snapshot_size = entry.widget.size()
+            self._evict()
+        if self._queue:
+            self._timer.start(0)
+
+    def _evict(self) -> None:
+        """Drop the snapshots of the least recently shown pages until the byte budget is met."""
+        if self._bytes <= self.max_bytes:
+            return
+        for entry in sorted(self._pages.values(), key=lambda entry: entry.last_shown):
+            if self._bytes <= self.max_bytes:
+                break
+            if entry.snapshot is not None:
+                self._bytes -= _pixmapBytes(entry.snapshot)
+                entry.snapshot = None
 
 
 # pylint: disable=duplicate-code; Properties appear in several widgets.
-class DesktopApplication(QWidget):
-    """Desktop application widget"""
+class DesktopApplication(Themed, QWidget):  # pylint: disable=too-many-instance-attributes; Page and session state.
+    """Desktop application widget
+
+    Pages can implement ``onActivate()`` and ``onDeactivate()``, which are called when the page is shown respectively
+    hidden, e.g. to stop live plots or polling while the page is hidden. Timers and signal sources of a page can also be
+    paused automatically while it is hidden, see :meth:`pauseWhenHidden`. Pages can be built before they are shown,
+    when the pointer rests on their side bar entry or when they are predicted to be shown next, see :meth:`prefetcher`.
+
+    Pressing Ctrl+K opens a quick switcher, which finds pages by the tool tip of their button and their keywords while
+    typing, see :meth:`showQuickSwitcher`.
+
+    Signals:
+        pageCreated: Emitted with the page after a page added via a factory or loader has been created.
+        pageLoadFailed: Emitted with the side bar index and an error message if a page loader failed.
+        pageActivated: Emitted with the page after it has been shown.
+        pageDeactivated: Emitted with the page after it has been hidden.
+    """
+
+    class PageInfo(NamedTuple):
+        """Residency information of a page"""
+
+        side_bar_index: int
+        button: Optional[SideBarButton]
+        resident: bool
+        footprint: int
+        snapshot_bytes: int
+
+    pageCreated = Signal(QWidget)
+    pageLoadFailed = Signal(int, str)
+    pageActivated = Signal(QWidget)
+    pageDeactivated = Signal(QWidget)
+
+    theme_section = "DesktopApplication"
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Constructor
@@ -30,41 +223,729 @@ class DesktopApplication(QWidget):
         super().__init__(parent)
 
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        # The background is filled by Qt from the palette, see _themeChanged()
+        self.setAutoFillBackground(True)
 
         self._layout: QHBoxLayout
         self._side_bar: SideBar
         self._stacked_widget: QStackedWidget
+        self._snapshot_view: _SnapshotView
+        self._quick_switcher: QuickSwitcher
         self._setupUi()
 
-        self._bg_color = QColor("#282D32")
-        self._setStyle()
+        self._pages: Dict[int, _Page] = {}
+        self._page_keys: Set[str] = set()
+        self._key_numbers: Dict[str, int] = {}
+        self._loading: List[_Page] = []
+        self._thread_pool = QThreadPool.globalInstance()
+        self._show_count = 0
+        self._max_resident_pages: Optional[int] = None
+        self._max_resident_bytes: Optional[int] = None
+        self._session: Optional[Session] = None
+        self._batch_depth = 0
+
+        # Page snapshots, see setSnapshotsEnabled()
+        self._current: Optional[_Page] = None
+        self._current_index = -1
+        self._pending: Optional[_Page] = None
+        self._snapshots = _PageSnapshots(self._pages, self)
+        self._swap_timer = QTimer(self)
+        self._swap_timer.setSingleShot(True)
+        self._swap_timer.timeout.connect(self._swapTimerCallback)  # type: ignore[attr-defined]
+        self._snapshot_view.painted.connect(self._swap_timer.start)  # type: ignore[attr-defined]
 
-    def _setStyle(self) -> None:
-        """Apply stylesheet."""
-        self._bg_frame.setStyleSheet(_BG_FRAME_STYLESHEET.format(bg_color=self._bg_color.name()))
+        # Page prefetching, see prefetcher()
+        self._prefetcher = PagePrefetcher(self._prefetchPage, self._abortPrefetch, self)
+        self._side_bar.hoveredChanged.connect(self._sideBarHoverCallback)  # type: ignore[attr-defined]
+
+        # Take colors from the shared theme
+        self._initTheme()
+        self._themeChanged()
 
     @Property(QColor)
     def bg_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the background color for the desktop application."""
-        return self._bg_color
+        return self._themeColor("bg_color")
 
     @bg_color.setter  # type: ignore[no-redef]
     def bg_color(self, color: QColor) -> None:
         """Sets the background color for the desktop application."""
-        self._bg_color = color
-        self._setStyle()
+        self._setThemeColor("bg_color", color)
+
+    def _themeChanged(self) -> None:
+        """Theme changed callback, applies the background color to the palette."""
+        palette = QPalette(self.palette())
+        palette.setColor(QPalette.ColorRole.Window, self._themeColor("bg_color"))
+        self.setPalette(palette)
+        super()._themeChanged()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Show event
+
+        Show the selected page if none is shown yet, e.g. because the current page of a restored session was not added.
+
+        Args:
+            event: The event.
+        """
+        super().showEvent(event)
+        if self._current is None:
+            self._sideBarCallback(self._side_bar.currentIndex())
 
-    def addPage(self, button: SideBarButton, button_alignment: SideBarButton.Alignment, page: QWidget) -> None:
+    def addPage(  # pylint: disable=too-many-arguments; Key and keywords are optional.
+        self,
+        button: SideBarButton,
+        button_alignment: SideBarButton.Alignment,
+        page: Union[QWidget, PageFactory, PageLoader],
+        key: Optional[str] = None,
+        keywords: Iterable[str] = (),
+    ) -> None:
         """Add new side bar button and page.
 
+        The page can either be passed as widget, as zero-argument factory or as page loader. A factory is only called
+        the first time the page is shown, until then a lightweight placeholder takes its place in the stacked widget.
+        A page loader is started the first time the page is shown as well. It prepares the page on the thread pool and
+        mounts it in time slices, meanwhile a loading page is shown. Switching to another page cancels the load.
+
         Args:
-            button: The side bar button for the new page.
+            button: The side bar button for the new page. If the side bar is backed by a model, only its icon and tool
+                tip are taken over into a new model entry, see :meth:`SideBar.addButton`.
             button_alignment: The alignment of the side bar button within the side bar.
-            page: The new page.
+            page: The new page, a factory creating the new page or a loader loading the new page.
+            key: The unique key identifying the page in saved sessions. By default the tool tip of the button, numbered
+                if several buttons share it (``Settings``, ``Settings#2``, ...), or ``#1``, ``#2``, ... for buttons
+                without tool tip.
+            keywords: Additional words the page is found by in the quick switcher.
+
+        Raises:
+            TypeError: If the page is neither a widget, a page loader nor callable.
+            ValueError: If a page with the same explicit key was already added.
+        """
+        if key is None:
+            key = self._defaultKey(button)
+        elif key in self._page_keys:
+            raise ValueError(f"Invalid value for 'key'! A page with the key '{key}' was already added.")
+
+        entry = self._createEntry(page)
+        entry.key = key
+        entry.alignment = button_alignment
+        session = self._session
+        if session is not None:
+            alignment = session.alignments.pop(entry.key, "")
+            if alignment in SideBarButton.Alignment.__members__:
+                entry.alignment = SideBarButton.Alignment[alignment]
+            if entry.key in session.states:
+                _restorePageState(entry, session.states.pop(entry.key))
+
+        index = self._side_bar.addButton(button, entry.alignment)
+        self._pages[index] = entry
+        self._page_keys.add(entry.key)
+        self._stacked_widget.addWidget(entry.widget)
+        self._quick_switcher.addEntry(index, button.toolTipText() or entry.key, keywords)
+
+        if session is not None and session.current is not None and not self.isVisible():
+            # Only the current page of the restored session is built, see restoreSession()
+            if entry.key == session.current:
+                self._session = session._replace(current=None)
+                if self._side_bar.currentIndex() == index:
+                    self._showPage(index)
+                else:
+                    self._side_bar.setCurrentIndex(index)
+        elif self._side_bar.currentIndex() == index and self._batch_depth == 0:
+            # The side bar selects its first button right away
+            self._showPage(index)
+        self._endSessionRestore()
+
+    def _defaultKey(self, button: SideBarButton) -> str:
+        """Returns a unique key for a page added without key, see :meth:`addPage`.
+
+        Args:
+            button: The side bar button of the page.
+        """
+        base = button.toolTipText() or ""
+        number = self._key_numbers.get(base, 1)
+        key = base if base and number == 1 else f"{base}#{number}"
+        while key in self._page_keys:
+            number += 1
+            key = f"{base}#{number}"
+        self._key_numbers[base] = number
+        return key
+
+    def _createEntry(self, page: Union[QWidget, PageFactory, PageLoader]) -> _Page:
+        """Create the entry of a new page, with a placeholder if the page is created or loaded on demand.
+
+        Args:
+            page: The page, a factory creating the page or a loader loading the page.
+
+        Raises:
+            TypeError: If the page is neither a widget, a page loader nor callable.
+        """
+        if isinstance(page, QWidget):
+            return _Page(page)
+        if isinstance(page, PageLoader):
+            return _Page(LoadingPage(parent=self._stacked_widget), loader=page)
+        if callable(page):
+            return _Page(QWidget(self._stacked_widget), page)
+        raise TypeError(
+            "Invalid value for 'page'! Supported values are 'QWidget', 'PageLoader' and zero-argument callables."
+        )
+
+    def addPages(self, pages: Iterable[PageSpec]) -> None:
+        """Add several side bar buttons and pages in a single batch, see :meth:`batch`.
+
+        Args:
+            pages: The side bar button, its alignment and the page, page factory or page loader of each page.
+
+        Raises:
+            TypeError: If a page is neither a widget, a page loader nor callable.
+        """
+        with self.batch():
+            for button, button_alignment, page in pages:
+                self.addPage(button, button_alignment, page)
+
+    @contextmanager
+    def batch(self) -> Iterator["DesktopApplication"]:
+        """Context manager suspending repaints, layout and page creation while many pages are added.
+
+        The side bar is laid out and the selected page is shown once when the outermost batch ends, instead of after
+        every added page.
+
+        Yields:
+            The desktop application.
+        """
+        self._batch_depth += 1
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            with self._side_bar.batch():
+                yield self
+        finally:
+            self._batch_depth -= 1
+            self.setUpdatesEnabled(updates_enabled)
+            session_pending = self._session is not None and self._session.current is not None
+            if self._batch_depth == 0 and self._current is None and (self.isVisible() or not session_pending):
+                self._sideBarCallback(self._side_bar.currentIndex())
+
+    def sideBar(self) -> SideBar:
+        """Returns the side bar of the desktop application."""
+        return self._side_bar
+
+    def prefetcher(self) -> PagePrefetcher:
+        """Returns the prefetch policy of the desktop application.
+
+        Prefetching is disabled by default. Once enabled, pages added via a factory or loader are built when the pointer
+        rests on their side bar entry, so the build cost is not paid on click, and the page which most often followed
+        the current page is built in idle time after a page switch::
+
+            desktop_app.prefetcher().setEnabled(True, dwell=150)
+            ...
+            print(desktop_app.prefetcher().stats())
+        """
+        return self._prefetcher
+
+    def quickSwitcher(self) -> QuickSwitcher:
+        """Returns the quick switcher of the desktop application."""
+        return self._quick_switcher
+
+    def showQuickSwitcher(self) -> None:
+        """Show the quick switcher, choosing one of its results switches to the page.
+
+        The pages are indexed by the tool tip of their button and the keywords passed to :meth:`addPage` when they are
+        added, so pages which are not created yet are found as well.
+        """
+        self._quick_switcher.popup()
+
+    def _sideBarCallback(self, index: int) -> None:
+        """Side bar selection callback
+
+        Show the page belonging to the selected side bar entry.
+
+        Args:
+            index: The index of the selected side bar entry.
+        """
+        if index in self._pages:
+            self._showPage(index)
+
+    def _sideBarHoverCallback(self, index: int) -> None:
+        """Side bar hover callback
+
+        Start the dwell time of the hovered page or abort the prefetch of the previously hovered page.
+
+        Args:
+            index: The index of the hovered side bar entry or -1 if the pointer left it.
+        """
+        entry = self._pages.get(index)
+        self._prefetcher.hover(index if entry is not None and entry is not self._current else -1)
+
+    def threadPool(self) -> QThreadPool:
+        """Returns the thread pool preparing pages added via a page loader."""
+        return self._thread_pool
+
+    def setThreadPool(self, thread_pool: QThreadPool) -> None:
+        """Set the thread pool preparing pages added via a page loader, the global thread pool is used by default.
+
+        Args:
+            thread_pool: The thread pool.
+        """
+        self._thread_pool = thread_pool
+
+    def setPageBudget(self, max_pages: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Set the budget for resident pages.
+
+        If the budget is exceeded, the least recently shown pages are hibernated: they are destroyed and recreated
+        from their factory the next time they are shown. Only pages added via a factory can be hibernated. Pages can
+        keep their state across hibernation by implementing ``savePageState()`` and ``restorePageState(state)``. The
+        footprint of a page is estimated once each time it is mounted.
+
+        Args:
+            max_pages: Maximum number of resident pages or ``None`` for no limit.
+            max_bytes: Maximum estimated memory footprint of all resident pages or ``None`` for no limit.
+
+        Raises:
+            ValueError: If a limit is less than one.
+        """
+        if (max_pages is not None and max_pages < 1) or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("Invalid page budget! Limits must be 'None' or greater than zero.")
+        self._max_resident_pages = max_pages
+        self._max_resident_bytes = max_bytes
+        self._enforcePageBudget()
+
+    def pageInfo(self) -> List["DesktopApplication.PageInfo"]:
+        """Returns the residency information of all pages in the order they were added."""
+        return [
+            DesktopApplication.PageInfo(
+                side_bar_index=index,
+                button=self._side_bar.button(index),
+                resident=entry.created,
+                footprint=_pageFootprint(entry) if entry.created else 0,
+                snapshot_bytes=_pixmapBytes(entry.snapshot),
+            )
+            for index, entry in self._pages.items()
+        ]
+
+    def setSnapshotsEnabled(self, enabled: bool, max_bytes: int = _DEFAULT_SNAPSHOT_BYTES, scale: float = 1.0) -> None:
+        """Enable or disable page snapshots for instant page switching.
+
+        When a page is left, a snapshot of it is taken in idle time, but only if the page was repainted since its last
+        snapshot. When the page is shown again, its snapshot is shown immediately and the page itself is swapped in
+        once the snapshot is on screen, so its layout, paint and possibly creation do not delay the switch.
+
+        Args:
+            enabled: Whether page snapshots are enabled.
+            max_bytes: Maximum number of bytes occupied by all snapshots, the snapshots of the least recently shown
+                pages are dropped first.
+            scale: Scale of the snapshots relative to the page size, e.g. 0.5 for downscaled snapshots.
+
+        Raises:
+            ValueError: If the byte budget is less than one or the scale is not within (0, 1].
+        """
+        if max_bytes < 1 or not 0.0 < scale <= 1.0:
+            raise ValueError("Invalid snapshot settings! 'max_bytes' must be positive and 'scale' within (0, 1].")
+        self._snapshots.configure(enabled, max_bytes, scale)
+
+    def pauseWhenHidden(self, page: QWidget, *objects: QObject) -> None:
+        """Pause timers and signal sources of a page while the page is hidden.
+
+        Timers are stopped while the page is hidden and restarted when it is shown again, other objects have their
+        signals blocked meanwhile. The registration ends when the page is hibernated, a page recreated from its factory
+        has to register again, e.g. in a slot connected to ``pageCreated``.
+
+        Args:
+            page: The page.
+            objects: The timers and signal sources of the page or none to pause all timers within the page.
+
+        Raises:
+            ValueError: If the page was not added to the desktop application.
+        """
+        entry = next((entry for entry in self._pages.values() if entry.widget is page), None)
+        if entry is None:
+            raise ValueError("Invalid value for 'page'! The page was not added to the desktop application.")
+        new_objects = [obj for obj in (objects or page.findChildren(QTimer)) if obj not in entry.pausable]
+        entry.pausable.extend(new_objects)
+        if not entry.active:
+            _pauseObjects(entry, new_objects)
+
+    def saveSession(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Save the session: the page keys and button alignments in side bar order, the current page and page states.
+
+        The state of a page is taken from its ``savePageState()`` method, pages which are not resident keep the state
+        they were hibernated or restored with. States are stored as JSON, states which are not JSON serializable are
+        not saved.
+
+        Args:
+            path: The path of the session file.
+
+        Raises:
+            OSError: If the session file cannot be written.
+        """
+        states = {}
+        for entry in self._pages.values():
+            state = _pageState(entry)
+            if state is not None and Session.isSerializable(state):
+                states[entry.key] = state
+        Session(
+            alignments={entry.key: entry.alignment.name for entry in self._pages.values()},
+            current=self._current.key if self._current is not None else None,
+            states=states,
+        ).write(path)
+
+    def restoreSession(self, path: Union[str, "os.PathLike[str]"]) -> List[str]:
+        """Restore a session saved via :meth:`saveSession`.
+
+        Should be called before pages are added. Pages added afterwards take their button alignment and state from the
+        session, matched by their key. Instead of the first page, only the page which was current when the session was
+        saved is built and shown, all other pages stay deferred until they are shown. A page restored from a session
+        receives its state via ``restorePageState(state)`` once it is created. The restore ends once every page of the
+        session was added, later pages keep the button alignment they are added with.
+
+        Args:
+            path: The path of the session file.
+
+        Returns:
+            The page keys in saved side bar order, e.g. to add dynamic pages in the same order, or an empty list if the
+            session file is missing, malformed or of another version.
+        """
+        session = Session.read(path)
+        if session is None:
+            return []
+        self._session = session
+        keys = list(session.alignments)
+        for index, entry in self._pages.items():
+            session.alignments.pop(entry.key, None)
+            if entry.key in session.states:
+                _restorePageState(entry, session.states.pop(entry.key))
+            if entry.key == session.current:
+                self._session = session._replace(current=None)
+                self._side_bar.setCurrentIndex(index)
+        self._endSessionRestore()
+        return keys
+
+    def _endSessionRestore(self) -> None:
+        """Drop the restored session once all of its pages were added, see :meth:`restoreSession`."""
+        if self._session is not None and not self._session.alignments:
+            self._session = None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Event filter counting the paint events of the shown page, to only take snapshots of changed pages.
+
+        Args:
+            watched: The watched object.
+            event: The event.
+
+        Returns:
+            Whether the event was filtered out.
+        """
+        if event.type() == QEvent.Type.Paint and self._current is not None and watched is self._current.widget:
+            self._current.paints += 1
+        return super().eventFilter(watched, event)
+
+    @instrumented("pageSwitch")
+    def _showPage(self, index: int) -> None:
+        """Show a page and create it first if necessary.
+
+        Args:
+            index: The side bar index of the page to show.
+        """
+        entry = self._pages[index]
+        for loading_entry in list(self._loading):
+            if loading_entry is not entry:
+                self._cancelLoad(loading_entry)
+        previous = self._current
+        if StallWatchdog.enabled:
+            StallWatchdog.instance().setPage(entry.key)
+        if self._prefetcher.isEnabled():
+            self._prefetcher.shown(index, self._current_index, entry.created or entry.load is not None)
+        self._current = entry
+        self._current_index = index
+        self._pending = None
+        if previous is not None and previous is not entry:
+            self._leavePage(previous)
+
+        if self._showSnapshot(entry):
+            # The page is swapped in once its snapshot is painted, see _swapTimerCallback()
+            self._pending = entry
+        else:
+            self._activatePage(entry)
+        self._show_count += 1
+        entry.last_shown = self._show_count
+        self._enforcePageBudget()
+
+    def _activatePage(self, entry: _Page) -> None:
+        """Show the page itself and create it first if necessary.
+
+        Args:
+            entry: The page to show.
+        """
+        if not entry.created:
+            if entry.loader is None:
+                self._createPage(entry)
+            elif entry.load is None:
+                self._startLoad(entry)
+        self._stacked_widget.setCurrentWidget(entry.widget)
+        if entry.created:
+            self._pageShown(entry)
+
+    def _pageShown(self, entry: _Page) -> None:
+        """Activate a page after it has been shown and watch its paint events for snapshots.
+
+        Args:
+            entry: The shown page.
         """
-        self._side_bar.addButton(button, button_alignment)
-        self._stacked_widget.addWidget(page)
-        button.clicked.connect(lambda: self._stacked_widget.setCurrentWidget(page))  # type: ignore[attr-defined]
+        if self._snapshots.enabled:
+            entry.paints = 0
+            entry.widget.installEventFilter(self)
+        self._setPageActive(entry, True)
+
+    def _leavePage(self, entry: _Page) -> None:
+        """Deactivate a left page and queue a snapshot of it if it was repainted after being shown.
+
+        Args:
+            entry: The left page.
+        """
+        if not entry.created:
+            return
+        self._setPageActive(entry, False)
+        entry.widget.removeEventFilter(self)
+        # The first paint event is caused by showing the page and does not change it
+        changed = entry.paints > (0 if entry.snapshot is None else 1)
+        if self._snapshots.enabled and (changed or entry.snapshot_size != entry.widget.size()):
+            self._snapshots.queue(entry)
+        entry.paints = 0
+
+    def _setPageActive(self, entry: _Page, active: bool) -> None:
+        """Activate or deactivate a page: resume or pause its registered objects and call its lifecycle hooks.
+
+        Args:
+            entry: The page.
+            active: Whether the page is active.
+        """
+        if entry.active == active:
+            return
+        entry.active = active
+        page = entry.widget
+        if active:
+            _resumeObjects(entry)
+            on_activate = getattr(page, "onActivate", None)
+            if callable(on_activate):
+                on_activate()
+            self.pageActivated.emit(page)  # type: ignore[attr-defined]
+        else:
+            on_deactivate = getattr(page, "onDeactivate", None)
+            if callable(on_deactivate):
+                on_deactivate()
+            _pauseObjects(entry, entry.pausable)
+            self.pageDeactivated.emit(page)  # type: ignore[attr-defined]
+
+    def _showSnapshot(self, entry: _Page) -> bool:
+        """Show the snapshot of a page if it has an up-to-date snapshot.
+
+        Args:
+            entry: The page to show.
+
+        Returns:
+            Whether the snapshot is shown.
+        """
+        if not self._snapshots.enabled or entry.snapshot is None or not self._stacked_widget.isVisible():
+            return False
+        if entry.snapshot_size != self._stacked_widget.size() or (entry.loader is not None and not entry.created):
+            # Outdated snapshot or a page loader, which shows its own loading page
+            return False
+        self._snapshot_view.setSnapshot(entry.snapshot)
+        self._stacked_widget.setCurrentWidget(self._snapshot_view)
+        return True
+
+    def _prefetchPage(self, index: int) -> bool:
+        """Build a page or start loading it before it is shown.
+
+        Args:
+            index: The side bar index of the page to prefetch.
+
+        Returns:
+            Whether the page is being prefetched, i.e. it was neither created, loading nor shown.
+        """
+        entry = self._pages.get(index)
+        if entry is None or entry is self._current or entry.created or entry.load is not None:
+            return False
+        if StallWatchdog.enabled:
+            StallWatchdog.instance().setAction(f"prefetch[{entry.key}]")
+        # Kept by the page budget until the next page switch, see _enforcePageBudget()
+        entry.last_shown = self._show_count + 1
+        if entry.loader is not None:
+            self._startLoad(entry)
+        else:
+            self._createPage(entry)
+        self._enforcePageBudget()
+        return True
+
+    def _abortPrefetch(self, index: int) -> bool:
+        """Cancel the load of a prefetched page which is not shown.
+
+        Args:
+            index: The side bar index of the prefetched page.
+
+        Returns:
+            Whether a load was in flight and has been cancelled.
+        """
+        entry = self._pages.get(index)
+        if entry is None or entry is self._current or entry.load is None:
+            return False
+        self._cancelLoad(entry)
+        return True
+
+    def _swapTimerCallback(self) -> None:
+        """Swap timer callback
+
+        Swap in the page once its snapshot has been painted.
+        """
+        entry = self._pending
+        self._pending = None
+        if entry is not None and entry is self._current:
+            self._activatePage(entry)
+            self._enforcePageBudget()
+
+    def _enforcePageBudget(self) -> None:
+        """Hibernate the least recently shown pages until the page budget is met.
+
+        The current page and a page prefetched since the last page switch are kept.
+        """
+        if self._max_resident_pages is None and self._max_resident_bytes is None:
+            return
+
+        resident = [entry for entry in self._pages.values() if entry.created]
+        footprints = {id(entry): _pageFootprint(entry) for entry in resident}
+        num_pages = len(resident)
+        num_bytes = sum(footprints.values())
+
+        candidates = sorted(
+            (
+                entry
+                for entry in resident
+                if (entry.factory is not None or entry.loader is not None)
+                and entry is not self._current
+                and entry.last_shown <= self._show_count
+            ),
+            key=lambda entry: entry.last_shown,
+        )
+        for entry in candidates:
+            if (self._max_resident_pages is None or num_pages <= self._max_resident_pages) and (
+                self._max_resident_bytes is None or num_bytes <= self._max_resident_bytes
+            ):
+                break
+            num_pages -= 1
+            num_bytes -= footprints[id(entry)]
+            self._hibernatePage(entry)
+
+    def _hibernatePage(self, entry: _Page) -> None:
+        """Destroy a page, keep its state and replace it with a placeholder.
+
+        Args:
+            entry: The page to hibernate.
+        """
+        page = entry.widget
+        page.removeEventFilter(self)
+        entry.pausable.clear()
+        entry.timer_states.clear()
+        entry.timer_intervals.clear()
+        entry.blocked_states.clear()
+        entry.state = _pageState(entry)
+        if entry.loader is not None:
+            placeholder: QWidget = LoadingPage(parent=self._stacked_widget)
+        else:
+            placeholder = QWidget(self._stacked_widget)
+        self._stacked_widget.insertWidget(self._stacked_widget.indexOf(page), placeholder)
+        self._stacked_widget.removeWidget(page)
+        page.deleteLater()
+        entry.widget = placeholder
+        entry.created = False
+        entry.footprint = 0
+
+    def _createPage(self, entry: _Page) -> None:
+        """Create a page from its factory.
+
+        Args:
+            entry: The page to create.
+        """
+        assert entry.factory is not None
+        self._mountPage(entry, entry.factory())
+
+    def _startLoad(self, entry: _Page) -> None:
+        """Start loading a page from its page loader, its loading page is shown meanwhile.
+
+        Args:
+            entry: The page to load.
+        """
+        assert entry.loader is not None
+        if isinstance(entry.widget, LoadingPage):
+            entry.widget.setText("Loading...")
+            entry.widget.setSpinning(True)
+        entry.load = PageLoad(entry.loader, self._thread_pool, self)
+        entry.load.mounted.connect(partial(self._loadMountedCallback, entry))  # type: ignore[attr-defined]
+        entry.load.failed.connect(partial(self._loadFailedCallback, entry))  # type: ignore[attr-defined]
+        self._loading.append(entry)
+        entry.load.start()
+
+    def _cancelLoad(self, entry: _Page) -> None:
+        """Cancel loading a page, it is loaded again the next time it is shown.
+
+        Args:
+            entry: The page being loaded.
+        """
+        assert entry.load is not None
+        entry.load.cancel()
+        entry.load = None
+        self._loading.remove(entry)
+
+    def _loadMountedCallback(self, entry: _Page, page: QWidget) -> None:
+        """Page load mounted callback
+
+        Args:
+            entry: The loaded page.
+            page: The mounted page.
+        """
+        entry.load = None
+        self._loading.remove(entry)
+        self._mountPage(entry, page)
+        if entry is self._current:
+            self._pageShown(entry)
+        self._enforcePageBudget()
+
+    def _loadFailedCallback(self, entry: _Page, error: str) -> None:
+        """Page load failed callback
+
+        Show the error on the loading page, the page is loaded again the next time it is shown.
+
+        Args:
+            entry: The page that failed to load.
+            error: The error message.
+        """
+        entry.load = None
+        self._loading.remove(entry)
+        if isinstance(entry.widget, LoadingPage):
+            entry.widget.setSpinning(False)
+            entry.widget.setText(f"Loading failed: {error}")
+        index = next(index for index, other in self._pages.items() if other is entry)
+        self.pageLoadFailed.emit(index, error)  # type: ignore[attr-defined]
+
+    def _mountPage(self, entry: _Page, page: QWidget) -> None:
+        """Replace the placeholder of a page with the created page.
+
+        Args:
+            entry: The created page.
+            page: The widget of the created page.
+        """
+        placeholder = entry.widget
+        self._stacked_widget.insertWidget(self._stacked_widget.indexOf(placeholder), page)
+        if self._stacked_widget.currentWidget() is placeholder:
+            self._stacked_widget.setCurrentWidget(page)
+        self._stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        entry.widget = page
+        entry.created = True
+        entry.footprint = 0
+        restore_state = getattr(page, "restorePageState", None)
+        if entry.state is not None and callable(restore_state):
+            restore_state(entry.state)
+        entry.state = None
+        self.pageCreated.emit(page)  # type: ignore[attr-defined]
 
     def _setupUi(self):
         """Setup UI"""
@@ -84,8 +965,20 @@ class DesktopApplication(QWidget):
         # Menu bar
         self._side_bar = SideBar(self)
         self._side_bar.setFixedWidth(60)
+        self._side_bar.currentChanged.connect(self._sideBarCallback)  # type: ignore[attr-defined]
         self._bg_frame_layout.addWidget(self._side_bar)
 
         # Stacked widget and its layout
         self._stacked_widget = QStackedWidget(self)
         self._bg_frame_layout.addWidget(self._stacked_widget)
+
+        # Snapshot of the page about to be shown, see setSnapshotsEnabled()
+        self._snapshot_view = _SnapshotView(self._stacked_widget)
+        self._stacked_widget.addWidget(self._snapshot_view)
+
+        # Quick switcher, see showQuickSwitcher()
+        self._quick_switcher = QuickSwitcher(self)
+        self._quick_switcher.entrySelected.connect(self._side_bar.setCurrentIndex)  # type: ignore[attr-defined]
+        shortcut = QShortcut(QKeySequence(_QUICK_SWITCHER_SHORTCUT), self)
+        shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        shortcut.activated.connect(self.showQuickSwitcher)  # type: ignore[attr-defined]
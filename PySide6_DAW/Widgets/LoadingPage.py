@@ -0,0 +1,163 @@
+"""Loading page class implementation."""
+
+from typing import Optional
+
+from PySide6.QtCore import Property, QRect, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QHideEvent, QPainter, QPaintEvent, QPen, QShowEvent
+from PySide6.QtWidgets import QWidget
+
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.Theme import Themed
+
+#: Size and line width of the spinner
+_SPINNER_SIZE = 32
+_SPINNER_WIDTH = 4
+
+#: Interval in milliseconds and angle in degrees of a spinner step
+_SPINNER_INTERVAL = 50
+_SPINNER_STEP = 30
+
+#: Vertical space between spinner and text
+_SPACING = 10
+
+
+# pylint: disable=duplicate-code; Properties appear in several widgets.
+class LoadingPage(Themed, QWidget):
+    """Loading page widget
+
+    Placeholder shown by the desktop application while a page is prepared in the background. It shows a spinner and a
+    message and stays responsive, as it only repaints the spinner while it is visible.
+    """
+
+    theme_section = "LoadingPage"
+
+    def __init__(self, text: str = "Loading...", parent: Optional[QWidget] = None) -> None:
+        """Constructor
+
+        Args:
+            text: The message shown below the spinner.
+            parent: The parent widget.
+        """
+        super().__init__(parent)
+
+        self._text = text
+        self._angle = 0
+        self._spinning = True
+        self._font = QFont("Segoe UI", 9, QFont.Weight.ExtraBold)
+        self._spinner_timer = QTimer(self)
+        self._spinner_timer.setInterval(_SPINNER_INTERVAL)
+        self._spinner_timer.timeout.connect(self._spinnerTimerCallback)  # type: ignore[attr-defined]
+        self._initTheme()
+
+    def text(self) -> str:
+        """Returns the message shown below the spinner."""
+        return self._text
+
+    def setText(self, text: str) -> None:
+        """Set the message shown below the spinner.
+
+        Args:
+            text: The message.
+        """
+        self._text = text
+        self.update()
+
+    def isSpinning(self) -> bool:
+        """Returns whether the spinner is shown."""
+        return self._spinning
+
+    def setSpinning(self, spinning: bool) -> None:
+        """Show or hide the spinner, e.g. once loading failed.
+
+        Args:
+            spinning: Whether the spinner is shown.
+        """
+        self._spinning = spinning
+        if spinning and self.isVisible():
+            self._spinner_timer.start()
+        elif not spinning:
+            self._spinner_timer.stop()
+        self.update()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Show event
+
+        Args:
+            event: The event.
+        """
+        super().showEvent(event)
+        if self._spinning:
+            self._spinner_timer.start()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Hide event
+
+        Args:
+            event: The event.
+        """
+        super().hideEvent(event)
+        self._spinner_timer.stop()
+
+    @instrumented("paint")
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint event
+
+        Args:
+            event: The event.
+        """
+        super().paintEvent(event)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Draw spinner
+        if self._spinning:
+            pen = QPen(self._themeColor("hl_color"), _SPINNER_WIDTH)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            painter.setPen(pen)
+            painter.drawArc(self._spinnerRect(), -self._angle * 16, 90 * 16)
+
+        # Draw text
+        painter.setFont(self._font)
+        painter.setPen(self._themeColor("text_color"))
+        rect = self.rect()
+        rect.setTop(self._spinnerRect().bottom() + _SPACING)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self._text)
+
+        painter.end()
+
+    def _spinnerRect(self) -> QRect:
+        """Returns the area of the spinner, centered above the middle of the page."""
+        margin = _SPINNER_WIDTH // 2
+        return QRect(
+            (self.width() - _SPINNER_SIZE) // 2 + margin,
+            self.height() // 2 - _SPINNER_SIZE + margin,
+            _SPINNER_SIZE - 2 * margin,
+            _SPINNER_SIZE - 2 * margin,
+        )
+
+    def _spinnerTimerCallback(self) -> None:
+        """Spinner timer callback, advances the spinner and repaints only its area."""
+        self._angle = (self._angle + _SPINNER_STEP) % 360
+        self.update(self._spinnerRect().adjusted(-_SPINNER_WIDTH, -_SPINNER_WIDTH, _SPINNER_WIDTH, _SPINNER_WIDTH))
+
+    @Property(QColor)
+    def hl_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the color of the spinner."""
+        return self._themeColor("hl_color")
+
+    @hl_color.setter  # type: ignore[no-redef]
+    def hl_color(self, color: QColor) -> None:
+        """Sets the color of the spinner."""
+        self._setThemeColor("hl_color", color)
+
+    @Property(QColor)
+    def text_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the color of the message."""
+        return self._themeColor("text_color")
+
+    @text_color.setter  # type: ignore[no-redef]
+    def text_color(self, color: QColor) -> None:
+        """Sets the color of the message."""
+        self._setThemeColor("text_color", color)
@@ -0,0 +1,182 @@
+"""Page record and helpers of the desktop application."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QSize, QTimer
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QWidget
+
+from PySide6_DAW.Widgets.PageLoader import PageLoad, PageLoader
+from PySide6_DAW.Widgets.SideBarButton import SideBarButton
+
+#: Zero-argument callable building a page on demand
+PageFactory = Callable[[], QWidget]
+
+#: Estimated memory footprint of a single widget in bytes, used if a page does not report its own footprint
+_WIDGET_FOOTPRINT = 1024
+
+
+def _estimateFootprint(page: QWidget) -> int:
+    """Estimate the memory footprint of a page.
+
+    Pages can report their own footprint by implementing ``memoryFootprint() -> int``. Otherwise the footprint is
+    estimated from the number of widgets in the page's widget tree.
+
+    Args:
+        page: The page.
+
+    Returns:
+        The estimated memory footprint in bytes.
+    """
+    memory_footprint = getattr(page, "memoryFootprint", None)
+    if callable(memory_footprint):
+        return int(memory_footprint())
+    return (len(page.findChildren(QWidget)) + 1) * _WIDGET_FOOTPRINT  # type: ignore[arg-type]
+
+
+class _Page:  # pylint: disable=too-few-public-methods; Plain record of the page state.
+    """Page registered in the desktop application"""
+
+    def __init__(
+        self, widget: QWidget, factory: Optional[PageFactory] = None, loader: Optional[PageLoader] = None
+    ) -> None:
+        """Constructor
+
+        Args:
+            widget: The page, or its placeholder if the page is not created yet.
+            factory: The factory creating the page, if the page is created on demand.
+            loader: The loader building the page in the background, if the page is loaded on demand.
+        """
+        self.widget = widget
+        self.key = ""
+        self.alignment = SideBarButton.Alignment.TOP
+        self.factory = factory
+        self.loader = loader
+        self.load: Optional[PageLoad] = None
+        self.created = factory is None and loader is None
+        self.last_shown = 0
+        self.footprint = 0
+        self.state: Any = None
+        self.snapshot: Optional[QPixmap] = None
+        self.snapshot_size = QSize()
+        self.paints = 0
+        self.active = False
+        self.pausable: List[QObject] = []
+        self.timer_states: Dict[QTimer, Tuple[bool, int, int]] = {}
+        self.timer_intervals: Dict[QTimer, int] = {}
+        self.blocked_states: Dict[QObject, bool] = {}
+
+
+def _pageFootprint(entry: _Page) -> int:
+    """Returns the estimated memory footprint of a resident page, estimated once after the page was mounted.
+
+    Args:
+        entry: The page.
+    """
+    if entry.footprint == 0:
+        entry.footprint = _estimateFootprint(entry.widget)
+    return entry.footprint
+
+
+def _pageState(entry: _Page) -> Any:
+    """Returns the opaque state of a page, as reported by its ``savePageState()`` or kept while it is not resident.
+
+    Args:
+        entry: The page.
+    """
+    if not entry.created:
+        return entry.state
+    save_state = getattr(entry.widget, "savePageState", None)
+    return save_state() if callable(save_state) else None
+
+
+def _restorePageState(entry: _Page, state: Any) -> None:
+    """Restore the state of a page, deferred until the page is created.
+
+    Args:
+        entry: The page.
+        state: The saved state of the page.
+    """
+    if not entry.created:
+        entry.state = state
+        return
+    restore_state = getattr(entry.widget, "restorePageState", None)
+    if callable(restore_state):
+        restore_state(state)
+
+
+def _isAlive(obj: QObject) -> bool:
+    """Returns whether the C++ object of a Python wrapper still exists.
+
+    Args:
+        obj: The object.
+    """
+    try:
+        obj.objectName()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _pauseObjects(entry: _Page, objects: List[QObject]) -> None:
+    """Stop the timers and block the signals of objects of a hidden page.
+
+    Args:
+        entry: The page.
+        objects: The objects to pause.
+    """
+    for obj in objects:
+        if not _isAlive(obj):
+            continue
+        if isinstance(obj, QTimer):
+            interval = entry.timer_intervals.get(obj, obj.interval())
+            entry.timer_states[obj] = (obj.isActive(), obj.remainingTime(), interval)
+            obj.stop()
+        else:
+            entry.blocked_states[obj] = obj.blockSignals(True)
+
+
+def _resumeObjects(entry: _Page) -> None:
+    """Restart the timers and unblock the signals of the paused objects of a shown page.
+
+    Args:
+        entry: The page.
+    """
+    for timer, (active, remaining_time, interval) in entry.timer_states.items():
+        if not active or not _isAlive(timer):
+            continue
+        if timer.isSingleShot() and 0 <= remaining_time < interval:
+            _resumeShot(entry, timer, remaining_time, interval)
+        else:
+            timer.start(interval)
+    for obj, blocked in entry.blocked_states.items():
+        if _isAlive(obj):
+            obj.blockSignals(blocked)
+    entry.pausable = [obj for obj in entry.pausable if _isAlive(obj)]
+    entry.timer_states.clear()
+    entry.blocked_states.clear()
+
+
+def _resumeShot(entry: _Page, timer: QTimer, remaining_time: int, interval: int) -> None:
+    """Resume a paused single-shot timer with its remaining time and restore its interval once it fired.
+
+    ``QTimer.start()`` sets the interval of the timer to the remaining time, so a later ``start()`` of the page would
+    fire too early otherwise.
+
+    Args:
+        entry: The page.
+        timer: The single-shot timer.
+        remaining_time: The remaining time in milliseconds when the timer was paused.
+        interval: The interval of the timer.
+    """
+    restore_pending = timer in entry.timer_intervals
+    entry.timer_intervals[timer] = interval
+    timer.start(remaining_time)
+    if restore_pending:
+        return
+
+    def restoreInterval() -> None:
+        timer.timeout.disconnect(restoreInterval)  # type: ignore[attr-defined]
+        timer.setInterval(entry.timer_intervals.pop(timer, interval))
+
+    timer.timeout.connect(restoreInterval)  # type: ignore[attr-defined]
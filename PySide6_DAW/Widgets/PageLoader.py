@@ -0,0 +1,206 @@
+"""Page loader class implementation."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Generator, Optional, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtWidgets import QWidget
+
+#: Maximum duration in seconds of a mount step on the main thread before control returns to the event loop
+MOUNT_SLICE = 0.008
+
+
+class PageLoader(ABC):
+    """Loader building a page in two halves without blocking the GUI thread
+
+    :meth:`prepare` loads the data of the page, e.g. reads and parses files or builds models, on a worker thread.
+    :meth:`mount` then builds the widgets of the page from the prepared data on the main thread. It can be written as
+    generator that yields between chunks of work, so the page is mounted in time slices and the application stays
+    responsive. A loader passed to :meth:`DesktopApplication.addPage` shows a :class:`LoadingPage` meanwhile.
+
+    Example::
+
+        class TrackListLoader(PageLoader):
+            def prepare(self, cancelled):
+                return [parseTrack(path) for path in paths if not cancelled.is_set()]
+
+            def mount(self, data):
+                page = QWidget()
+                layout = QVBoxLayout(page)
+                for track in data:
+                    layout.addWidget(TrackWidget(track))
+                    yield
+                return page
+    """
+
+    def prepare(self, cancelled: threading.Event) -> Any:  # pylint: disable=unused-argument; Hook for subclasses.
+        """Prepare the data of the page.
+
+        Called on a worker thread, so it must neither create nor access widgets. The returned data is passed to
+        :meth:`mount`. Long running preparations should return early once ``cancelled`` is set, the result is discarded
+        anyway. Pages without data to prepare can keep this default, which returns ``None``.
+
+        Args:
+            cancelled: Set once the page load is cancelled, e.g. because the user switched to another page.
+        """
+        return None
+
+    @abstractmethod
+    def mount(self, data: Any) -> Union[QWidget, Generator[None, None, QWidget]]:
+        """Build the page from the prepared data on the main thread, must be implemented by subclasses.
+
+        Args:
+            data: The data returned by :meth:`prepare`.
+
+        Returns:
+            The page, or a generator yielding between chunks of work and returning the page.
+        """
+
+
+class _PrepareTask(QRunnable):
+    """Task running the preparation of a page load on a thread pool"""
+
+    def __init__(self, page_load: "PageLoad") -> None:
+        """Constructor
+
+        Args:
+            page_load: The page load to prepare.
+        """
+        super().__init__()
+
+        self._page_load = page_load
+
+    def run(self) -> None:
+        """Run the preparation and report the result to the main thread."""
+        data, error = None, ""
+        if not self._page_load.cancelled.is_set():
+            try:
+                data = self._page_load.loader.prepare(self._page_load.cancelled)
+            except Exception as exception:  # pylint: disable=broad-exception-caught; Reported on the main thread.
+                error = str(exception) or type(exception).__name__
+        try:
+            self._page_load.prepared.emit(data, error)  # type: ignore[attr-defined]
+        except RuntimeError:
+            # The page load was destroyed together with its desktop application meanwhile
+            pass
+
+
+class PageLoad(QObject):
+    """Single load of a page by a page loader
+
+    The page load prepares the data on a thread pool, mounts the page in time slices on the main thread and deletes
+    itself once it is finished or cancelled.
+
+    Signals:
+        mounted: Emitted with the page once it is mounted.
+        failed: Emitted with an error message if preparing or mounting the page failed.
+        prepared: Emitted by the worker thread with the prepared data and an error message, which is empty on success.
+    """
+
+    mounted = Signal(QWidget)
+    failed = Signal(str)
+    prepared = Signal(object, str)
+
+    def __init__(self, loader: PageLoader, thread_pool: QThreadPool, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            loader: The page loader.
+            thread_pool: The thread pool to prepare the page on.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self.loader = loader
+        self.cancelled = threading.Event()
+        self._thread_pool = thread_pool
+        self._is_prepared = False
+        self._steps: Optional[Generator[None, None, Any]] = None
+        self._mount_timer = QTimer(self)
+        self._mount_timer.setSingleShot(True)
+        self._mount_timer.timeout.connect(self._mountTimerCallback)  # type: ignore[attr-defined]
+        self.prepared.connect(self._preparedCallback)  # type: ignore[attr-defined]
+
+    def start(self) -> None:
+        """Start preparing the page on the thread pool."""
+        self._thread_pool.start(_PrepareTask(self))
+
+    def cancel(self) -> None:
+        """Cancel the page load, neither ``mounted`` nor ``failed`` are emitted afterwards."""
+        self.cancelled.set()
+        self._mount_timer.stop()
+        if self._steps is not None:
+            self._steps.close()
+            self._steps = None
+        # The worker thread still reports to this page load until the preparation returned
+        if self._is_prepared:
+            self.deleteLater()
+
+    def _preparedCallback(self, data: Any, error: str) -> None:
+        """Prepared callback
+
+        Start mounting the page on the main thread.
+
+        Args:
+            data: The prepared data.
+            error: The error message or an empty string on success.
+        """
+        self._is_prepared = True
+        if self.cancelled.is_set():
+            self.deleteLater()
+        elif error:
+            self._fail(error)
+        else:
+            try:
+                result = self.loader.mount(data)
+            except Exception as exception:  # pylint: disable=broad-exception-caught; Reported via failed signal.
+                self._fail(str(exception) or type(exception).__name__)
+                return
+            if isinstance(result, QWidget):
+                self._finish(result)
+            else:
+                self._steps = result
+                self._mountTimerCallback()
+
+    def _mountTimerCallback(self) -> None:
+        """Mount timer callback
+
+        Run mount steps until the time slice is used up and continue in the next event loop iteration.
+        """
+        if self._steps is None:
+            return
+        deadline = time.perf_counter() + MOUNT_SLICE
+        try:
+            while time.perf_counter() < deadline:
+                next(self._steps)
+        except StopIteration as stop:
+            self._steps = None
+            self._finish(stop.value)
+        except Exception as exception:  # pylint: disable=broad-exception-caught; Reported via failed signal.
+            self._steps = None
+            self._fail(str(exception) or type(exception).__name__)
+        else:
+            self._mount_timer.start(0)
+
+    def _finish(self, page: Any) -> None:
+        """Report the mounted page and delete the page load.
+
+        Args:
+            page: The page returned by the page loader.
+        """
+        if isinstance(page, QWidget):
+            self.mounted.emit(page)  # type: ignore[attr-defined]
+            self.deleteLater()
+        else:
+            self._fail(f"'{type(self.loader).__name__}.mount' did not return a 'QWidget'!")
+
+    def _fail(self, error: str) -> None:
+        """Report an error and delete the page load.
+
+        Args:
+            error: The error message.
+        """
+        self.failed.emit(error)  # type: ignore[attr-defined]
+        self.deleteLater()
@@ -0,0 +1,183 @@
+"""Page prefetcher class implementation."""
+
+from typing import Callable, Dict, NamedTuple, Optional, Set
+
+from PySide6.QtCore import QObject, QTimer
+
+#: Default time in milliseconds the pointer has to rest on a side bar entry before its page is prefetched
+DEFAULT_DWELL = 150
+
+#: Idle time in milliseconds after a page switch before the page predicted from the navigation history is prefetched
+_HISTORY_DELAY = 500
+
+#: Number of times a page must have followed the current page to be predicted as the next page
+_MIN_HISTORY_COUNT = 2
+
+
+class PagePrefetcher(QObject):
+    """Prefetch policy of a desktop application, building pages in idle time before they are shown
+
+    A page is prefetched once the pointer rests on its side bar entry for the dwell time, or once it is predicted from
+    the navigation history, i.e. it followed the current page at least twice and more often than any other page.
+    Leaving the side bar entry cancels the dwell time and a background load of the hovered page still in flight.
+
+    Once the dwell time or the idle time after a page switch elapsed, the prefetch waits for a zero-timeout timer, so
+    the pending input and paint events are handled first. A page built by a factory is still built in one piece on the
+    GUI thread then, only a page loader prepares its page in the background and mounts it in time slices.
+
+    Pages are identified by their side bar index. Building and cancelling is left to the desktop application, which
+    passes the corresponding callables. Prefetching is disabled by default, see :meth:`setEnabled`.
+    """
+
+    class Stats(NamedTuple):
+        """Prefetch counters, the hit rate is the share of prefetched pages which were shown afterwards"""
+
+        prefetches: int
+        hits: int
+        misses: int
+        aborts: int
+        hit_rate: float
+
+    def __init__(
+        self, prefetch: Callable[[int], bool], abort: Callable[[int], bool], parent: Optional[QObject] = None
+    ) -> None:
+        """Constructor
+
+        Args:
+            prefetch: Builds or starts loading a page, returns whether there was anything to prefetch.
+            abort: Cancels the load of a page which is not shown, returns whether a load was in flight.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._prefetch = prefetch
+        self._abort = abort
+        self._enabled = False
+        self._dwell = DEFAULT_DWELL
+        self._history = True
+        self._target = -1
+        self._due = False
+        self._hovered = -1
+        self._prefetched: Set[int] = set()
+        self._transitions: Dict[int, Dict[int, int]] = {}
+        self._counters = [0, 0, 0, 0]
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._timerCallback)  # type: ignore[attr-defined]
+
+    def isEnabled(self) -> bool:
+        """Returns whether pages are prefetched."""
+        return self._enabled
+
+    def setEnabled(self, enabled: bool, dwell: int = DEFAULT_DWELL, history: bool = True) -> None:
+        """Enable or disable prefetching, a pending prefetch is cancelled if prefetching is disabled.
+
+        Args:
+            enabled: Whether pages are prefetched.
+            dwell: The time in milliseconds the pointer has to rest on a side bar entry.
+            history: Whether the next page is predicted from the navigation history.
+
+        Raises:
+            ValueError: If the dwell time is negative.
+        """
+        if dwell < 0:
+            raise ValueError("Invalid value for 'dwell'! The dwell time must not be negative.")
+        if not enabled:
+            self._timer.stop()
+            self._target = -1
+            self._hovered = -1
+        self._enabled = enabled
+        self._dwell = dwell
+        self._history = history
+
+    def stats(self) -> "PagePrefetcher.Stats":
+        """Returns the number of prefetched pages, of prefetched pages which were shown (hits), of pages built on demand
+        when shown (misses) and of aborted prefetches since the last reset."""
+        prefetches, hits, misses, aborts = self._counters
+        return PagePrefetcher.Stats(
+            prefetches=prefetches,
+            hits=hits,
+            misses=misses,
+            aborts=aborts,
+            hit_rate=hits / prefetches if prefetches else 0.0,
+        )
+
+    def resetStats(self) -> None:
+        """Reset the prefetch counters."""
+        self._counters = [0, 0, 0, 0]
+
+    def hover(self, index: int) -> None:
+        """Start the dwell time of a hovered page and abort the prefetch of the previously hovered page.
+
+        Args:
+            index: The side bar index of the hovered page or -1 if the pointer left the side bar entry.
+        """
+        if not self._enabled:
+            return
+        previous = self._hovered
+        self._hovered = index
+        if previous not in (-1, index):
+            if self._target == previous:
+                self._timer.stop()
+                self._target = -1
+            if previous in self._prefetched and self._abort(previous):
+                self._prefetched.discard(previous)
+                self._counters[3] += 1
+        if index != -1:
+            self._target = index
+            self._startTimer(self._dwell)
+
+    def shown(self, index: int, previous: int, resident: bool) -> None:
+        """Count whether a shown page was prefetched, learn the page switch and predict the next page.
+
+        Args:
+            index: The side bar index of the shown page.
+            previous: The side bar index of the previously shown page or -1.
+            resident: Whether the page was created or is loading when it is shown.
+        """
+        if not self._enabled:
+            return
+        if index in self._prefetched and resident:
+            self._counters[1] += 1
+        elif not resident:
+            self._counters[2] += 1
+        self._prefetched.discard(index)
+        self._timer.stop()
+        self._target = -1
+        if previous in (-1, index):
+            return
+
+        successors = self._transitions.setdefault(previous, {})
+        successors[index] = successors.get(index, 0) + 1
+        successors = self._transitions.get(index, {})
+        if self._history and successors:
+            counts = sorted(successors.values(), reverse=True)
+            # Only a page which followed more often than any other page is predicted, ties are not guessed
+            if counts[0] >= _MIN_HISTORY_COUNT and (len(counts) == 1 or counts[0] > counts[1]):
+                self._target = max(successors, key=successors.__getitem__)
+                self._startTimer(_HISTORY_DELAY)
+
+    def _startTimer(self, delay: int) -> None:
+        """Start the timer prefetching the target page.
+
+        Args:
+            delay: The dwell time or the idle time after a page switch in milliseconds.
+        """
+        self._due = False
+        self._timer.start(delay)
+
+    def _timerCallback(self) -> None:
+        """Timer callback
+
+        Once the delay elapsed, wait until the pending events are handled and prefetch the target page then.
+        """
+        if not self._due:
+            self._due = True
+            self._timer.start(0)
+            return
+        self._due = False
+        target = self._target
+        self._target = -1
+        if target != -1 and self._prefetch(target):
+            self._prefetched.add(target)
+            self._counters[0] += 1
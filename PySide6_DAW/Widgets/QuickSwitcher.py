@@ -0,0 +1,246 @@
+"""Quick switcher class implementation"""
+
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import Property, QEvent, QObject, Qt, Signal
+from PySide6.QtGui import QColor, QFocusEvent, QFont, QKeyEvent, QPainter, QPaintEvent, QPalette
+from PySide6.QtWidgets import QFrame, QLineEdit, QListWidget, QVBoxLayout, QWidget
+
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.SearchIndex import SearchIndex
+from PySide6_DAW.Utils.Theme import Themed
+
+#: Maximum number of results listed
+_MAX_RESULTS = 10
+
+#: Maximum width of the quick switcher and its margin to the top and the sides of its parent
+_MAX_WIDTH = 480
+_MARGIN = 20
+
+#: Corner radius of the quick switcher
+_RADIUS = 10
+
+
+# pylint: disable=duplicate-code; Properties appear in several widgets.
+class QuickSwitcher(Themed, QFrame):
+    """Quick switcher popup
+
+    Lists the entries whose title or keywords match the typed query, the best matches first. The entries are kept in a
+    :class:`SearchIndex`, which is updated incrementally via :meth:`addEntry` and :meth:`removeEntry`, so the results
+    are filtered on every keystroke without touching the pages themselves. Up and down select a result, enter switches
+    to it and escape closes the quick switcher, as does moving the focus away from it.
+
+    Signals:
+        entrySelected: Emitted with the key of the chosen entry, e.g. the side bar index of a page.
+    """
+
+    entrySelected = Signal(int)
+
+    theme_section = "QuickSwitcher"
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent widget, the quick switcher is shown at the top of it.
+        """
+        super().__init__(parent)
+
+        self._index = SearchIndex()
+        self._keys: List[int] = []
+
+        self._line_edit = QLineEdit(self)
+        self._line_edit.setPlaceholderText("Go to page...")
+        self._line_edit.setFrame(False)
+        self._line_edit.setFont(QFont("Segoe UI", 11))
+        self._line_edit.installEventFilter(self)
+        self._line_edit.textChanged.connect(self.filter)  # type: ignore[attr-defined]
+
+        self._list_widget = QListWidget(self)
+        self._list_widget.setFrameShape(QFrame.Shape.NoFrame)
+        self._list_widget.setUniformItemSizes(True)
+        self._list_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list_widget.setFont(QFont("Segoe UI", 9))
+        self._list_widget.itemClicked.connect(  # type: ignore[attr-defined]
+            lambda item: self._select(self._list_widget.row(item))
+        )
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(5)
+        layout.addWidget(self._line_edit)
+        layout.addWidget(self._list_widget)
+
+        self._initTheme()
+        self._themeChanged()
+        self.hide()
+
+    def index(self) -> SearchIndex:
+        """Returns the search index of the quick switcher."""
+        return self._index
+
+    def addEntry(self, key: int, title: str, keywords: Iterable[str] = ()) -> None:
+        """Add an entry to the quick switcher, an entry with the same key is replaced.
+
+        Args:
+            key: The key of the entry, emitted via ``entrySelected``.
+            title: The title of the entry.
+            keywords: Additional words the entry is found by.
+        """
+        self._index.add(key, title, keywords)
+        if self.isVisible():
+            self.filter(self._line_edit.text())
+
+    def removeEntry(self, key: int) -> None:
+        """Remove an entry from the quick switcher.
+
+        Args:
+            key: The key of the entry.
+
+        Raises:
+            KeyError: If there is no entry with the given key.
+        """
+        self._index.remove(key)
+        if self.isVisible():
+            self.filter(self._line_edit.text())
+
+    def popup(self) -> None:
+        """Show the quick switcher at the top of its parent with an empty query and focus its line edit."""
+        parent = self.parentWidget()
+        if parent is not None:
+            width = min(_MAX_WIDTH, parent.width() - 2 * _MARGIN)
+            row_height = max(self._list_widget.sizeHintForRow(0), self._list_widget.fontMetrics().height() + 4)
+            list_height = row_height * _MAX_RESULTS + 2 * self._list_widget.frameWidth()
+            self._list_widget.setFixedHeight(list_height)
+            self.resize(width, self.sizeHint().height())
+            self.move((parent.width() - width) // 2, _MARGIN)
+        self._line_edit.clear()
+        self.filter("")
+        self.show()
+        self.raise_()
+        self._line_edit.setFocus(Qt.FocusReason.PopupFocusReason)
+
+    def query(self) -> str:
+        """Returns the current query."""
+        return self._line_edit.text()
+
+    def results(self) -> List[int]:
+        """Returns the keys of the listed results, the best match first."""
+        return list(self._keys)
+
+    def filter(self, query: str) -> None:
+        """List the entries matching a query, called on every keystroke.
+
+        Args:
+            query: The query.
+        """
+        self._keys = self._index.search(query, _MAX_RESULTS)  # type: ignore[assignment]
+        self._list_widget.setUpdatesEnabled(False)
+        self._list_widget.clear()
+        self._list_widget.addItems([self._index.text(key) for key in self._keys])
+        if self._keys:
+            self._list_widget.setCurrentRow(0)
+        self._list_widget.setUpdatesEnabled(True)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Event filter handling the navigation keys and the focus loss of the line edit.
+
+        Args:
+            watched: The watched object.
+            event: The event.
+
+        Returns:
+            Whether the event was filtered out.
+        """
+        if watched is self._line_edit and event.type() == QEvent.Type.KeyPress:
+            assert isinstance(event, QKeyEvent)
+            key = event.key()
+            row = self._list_widget.currentRow()
+            if key == Qt.Key.Key_Down and self._keys:
+                self._list_widget.setCurrentRow(min(row + 1, len(self._keys) - 1))
+                return True
+            if key == Qt.Key.Key_Up and self._keys:
+                self._list_widget.setCurrentRow(max(row - 1, 0))
+                return True
+            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                self._select(row)
+                return True
+            if key == Qt.Key.Key_Escape:
+                self.hide()
+                return True
+        if watched is self._line_edit and event.type() == QEvent.Type.FocusOut:
+            assert isinstance(event, QFocusEvent)
+            # The context menu of the line edit takes the focus without leaving the quick switcher
+            if event.reason() != Qt.FocusReason.PopupFocusReason:
+                self.hide()
+        return super().eventFilter(watched, event)
+
+    def _select(self, row: int) -> None:
+        """Close the quick switcher and emit the key of a listed result.
+
+        Args:
+            row: The row of the result, nothing is emitted for an invalid row.
+        """
+        self.hide()
+        if 0 <= row < len(self._keys):
+            self.entrySelected.emit(self._keys[row])  # type: ignore[attr-defined]
+
+    def _themeChanged(self) -> None:
+        """Theme changed callback, applies the colors to the line edit and the result list."""
+        palette = QPalette(self.palette())
+        for role in (QPalette.ColorRole.Base, QPalette.ColorRole.Window):
+            palette.setColor(role, self._themeColor("bg_color"))
+        for role in (QPalette.ColorRole.Text, QPalette.ColorRole.WindowText):
+            palette.setColor(role, self._themeColor("text_color"))
+        palette.setColor(QPalette.ColorRole.Highlight, self._themeColor("hl_color"))
+        palette.setColor(QPalette.ColorRole.HighlightedText, self._themeColor("text_color"))
+        self._line_edit.setPalette(palette)
+        self._list_widget.setPalette(palette)
+        super()._themeChanged()
+
+    @instrumented("paint")
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint event
+
+        Args:
+            event: The event.
+        """
+        super().paintEvent(event)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._themeColor("hl_color"))
+        painter.setBrush(self._themeColor("bg_color"))
+        painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), _RADIUS, _RADIUS)
+        painter.end()
+
+    @Property(QColor)
+    def bg_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the background color of the quick switcher."""
+        return self._themeColor("bg_color")
+
+    @bg_color.setter  # type: ignore[no-redef]
+    def bg_color(self, color: QColor) -> None:
+        """Sets the background color of the quick switcher."""
+        self._setThemeColor("bg_color", color)
+
+    @Property(QColor)
+    def hl_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the color of the border and the selected result of the quick switcher."""
+        return self._themeColor("hl_color")
+
+    @hl_color.setter  # type: ignore[no-redef]
+    def hl_color(self, color: QColor) -> None:
+        """Sets the color of the border and the selected result of the quick switcher."""
+        self._setThemeColor("hl_color", color)
+
+    @Property(QColor)
+    def text_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the text color of the quick switcher."""
+        return self._themeColor("text_color")
+
+    @text_color.setter  # type: ignore[no-redef]
+    def text_color(self, color: QColor) -> None:
+        """Sets the text color of the quick switcher."""
+        self._setThemeColor("text_color", color)
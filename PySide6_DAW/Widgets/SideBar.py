@@ -1,26 +1,43 @@
 """Side bar class implementation."""
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
-from PySide6.QtCore import Property
-from PySide6.QtGui import QColor, QResizeEvent
+from PySide6.QtCore import Property, QAbstractItemModel, QCoreApplication, QEvent, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QResizeEvent
 from PySide6.QtWidgets import QFrame, QSizePolicy, QSpacerItem, QVBoxLayout, QWidget
 
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.StallWatchdog import StallWatchdog
+from PySide6_DAW.Utils.Theme import Themed
 from PySide6_DAW.Widgets.SideBarButton import SideBarButton
+from PySide6_DAW.Widgets.SideBarModel import SideBarModel
+from PySide6_DAW.Widgets.SideBarView import SideBarView
 
-#: Template for background frame stylesheet
-_BG_FRAME_STYLESHEET = """\
-QFrame#side_bar_bg_frame {{
-    background-color: {bg_color};
-    border: none;
-    border-radius: 8px;
-}}
-"""
+#: Corner radius of the side bar background
+_RADIUS = 8
+
+#: Event sizing the side bar buttons once per event loop iteration, see SideBar._scheduleButtonSizing()
+_SIZE_BUTTONS_EVENT = QEvent.Type(QEvent.registerEventType())
 
 
 # pylint: disable=duplicate-code; Properties appear in several widgets.
-class SideBar(QWidget):
-    """Side bar widget"""
+class SideBar(Themed, QWidget):
+    """Side bar widget
+
+    The side bar either holds side bar buttons or, for a large number of entries, is backed by a model (see
+    :meth:`setModel`). In the latter case the entries are painted by scrollable views and their index is the model row.
+
+    Signals:
+        currentChanged: Emitted with the index of the newly selected side bar button.
+        hoveredChanged: Emitted with the index of the side bar button the pointer entered or -1 when the pointer left
+            it.
+    """
+
+    currentChanged = Signal(int)
+    hoveredChanged = Signal(int)
+
+    theme_section = "SideBar"
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Constructor
@@ -31,9 +48,16 @@ class SideBar(QWidget):
         super().__init__(parent)
 
         # Define attributes
-        self._first_button = True
         self._top_buttons: List[SideBarButton] = []
         self._bottom_buttons: List[SideBarButton] = []
+        self._buttons: List[SideBarButton] = []
+        self._button_indices: Dict[SideBarButton, int] = {}
+        self._current_button: Optional[SideBarButton] = None
+        self._model: Optional[QAbstractItemModel] = None
+        self._views: List[SideBarView] = []
+        self._current_row = -1
+        self._button_size = QSize()
+        self._sizing_pending = False
 
         # Set UI
         self._layout: QVBoxLayout
@@ -46,25 +70,37 @@ class SideBar(QWidget):
         self._bottom_frame_layout: QVBoxLayout
         self._setupUi()
 
-        # Define colors and set default values
-        self._bg_color = QColor("#191E23")
-        self._setStyle()
-
-    def _setStyle(self) -> None:
-        """Apply stylesheet."""
-        self._bg_frame.setStyleSheet(_BG_FRAME_STYLESHEET.format(bg_color=self._bg_color.name()))
+        # Take colors from the shared theme
+        self._initTheme()
 
     @Property(QColor)
     def bg_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
         """Returns the background color for the side bar."""
-        return self._bg_color
+        return self._themeColor("bg_color")
 
     @bg_color.setter  # type: ignore[no-redef]
     def bg_color(self, color: QColor) -> None:
         """Sets the background color for the side bar."""
-        self._bg_color = color
-        self._setStyle()
+        self._setThemeColor("bg_color", color)
+
+    @instrumented("paint")
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint event
+
+        Args:
+            event: The event.
+        """
+        super().paintEvent(event)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._themeColor("bg_color"))
+        painter.drawRoundedRect(self.rect(), _RADIUS, _RADIUS)
+        painter.end()
 
+    @instrumented("resize")
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Resize event
 
@@ -73,22 +109,176 @@ class SideBar(QWidget):
         """
         super().resizeEvent(event)
 
-        buttons: List[SideBarButton] = self.findChildren(SideBarButton)
-        for button in buttons:
-            button.setFixedSize(self.width(), self.width())
+        old_size = event.oldSize()
+        if event.size().width() != old_size.width():
+            self._scheduleButtonSizing()
+            self.update()
+        elif old_size.isValid():
+            # Static contents: only the rounded bottom corners move, the buttons are not repainted
+            top = min(self.height(), old_size.height()) - _RADIUS
+            self.update(0, top, self.width(), abs(self.height() - old_size.height()) + _RADIUS)
+
+    def customEvent(self, event: QEvent) -> None:
+        """Custom event, sizes the side bar buttons once per event loop iteration.
+
+        Args:
+            event: The event.
+        """
+        if event.type() == _SIZE_BUTTONS_EVENT:
+            self._sizeButtons()
+        else:
+            super().customEvent(event)
+
+    def model(self) -> Optional[QAbstractItemModel]:
+        """Returns the model backing the side bar or ``None`` if the side bar holds side bar buttons."""
+        return self._model
+
+    def setModel(self, model: QAbstractItemModel) -> None:
+        """Back the side bar by a model instead of side bar buttons.
+
+        The model provides the icon, tool tip and alignment of each entry, see :class:`SideBarModel`. Only the visible
+        entries are painted and the entries aligned at the top scroll, so the side bar can hold hundreds of entries.
+
+        Args:
+            model: The model holding the side bar entries.
+
+        Raises:
+            RuntimeError: If side bar buttons were already added.
+        """
+        if self._buttons:
+            raise RuntimeError("The side bar already holds side bar buttons and cannot be backed by a model!")
+
+        if self._model is None:
+            # Replace the spacer between top and bottom bar by a scrollable top view
+            self._bg_layout.removeItem(self._vertical_spacer)
+            self._bg_layout.setStretchFactor(self._top_frame, 1)
+            for alignment, layout in (
+                (SideBarButton.Alignment.TOP, self._top_frame_layout),
+                (SideBarButton.Alignment.BOTTOM, self._bottom_frame_layout),
+            ):
+                view = SideBarView(alignment, parent=self)
+                view.entryClicked.connect(self._viewClickedCallback)  # type: ignore[attr-defined]
+                view.entryHovered.connect(self.hoveredChanged)  # type: ignore[attr-defined]
+                layout.addWidget(view)
+                self._views.append(view)
+        else:
+            for signal in (self._model.rowsInserted, self._model.rowsRemoved, self._model.modelReset):
+                signal.disconnect(self._modelCallback)  # type: ignore[attr-defined]
+
+        self._model = model
+        self._current_row = -1
+        for view in self._views:
+            view.setSourceModel(model)
+            view.setCurrentRow(-1)
+        for signal in (model.rowsInserted, model.rowsRemoved, model.modelReset):
+            signal.connect(self._modelCallback)  # type: ignore[attr-defined]
+        self._modelCallback()
+
+    def count(self) -> int:
+        """Returns the number of side bar buttons or model entries."""
+        if self._model is not None:
+            return self._model.rowCount()
+        return len(self._buttons)
+
+    def button(self, index: int) -> Optional[SideBarButton]:
+        """Returns the side bar button at the given index or ``None`` if the index is out of range.
+
+        Args:
+            index: The index of the side bar button in the order the buttons were added.
+        """
+        if 0 <= index < len(self._buttons):
+            return self._buttons[index]
+        return None
+
+    def indexOf(self, button: SideBarButton) -> int:
+        """Returns the index of the given side bar button or -1 if the button is not part of the side bar.
+
+        Args:
+            button: The side bar button.
+        """
+        return self._button_indices.get(button, -1)
 
-    def addButton(self, button: SideBarButton, alignment: SideBarButton.Alignment) -> None:
+    def currentButton(self) -> Optional[SideBarButton]:
+        """Returns the selected side bar button or ``None`` if no button is selected."""
+        return self._current_button
+
+    def currentIndex(self) -> int:
+        """Returns the index of the selected side bar button or -1 if no button is selected."""
+        if self._model is not None:
+            return self._current_row
+        if self._current_button is None:
+            return -1
+        return self._button_indices[self._current_button]
+
+    def setCurrentIndex(self, index: int) -> None:
+        """Select the side bar button at the given index and unselect the previously selected one.
+
+        Args:
+            index: The index of the side bar button in the order the buttons were added.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if self._model is not None:
+            if not 0 <= index < self._model.rowCount():
+                raise IndexError(f"Invalid value for 'index'! The side bar has {self._model.rowCount()} entries.")
+            if index == self._current_row:
+                return
+            self._current_row = index
+            for view in self._views:
+                view.setCurrentRow(index)
+            self.currentChanged.emit(index)  # type: ignore[attr-defined]
+            return
+
+        button = self.button(index)
+        if button is None:
+            raise IndexError(f"Invalid value for 'index'! The side bar has {len(self._buttons)} buttons.")
+
+        previous_button = self._current_button
+        button.setChecked(True)
+        if button is previous_button:
+            return
+        if previous_button is not None:
+            previous_button.setChecked(False)
+        self._current_button = button
+        self.currentChanged.emit(index)  # type: ignore[attr-defined]
+
+    def addButton(self, button: SideBarButton, alignment: SideBarButton.Alignment) -> int:
         """Add a new side bar button the the side bar.
 
+        If the side bar is backed by a :class:`SideBarModel`, a new entry with the icon and tool tip of the button is
+        appended to the model instead and the button itself is not used. It is neither shown nor parented to the side
+        bar, so it is up to the caller to delete it. Icons given as image or image file path are passed on as icon
+        source, so they are only rasterized in the background once the entry is painted.
+
         Args:
             button: The new side bar button.
             alignment: The alignment of the side bar button within the side bar.
 
+        Returns:
+            The index of the new side bar entry, i.e. the model row of the appended entry if the side bar is backed by a
+            model.
+
         Raises:
             ValueError: If the alignment value is invalid.
+            TypeError: If the side bar is backed by a model other than a ``SideBarModel``.
         """
+        if self._model is not None:
+            if not isinstance(self._model, SideBarModel):
+                raise TypeError("Buttons can only be added to side bars backed by a 'SideBarModel'!")
+            if not isinstance(alignment, SideBarButton.Alignment):
+                raise ValueError(
+                    "Invalid value for 'alignment'!"
+                    "Supported values are 'SideBarButton.Alignment.TOP' and 'SideBarButton.Alignment.BOTTOM'."
+                )
+            icon = button.iconSource()
+            return self._model.appendEntry(
+                button.iconPixmap() if icon is None else icon, button.toolTipText(), alignment
+            )
+
         button.setParent(self)
         button.clicked.connect(self._buttonCallback)  # type: ignore[attr-defined]
+        button.hoveredChanged.connect(self._buttonHoverCallback)  # type: ignore[attr-defined]
 
         if alignment == SideBarButton.Alignment.TOP:
             self._top_buttons.append(button)
@@ -102,25 +292,122 @@ class SideBar(QWidget):
                 "Supported values are 'SideBarButton.Alignment.TOP' and 'SideBarButton.Alignment.BOTTOM'."
             )
 
+        index = len(self._buttons)
+        self._button_indices[button] = index
+        self._buttons.append(button)
+        self._scheduleButtonSizing()
+
         # Select the first button as default
-        if self._first_button:
-            button.click()
-            self._first_button = False
+        if self._current_button is None:
+            self.setCurrentIndex(0)
+        return index
+
+    @contextmanager
+    def batch(self) -> Iterator["SideBar"]:
+        """Context manager suspending repaints and layout while many side bar buttons are added.
+
+        The buttons are hidden together with their frames meanwhile. Otherwise each button added to the visible side
+        bar is shown and laid out on its own, growing the side bar step by step. The side bar is laid out and repainted
+        once when the outermost batch ends.
+
+        Yields:
+            The side bar.
+        """
+        outermost = not self._bg_frame.isHidden()
+        if outermost:
+            self.setUpdatesEnabled(False)
+            self._bg_frame.hide()
+        try:
+            yield self
+        finally:
+            if outermost:
+                self._bg_frame.show()
+                self.setUpdatesEnabled(True)
 
     def _buttonCallback(self):
         """Menu button callback
 
-        Select the checked side bar button and unselect all others.
+        Select the clicked side bar button and unselect the previously selected one.
         """
-        buttons: List[SideBarButton] = self.findChildren(SideBarButton)
+        button = self.sender()
+        assert isinstance(button, SideBarButton)
+        index = self._button_indices[button]
+        if StallWatchdog.enabled:
+            StallWatchdog.instance().setAction(f"SideBar.click[{index}: {button.toolTipText()}]")
+        self.setCurrentIndex(index)
+
+    def _viewClickedCallback(self, row: int) -> None:
+        """Side bar view click callback
+
+        Args:
+            row: The model row of the clicked entry.
+        """
+        if StallWatchdog.enabled:
+            StallWatchdog.instance().setAction(f"SideBar.click[{row}]")
+        self.setCurrentIndex(row)
+
+    def _buttonHoverCallback(self, hovered: bool) -> None:
+        """Menu button hover callback
+
+        Args:
+            hovered: Whether the pointer entered the side bar button.
+        """
+        index = self._button_indices[self.sender()] if hovered else -1  # type: ignore[index]
+        self.hoveredChanged.emit(index)  # type: ignore[attr-defined]
+
+    def _modelCallback(self) -> None:
+        """Model callback
+
+        Resize the views to the changed number of entries and select the first entry as default.
+        """
+        self._updateViewSizes()
+        if self._model is not None and self._current_row >= self._model.rowCount():
+            self._current_row = -1
+            for view in self._views:
+                view.setCurrentRow(-1)
+        if self._current_row == -1 and self.count() > 0:
+            self.setCurrentIndex(0)
+
+    def _scheduleButtonSizing(self) -> None:
+        """Schedule sizing the side bar buttons square to the side bar width.
+
+        Resize events and added buttons are coalesced into a single sizing pass per event loop iteration. The pass is
+        posted with normal priority, so it runs before the pending repaint of the side bar.
+        """
+        if not self._sizing_pending:
+            self._sizing_pending = True
+            QCoreApplication.postEvent(self, QEvent(_SIZE_BUTTONS_EVENT))
+
+    def _sizeButtons(self) -> None:
+        """Size the side bar buttons square to the side bar width, only buttons with another size are touched.
+
+        The layouts are laid out once after all buttons are sized.
+        """
+        self._sizing_pending = False
+        size = QSize(self.width(), self.width())
+        if size != self._button_size:
+            self._button_size = size
+            self._updateViewSizes()
+        buttons = [button for button in self._buttons if button.minimumSize() != size or button.maximumSize() != size]
+        if not buttons:
+            return
         for button in buttons:
-            if button == self.sender():
-                button.setChecked(True)
-            else:
-                button.setChecked(False)
+            button.setFixedSize(size)
+        # Lay out inside out now instead of waiting for the layout requests to propagate over several iterations
+        for layout in (self._top_frame_layout, self._bottom_frame_layout, self._bg_layout, self._layout):
+            layout.activate()
+
+    def _updateViewSizes(self) -> None:
+        """Size the bottom view to fit all of its entries, the top view takes the remaining space and scrolls."""
+        if self._views:
+            bottom_view = self._views[1]
+            bottom_view.setFixedHeight(bottom_view.model().rowCount() * self.width())
 
     def _setupUi(self):
         """Setup UI"""
+        # Contents only depend on the width, so vertical resizes only repaint exposed areas, see resizeEvent()
+        self.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+
         # Layout for this widget
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -129,6 +416,7 @@ class SideBar(QWidget):
         # Background frame and its layout
         self._bg_frame = QFrame(self)
         self._bg_frame.setObjectName("side_bar_bg_frame")
+        self._bg_frame.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
         self._bg_layout = QVBoxLayout(self._bg_frame)
         self._bg_layout.setContentsMargins(0, 20, 0, 20)
         self._bg_layout.setSpacing(0)
@@ -1,18 +1,75 @@
 """Side bar button class implementation."""
 
+import math
+import threading
+import time
 from enum import Enum, auto
-from typing import Optional
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
 
-from PySide6.QtCore import Property, QRect, QSize, Qt
-from PySide6.QtGui import QColor, QIcon, QPainter, QPaintEvent, QPixmap, QResizeEvent
+from PySide6.QtCore import Property, QCoreApplication, QEvent, QRect, QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QEnterEvent, QFont, QMouseEvent, QPainter, QPaintEvent, QPixmap, QResizeEvent
 from PySide6.QtWidgets import QPushButton, QWidget
 
+from PySide6_DAW.Utils.AnimationClock import AnimationClock
+from PySide6_DAW.Utils.IconRasterizer import IconRasterizer, IconSource
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.PixmapCache import PixmapCache
+from PySide6_DAW.Utils.Theme import Themed
 from PySide6_DAW.Widgets.ToolTip import ToolTip
 
+#: Default duration in milliseconds of the fade between two paint states
+_DEFAULT_FADE_DURATION = 120
+
+#: Maximum number of paint states blended while fades are interrupted, the oldest state is dropped beyond it
+_MAX_FADE_LAYERS = 3
+
+#: Event applying the pending badge of a side bar button on the GUI thread, see SideBarButton.setBadge()
+_BADGE_EVENT = QEvent.Type(QEvent.registerEventType())
+
+#: Largest count shown on a badge, larger counts are shown as "99+"
+_MAX_BADGE_COUNT = 99
+
+
+class _BadgeState:  # pylint: disable=too-few-public-methods; Plain record shared with worker threads.
+    """Badge of a side bar button, set from any thread and applied on the GUI thread at most once per frame"""
+
+    def __init__(self) -> None:
+        """Constructor"""
+        self.lock = threading.Lock()
+        self.pending: Optional["SideBarButton.Badge"] = None
+        self.scheduled = False
+        self.shown = SideBarButton.Badge(unread=0, status=None)
+        self.flushed = 0.0
+
+
+class _FadeState:  # pylint: disable=too-few-public-methods; Plain record of the running fade.
+    """Fade of a side bar button from the blend of paint states it showed when the fade started"""
+
+    def __init__(self) -> None:
+        """Constructor"""
+        self.layers: List[Tuple["SideBarButton.State", float]] = []
+        self.start = 0.0
+        self.progress = 1.0
+
 
 # pylint: disable=duplicate-code; Properties appear in several widgets.
-class SideBarButton(QPushButton):
-    """Side bar button widget"""
+class SideBarButton(Themed, QPushButton):  # pylint: disable=too-many-public-methods; Qt properties and event handlers.
+    """Side bar button widget
+
+    The paint state of the button is tracked by a state machine driven by enter, leave, press, release, toggle and
+    enable events. The button only repaints on actual state transitions and only the area the transition changes, see
+    :meth:`repaintStats`. Transitions fade from the previous to the new state, driven by the shared
+    :class:`AnimationClock`, see :attr:`fade_duration`. An interrupted fade continues from the blend it shows.
+
+    Badges, e.g. unread counts and status dots, can be set from any thread, see :meth:`setBadge`.
+
+    Signals:
+        hoveredChanged: Emitted with whether the pointer is on the button when it enters or leaves the button.
+    """
+
+    hoveredChanged = Signal(bool)
+
+    theme_section = "SideBarButton"
 
     class Alignment(Enum):
         """Side bar button alignment within side bar"""
@@ -20,13 +77,40 @@ class SideBarButton(QPushButton):
         TOP = auto()
         BOTTOM = auto()
 
+    class State(Enum):
+        """Side bar button paint state"""
+
+        OFF = auto()
+        HOVER = auto()
+        PRESSED = auto()
+        CHECKED = auto()
+        DISABLED = auto()
+
+    class RepaintStats(NamedTuple):
+        """Repaint counters of a side bar button"""
+
+        transitions: int
+        repaints: int
+        repainted_pixels: int
+
+    class Badge(NamedTuple):
+        """Badge of a side bar button: an unread count and a status dot color, shown if either is set"""
+
+        unread: int
+        status: Optional[QColor]
+
     def __init__(
-        self, icon: QPixmap, tool_tip: Optional[str] = None, radius: int = 8, parent: Optional[QWidget] = None
+        self,
+        icon: Union[QPixmap, IconSource],
+        tool_tip: Optional[str] = None,
+        radius: int = 8,
+        parent: Optional[QWidget] = None,
     ) -> None:
         """Constructor
 
         Args:
-            icon_path: Path to the icon for the button.
+            icon: The icon for the button. Icons given as image or as path to an image file, e.g. an SVG file, are
+                rasterized at the icon size of the button on a worker thread, see :class:`IconRasterizer`.
             tool_tip: Text for the tool tip.
             radius: Radius of shape.
             parent: The parent widget.
@@ -34,24 +118,27 @@ class SideBarButton(QPushButton):
         super().__init__(parent)
 
         # Set attributes from arguments
-        self._icon = icon
+        self._icon_source: Optional[IconSource] = None
+        if isinstance(icon, QPixmap):
+            self._icon = icon
+        else:
+            self._icon = QPixmap()
+            self._icon_source = icon
+        self._icon_key: Optional[Tuple] = None
         self._radius = radius
-        self._tool_tip: Optional[ToolTip] = None
-        if tool_tip:
-            self._tool_tip = ToolTip(text=tool_tip)
-            self._tool_tip.hide()
-
-        # Define colors and set default values
-        self._bg_color: QColor
-        self._on_color: QColor
-        self._hl_color: QColor
-        self._icon_off_color: QColor
-        self._icon_on_color: QColor
-        self.bg_color = QColor("#191E23")  # type: ignore[assignment, method-assign]
-        self.on_color = QColor("#282D32")  # type: ignore[assignment, method-assign]
-        self.hl_color = QColor("#0066FF")  # type: ignore[assignment, method-assign]
-        self.icon_off_color = QColor("#808080")  # type: ignore[assignment, method-assign]
-        self.icon_on_color = QColor("#FFFFFF")  # type: ignore[assignment, method-assign]
+        self._tool_tip = tool_tip
+
+        # Paint state machine and its repaint counters
+        self._state = SideBarButton.State.OFF
+        self._hovered = False
+        self._refresh_blocked = False
+        self._counters = [0, 0, 0]
+        self._fade_duration = _DEFAULT_FADE_DURATION
+        self._fade = _FadeState()
+        self._badge_state = _BadgeState()
+
+        # Take colors from the shared theme
+        self._initTheme()
 
         # Define areas for painting
         self.rect_background: QRect
@@ -65,71 +152,397 @@ class SideBarButton(QPushButton):
         # Set QPushButton properties
         self.setCheckable(True)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.toggled.connect(self._toggledCallback)  # type: ignore[attr-defined]
+        self.pressed.connect(self._updateState)  # type: ignore[attr-defined]
+        self.released.connect(self._updateState)  # type: ignore[attr-defined]
+
+    @Property(int)
+    def fade_duration(self) -> int:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
+        """Returns the duration in milliseconds of the fade between two paint states, zero for instant switches."""
+        return self._fade_duration
+
+    @fade_duration.setter  # type: ignore[no-redef]
+    def fade_duration(self, duration: int) -> None:
+        """Sets the duration in milliseconds of the fade between two paint states, zero for instant switches."""
+        self._fade_duration = max(0, duration)
 
     @Property(QColor)
     def bg_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the background color for the button."""
-        return self._bg_color
+        return self._themeColor("bg_color")
 
     @bg_color.setter  # type: ignore[no-redef]
     def bg_color(self, color: QColor) -> None:
         """Sets the background color for the button."""
-        self._bg_color = color
+        self._setThemeColor("bg_color", color)
 
     @Property(QColor)
     def on_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the background color for the button in active/hovered state."""
-        return self._on_color
+        return self._themeColor("on_color")
 
     @on_color.setter  # type: ignore[no-redef]
     def on_color(self, color: QColor) -> None:
         """Sets the background color for the button in active/hovered state."""
-        self._on_color = color
+        self._setThemeColor("on_color", color)
 
     @Property(QColor)
     def hl_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the highlight color for the left edge of the button in active state."""
-        return self._hl_color
+        return self._themeColor("hl_color")
 
     @hl_color.setter  # type: ignore[no-redef]
     def hl_color(self, color: QColor) -> None:
         """Sets the highlight color for the left edge of the button in active state.."""
-        self._hl_color = color
+        self._setThemeColor("hl_color", color)
 
     @Property(QColor)
     def icon_off_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the icon color for the button in inactive state."""
-        return self._icon_off_color
+        return self._themeColor("icon_off_color")
 
     @icon_off_color.setter  # type: ignore[no-redef]
     def icon_off_color(self, color: QColor) -> None:
         """Sets the icon color for the button in inactive state."""
-        self._icon_off_color = color
+        self._setThemeColor("icon_off_color", color)
 
     @Property(QColor)
     def icon_on_color(self) -> QColor:  # pylint: disable=method-hidden; Method is a property and thus not hidden.
         """Returns the icon color for the button in active/hovered state."""
-        return self._icon_on_color
+        return self._themeColor("icon_on_color")
 
     @icon_on_color.setter  # type: ignore[no-redef]
     def icon_on_color(self, color: QColor) -> None:
         """Returns the icon color for the button in active/hovered state."""
-        self._icon_on_color = color
+        self._setThemeColor("icon_on_color", color)
+
+    def iconPixmap(self) -> QPixmap:
+        """Returns the icon of the button, rasterized at its native size if it was not rasterized yet."""
+        if self._icon.isNull() and self._icon_source is not None:
+            return QPixmap.fromImage(IconRasterizer.rasterize(self._icon_source))
+        return self._icon
+
+    def iconSource(self) -> Optional[IconSource]:
+        """Returns the image or image file path the icon is rasterized from or ``None`` if the icon is a pixmap."""
+        return self._icon_source
+
+    def toolTipText(self) -> Optional[str]:
+        """Returns the text of the tool tip or ``None`` if the button has no tool tip."""
+        return self._tool_tip
 
-    def setParent(self, parent: QWidget) -> None:  # type: ignore[override]
-        """Set parent widget.
+    def state(self) -> "SideBarButton.State":
+        """Returns the paint state of the button."""
+        return self._state
+
+    def repaintStats(self) -> "SideBarButton.RepaintStats":
+        """Returns the number of state transitions, paint events and repainted pixels since the last reset."""
+        return SideBarButton.RepaintStats(*self._counters)
+
+    def resetRepaintStats(self) -> None:
+        """Reset the repaint counters, e.g. before an interaction to measure its repaint cost."""
+        self._counters = [0, 0, 0]
+
+    def badge(self) -> "SideBarButton.Badge":
+        """Returns the badge shown by the button, badges set since the last frame may not be applied yet."""
+        return self._badge_state.shown
+
+    def setBadge(self, count: int = 0, status: Optional[Union[QColor, str]] = None) -> None:
+        """Set the badge of the button, i.e. an unread count and a status dot, or clear it with the default values.
+
+        Safe to call from any thread as long as the button exists, e.g. from workers emitting thousands of updates per
+        second. Updates are coalesced: only the latest badge is applied on the GUI thread and the badge area is
+        repainted at most once per frame.
 
         Args:
-            parent: The parent widget.
+            count: The unread count, no count is shown if it is not positive.
+            status: The color of the status dot or ``None`` for no status. With a count, the count is shown in it.
+        """
+        badge = SideBarButton.Badge(unread=max(0, count), status=QColor(status) if status is not None else None)
+        state = self._badge_state
+        with state.lock:
+            state.pending = badge
+            if state.scheduled:
+                return
+            state.scheduled = True
+        QCoreApplication.postEvent(self, QEvent(_BADGE_EVENT))
+
+    def customEvent(self, event: QEvent) -> None:
+        """Custom event, applies the pending badge.
+
+        Args:
+            event: The event.
+        """
+        if event.type() == _BADGE_EVENT:
+            self._flushBadge()
+        else:
+            super().customEvent(event)
+
+    def enterEvent(self, event: QEnterEvent) -> None:
+        """Enter event
+
+        Show the shared tool tip of the window, unless the button is checked.
+
+        Args:
+            event: The event.
         """
-        super().setParent(parent)
+        super().enterEvent(event)
+        self._hovered = True
+        self._updateState()
+        if self._tool_tip and self._state == SideBarButton.State.HOVER:
+            ToolTip.forWindow(self.window()).showFor(self, self._tool_tip)
+        self.hoveredChanged.emit(True)  # type: ignore[attr-defined]
+
+    def leaveEvent(self, event: QEvent) -> None:
+        """Leave event
+
+        Hide the shared tool tip of the window.
+
+        Args:
+            event: The event.
+        """
+        super().leaveEvent(event)
+        self._hovered = False
+        self._updateState()
         if self._tool_tip:
-            self._tool_tip.setParent(self.window())
+            ToolTip.forWindow(self.window()).hideFor(self)
+        self.hoveredChanged.emit(False)  # type: ignore[attr-defined]
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Mouse press event
+
+        Args:
+            event: The event.
+        """
+        self._withoutRefresh(super().mousePressEvent, event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """Mouse move event
+
+        Args:
+            event: The event.
+        """
+        self._withoutRefresh(super().mouseMoveEvent, event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """Mouse release event
+
+        Args:
+            event: The event.
+        """
+        self._withoutRefresh(super().mouseReleaseEvent, event)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Change event
+
+        Args:
+            event: The event.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.EnabledChange:
+            self._updateState()
+
+    def _toggledCallback(self, checked: bool) -> None:
+        """Toggled callback
+
+        Hide the shared tool tip of the window once the button gets checked.
+
+        Args:
+            checked: Whether the button is checked.
+        """
+        self._updateState()
+        if checked and self._tool_tip:
+            ToolTip.forWindow(self.window()).hideFor(self)
+
+    def _withoutRefresh(self, handler: Callable[[QMouseEvent], None], event: QMouseEvent) -> None:
+        """Run a mouse event handler of ``QPushButton`` without its repaint of the whole button.
+
+        The handler still updates the down state and emits the button signals. Updates of the button are disabled
+        meanwhile and the state machine repaints only the area changed by the resulting transition afterwards.
+
+        Args:
+            handler: The event handler.
+            event: The event.
+        """
+        self._refresh_blocked = True
+        self.setAttribute(Qt.WidgetAttribute.WA_UpdatesDisabled, True)
+        try:
+            handler(event)
+        finally:
+            self.setAttribute(Qt.WidgetAttribute.WA_UpdatesDisabled, False)
+            self._refresh_blocked = False
+        self._updateState()
+
+    def _updateState(self) -> None:
+        """Update the paint state and repaint or fade the area changed by the state transition, if any."""
+        if self._refresh_blocked:
+            return
+        if not self.isEnabled():
+            state = SideBarButton.State.DISABLED
+        elif self.isChecked():
+            state = SideBarButton.State.CHECKED
+        elif self.isDown():
+            state = SideBarButton.State.PRESSED
+        elif self._hovered:
+            state = SideBarButton.State.HOVER
+        else:
+            state = SideBarButton.State.OFF
+        if state == self._state:
+            return
+        previous_state = self._state
+        self._state = state
+        self._counters[0] += 1
+        clock = AnimationClock.instance()
+        if not self.isVisible():
+            # Hidden buttons are painted completely once they are shown
+            self._fade.layers = []
+            clock.stop(self)
+            return
+        self._retargetFade(previous_state, state)
+        clock.start(self, round(self._fade_duration * (1.0 - self._fade.start)), self._fadeStep)
+
+    def _retargetFade(self, previous_state: "SideBarButton.State", state: "SideBarButton.State") -> None:
+        """Start fading to a new state from what the button currently shows.
+
+        Interrupting a fade keeps its blend, so the button never jumps back to a discrete state. Fading back to the
+        state the interrupted fade started from, e.g. on a quick hover in and out, continues from the current opacity.
+
+        Args:
+            previous_state: The paint state faded to so far.
+            state: The new paint state.
+        """
+        fade = self._fade
+        if not fade.layers:
+            fade.layers = [(previous_state, 1.0)]
+            fade.start = 0.0
+        elif len(fade.layers) == 1 and fade.layers[0][0] == state:
+            # Blending the previous state over the new one equals blending the new state over the previous one with
+            # the complementary opacity
+            fade.layers = [(previous_state, 1.0)]
+            fade.start = 1.0 - fade.progress
+        else:
+            layers = (fade.layers + [(previous_state, fade.progress)])[-_MAX_FADE_LAYERS:]
+            layers[0] = (layers[0][0], 1.0)
+            fade.layers = layers
+            fade.start = 0.0
+        fade.progress = fade.start
+
+    def _fadeStep(self, progress: float) -> None:
+        """Fade step, called by the animation clock once per frame while the button is transitioning.
+
+        Args:
+            progress: The linear progress of the fade from 0.0 to 1.0.
+        """
+        fade = self._fade
+        states = {state for state, _ in fade.layers}
+        if not states:
+            return
+        fade.progress = fade.start + (1.0 - fade.start) * (1.0 - (1.0 - progress) ** 3)
+        if progress >= 1.0:
+            fade.layers = []
+        if SideBarButton.State.CHECKED in states or self._state == SideBarButton.State.CHECKED:
+            self.update()
+        else:
+            # The other states only differ in the middle area, which contains the icon
+            self.update(self.rect_active_middle.united(self.rect_icon))
+
+    def _flushBadge(self) -> None:
+        """Apply the pending badge and repaint the badge area, deferred until a frame passed since the last repaint."""
+        state = self._badge_state
+        wait = state.flushed + AnimationClock.frameInterval() / 1000.0 - time.perf_counter()
+        if wait > 0.0:
+            QTimer.singleShot(math.ceil(wait * 1000.0), self, self._flushBadge)
+            return
+        with state.lock:
+            badge = state.pending
+            state.pending = None
+            state.scheduled = False
+        if badge is None or badge == state.shown:
+            return
+        state.flushed = time.perf_counter()
+        previous_badge = state.shown
+        state.shown = badge
+        if self.isVisible():
+            self.update(self._badgeRect(previous_badge).united(self._badgeRect(badge)))
+
+    def _badgeRect(self, badge: "SideBarButton.Badge") -> QRect:
+        """Returns the area of a badge at the top right of the icon, within the middle area of the button.
+
+        Args:
+            badge: The badge, an empty area is returned if it is not shown.
+        """
+        if badge.unread <= 0 and badge.status is None:
+            return QRect()
+        height = max(8, self.rect_icon.height() // 2)
+        text = SideBarButton._badgeText(badge.unread)
+        if text:
+            width = height + (len(text) - 1) * height // 2
+        else:
+            width = height = max(6, height * 2 // 3)
+        middle = self.rect_active_middle
+        left = min(self.rect_icon.right() + 1 - width // 2, middle.right() + 1 - width)
+        return QRect(left, max(self.rect_icon.top() - height // 2, middle.top()), width, height)
+
+    def _drawBadge(self, painter: QPainter, exposed: QRect) -> None:
+        """Draw the badge from the shared pixmap cache.
+
+        Args:
+            painter: The painter to paint the badge with.
+            exposed: The area to repaint.
+        """
+        badge = self._badge_state.shown
+        rect = self._badgeRect(badge)
+        if rect.isEmpty() or not exposed.intersects(rect):
+            return
+        text = SideBarButton._badgeText(badge.unread)
+        colors = (badge.status or self._themeColor("hl_color"), self._themeColor("icon_on_color"))
+        sprite = PixmapCache.instance().pixmap(
+            ("SideBarButton.badge", text, tuple(badge_color.rgba() for badge_color in colors)),
+            rect.size(),
+            self.devicePixelRatioF(),
+            lambda sprite_painter: SideBarButton._renderBadge(sprite_painter, rect.size(), text, colors),
+        )
+        painter.drawPixmap(rect.topLeft(), sprite)
+
+    @staticmethod
+    def _badgeText(count: int) -> str:
+        """Returns the text of a badge count, empty if the count is not shown.
+
+        Args:
+            count: The unread count.
+        """
+        if count <= 0:
+            return ""
+        return str(count) if count <= _MAX_BADGE_COUNT else f"{_MAX_BADGE_COUNT}+"
+
+    @staticmethod
+    def _renderBadge(painter: QPainter, size: QSize, text: str, colors: Tuple[QColor, QColor]) -> None:
+        """Render a badge sprite: a pill, or a dot without text, with the count on it.
+
+        Args:
+            painter: The painter to paint the sprite with.
+            size: The size of the badge.
+            text: The count text of the badge.
+            colors: The badge color and the text color.
+        """
+        badge_color, text_color = colors
+        rect = QRectF(0, 0, size.width(), size.height())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(badge_color)
+        painter.drawRoundedRect(rect, rect.height() / 2, rect.height() / 2)
+        if text:
+            font = QFont("Segoe UI", weight=QFont.Weight.Bold)
+            font.setPixelSize(max(6, size.height() * 3 // 4))
+            painter.setFont(font)
+            painter.setPen(text_color)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
 
     def minimumSizeHint(self) -> QSize:
         """Return default size"""
         return QSize(40, 40)
 
+    @instrumented("resize")
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Resize event
 
@@ -138,87 +551,235 @@ class SideBarButton(QPushButton):
         """
         super().resizeEvent(event)
 
-        radius = self._radius
-        width = self.width()
-        height = self.height()
-        self.rect_background = QRect(0, 0, width, height)
-        # self.rect_icon = QRect(1.5*radius, 1.5*radius, width-3*radius, height-3*radius)
-        self.rect_icon = QRect(width // 4, height // 4, width // 2, height // 2)
-        self.rect_active_left = QRect(radius // 2, radius, 2 * radius, height - 2 * radius)
-        self.rect_active_middle = QRect(radius, radius, width - 2 * radius, height - 2 * radius)
-        self.rect_active_right = QRect(width - 2 * radius, 0, 2 * radius, height)
-        self.rect_active_right_corner_1 = QRect(width - 3 * radius, -radius, 3 * radius, 2 * radius)
-        self.rect_active_right_corner_2 = QRect(width - 3 * radius, height - radius, 3 * radius, 2 * radius)
-
+        (
+            self.rect_background,
+            self.rect_icon,
+            self.rect_active_left,
+            self.rect_active_middle,
+            self.rect_active_right,
+            self.rect_active_right_corner_1,
+            self.rect_active_right_corner_2,
+        ) = SideBarButton._geometry(self.width(), self.height(), self._radius)
+        self._requestIcon()
+
+    @instrumented("paint")
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint event
 
+        Only the exposed area of the button is painted.
+
         Args:
             event: The event.
         """
-        super().paintEvent(event)
+        if self._icon_key is not None and self._icon_key[-1] != self.devicePixelRatioF():
+            self._requestIcon()
+
+        exposed = event.rect()
+        self._counters[1] += 1
+        self._counters[2] += exposed.width() * exposed.height()
 
         painter = QPainter()
         painter.begin(self)
+        # While fading, the new state is blended over the blend the fade started from
+        layers = self._fade.layers + [(self._state, self._fade.progress if self._fade.layers else 1.0)]
+        for state, opacity in layers:
+            painter.setOpacity(opacity)
+            SideBarButton.paintEntry(
+                painter,
+                self.rect(),
+                state,
+                self._icon,
+                self._themeColor,
+                radius=self._radius,
+                device_pixel_ratio=self.devicePixelRatioF(),
+                exposed=exposed,
+            )
+        painter.setOpacity(1.0)
+        self._drawBadge(painter, exposed)
+        painter.end()
+
+    def _requestIcon(self) -> None:
+        """Request the icon rasterized at the current icon size and device pixel ratio.
+
+        Until it is rasterized the previous icon is scaled to the new size.
+        """
+        if self._icon_source is None:
+            return
+        rasterizer = IconRasterizer.instance()
+        size = self.rect_icon.size()
+        device_pixel_ratio = self.devicePixelRatioF()
+        self._icon_key = rasterizer.key(self._icon_source, size, device_pixel_ratio)
+        pixmap = rasterizer.pixmap(self._icon_source, size, device_pixel_ratio, self._iconRasterizedCallback)
+        if pixmap is not None:
+            self._icon = pixmap
+
+    def _iconRasterizedCallback(self, key: Tuple) -> None:
+        """Icon rasterized callback
+
+        Args:
+            key: The key of the rasterized icon.
+        """
+        if key == self._icon_key:
+            self._requestIcon()
+            self.update(self.rect_icon)
+
+    @staticmethod
+    def paintEntry(  # pylint: disable=too-many-arguments; Shared by the button and the side bar item delegate.
+        painter: QPainter,
+        rect: QRect,
+        state: "SideBarButton.State",
+        icon: QPixmap,
+        color: Callable[[str], QColor],
+        *,
+        radius: int,
+        device_pixel_ratio: float,
+        exposed: Optional[QRect] = None,
+    ) -> None:
+        """Paint a side bar entry opaque from two pre-rendered pixmaps of the shared pixmap cache.
+
+        The background sprite of the state is shared by all entries with the same size, radius, colors and device
+        pixel ratio, so it is rendered again automatically after any of them changes. The tinted icon is blitted on
+        top of it. Pressed entries tint the icon with the highlight color, disabled entries draw it translucent. The
+        opacity of the painter is respected, e.g. to blend the entry over another state while fading.
+
+        Args:
+            painter: The painter to paint the entry with.
+            rect: The area of the entry.
+            state: The paint state of the entry.
+            icon: The icon of the entry.
+            color: Returns a side bar button color by its property name.
+            radius: Radius of shape.
+            device_pixel_ratio: The device pixel ratio of the paint device.
+            exposed: The area to repaint, the whole entry by default.
+        """
+        cache = PixmapCache.instance()
+        geometry = SideBarButton._geometry(rect.width(), rect.height(), radius)
+
+        # Draw background
+        colors = (color("bg_color"), color("on_color"), color("hl_color"))
+        sprite = cache.pixmap(
+            ("SideBarButton.background", state, radius, tuple(background.rgba() for background in colors)),
+            rect.size(),
+            device_pixel_ratio,
+            lambda sprite_painter: SideBarButton._drawBackground(sprite_painter, geometry, radius, state, colors),
+        )
+        SideBarButton._drawSprite(painter, rect, sprite, exposed)
+
+        # Draw icon
+        icon_rect = geometry[1].translated(rect.topLeft())
+        if not icon.isNull() and (exposed is None or exposed.intersects(icon_rect)):
+            opacity = painter.opacity()
+            if state == SideBarButton.State.DISABLED:
+                painter.setOpacity(opacity * 0.4)
+            painter.drawPixmap(
+                icon_rect.topLeft(),
+                cache.tintedPixmap(
+                    icon, color(SideBarButton._iconColorName(state)), geometry[1].size(), device_pixel_ratio
+                ),
+            )
+            painter.setOpacity(opacity)
+
+    @staticmethod
+    def _iconColorName(state: "SideBarButton.State") -> str:
+        """Returns the name of the icon color of a paint state.
+
+        Args:
+            state: The paint state.
+        """
+        if state == SideBarButton.State.PRESSED:
+            return "hl_color"
+        if state in (SideBarButton.State.OFF, SideBarButton.State.DISABLED):
+            return "icon_off_color"
+        return "icon_on_color"
+
+    @staticmethod
+    def _drawSprite(painter: QPainter, rect: QRect, sprite: QPixmap, exposed: Optional[QRect]) -> None:
+        """Draw the exposed part of a sprite.
+
+        Args:
+            painter: The painter to paint the sprite with.
+            rect: The area of the sprite.
+            sprite: The sprite.
+            exposed: The area to repaint or ``None`` to draw the whole sprite.
+        """
+        if exposed is None or exposed.contains(rect):
+            painter.drawPixmap(rect.topLeft(), sprite)
+            return
+        exposed = exposed.intersected(rect)
+        source = exposed.translated(-rect.topLeft())
+        device_pixel_ratio = sprite.devicePixelRatio()
+        painter.drawPixmap(
+            QRectF(exposed),
+            sprite,
+            QRectF(
+                source.x() * device_pixel_ratio,
+                source.y() * device_pixel_ratio,
+                source.width() * device_pixel_ratio,
+                source.height() * device_pixel_ratio,
+            ),
+        )
+
+    @staticmethod
+    def _geometry(width: int, height: int, radius: int) -> Tuple[QRect, QRect, QRect, QRect, QRect, QRect, QRect]:
+        """Returns the areas for painting.
+
+        Args:
+            width: The width of the button.
+            height: The height of the button.
+            radius: Radius of shape.
+
+        Returns:
+            The background, icon, active left, active middle, active right and both right corner areas.
+        """
+        return (
+            QRect(0, 0, width, height),
+            QRect(width // 4, height // 4, width // 2, height // 2),
+            QRect(radius // 2, radius, 2 * radius, height - 2 * radius),
+            QRect(radius, radius, width - 2 * radius, height - 2 * radius),
+            QRect(width - 2 * radius, 0, 2 * radius, height),
+            QRect(width - 3 * radius, -radius, 3 * radius, 2 * radius),
+            QRect(width - 3 * radius, height - radius, 3 * radius, 2 * radius),
+        )
+
+    @staticmethod
+    def _drawBackground(
+        painter: QPainter,
+        geometry: Tuple[QRect, ...],
+        radius: int,
+        state: "SideBarButton.State",
+        colors: Tuple[QColor, QColor, QColor],
+    ) -> None:
+        """Draw the side bar button background
+
+        Args:
+            painter: The painter to paint the background with.
+            geometry: The areas for painting, see :meth:`_geometry`.
+            radius: Radius of shape.
+            state: The button state.
+            colors: The background color, the background color in active/hovered state and the highlight color.
+        """
+        bg_color, on_color, hl_color = colors
+        rect_background, _, rect_left, rect_middle, rect_right, rect_corner_1, rect_corner_2 = geometry
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.PenStyle.NoPen)
 
         # Draw background
-        painter.setBrush(self._bg_color)
-        painter.drawRect(self.rect_background)
+        painter.setBrush(bg_color)
+        painter.drawRect(rect_background)
 
-        if self.isChecked():
+        if state == SideBarButton.State.CHECKED:
             # Draw left highlight area
-            painter.setBrush(self._hl_color)
-            painter.drawRoundedRect(self.rect_active_left, self._radius, self._radius)
+            painter.setBrush(hl_color)
+            painter.drawRoundedRect(rect_left, radius, radius)
             # Draw middle and right active area
-            painter.setBrush(self._on_color)
-            painter.drawRoundedRect(self.rect_active_middle, self._radius, self._radius)
-            painter.setBrush(self._on_color)
-            painter.drawRect(self.rect_active_right)
+            painter.setBrush(on_color)
+            painter.drawRoundedRect(rect_middle, radius, radius)
+            painter.drawRect(rect_right)
             # Draw right corners area (background)
-            painter.setBrush(self._bg_color)
-            painter.drawRoundedRect(self.rect_active_right_corner_1, self._radius, self._radius)
-            painter.drawRoundedRect(self.rect_active_right_corner_2, self._radius, self._radius)
-            # Draw icon
-            self._drawIcon(painter, self.rect_icon, self._icon_on_color)
-            # Hide tool tip
-            if self._tool_tip:
-                self._tool_tip.hide()
-        elif self.underMouse():
+            painter.setBrush(bg_color)
+            painter.drawRoundedRect(rect_corner_1, radius, radius)
+            painter.drawRoundedRect(rect_corner_2, radius, radius)
+        elif state in (SideBarButton.State.HOVER, SideBarButton.State.PRESSED):
             # Draw middle active area
-            painter.setBrush(self._on_color)
-            painter.drawRoundedRect(self.rect_active_middle, self._radius, self._radius)
-            # Draw icon
-            self._drawIcon(painter, self.rect_icon, self._icon_on_color)
-            # Show tool tip
-            if self._tool_tip:
-                button_pos = self.window().mapFromGlobal(self.mapToGlobal(self.rect().topLeft()))
-                tool_tip_x = button_pos.x() + self.width() + 5
-                tool_tip_y = button_pos.y() + self.height() // 2 - self._tool_tip.height() // 2
-                self._tool_tip.move(tool_tip_x, tool_tip_y)
-                self._tool_tip.show()
-        else:
-            # Draw icon
-            self._drawIcon(painter, self.rect_icon, self._icon_off_color)
-            # Hide tool tip
-            if self._tool_tip:
-                self._tool_tip.hide()
-
-        painter.end()
-
-    def _drawIcon(self, painter: QPainter, rect: QRect, color: QColor) -> None:
-        """Draw the side bar button icon
-
-        Args:
-            painter: The painter to paint the icon with.
-            rect: The size of the icon.
-            color: The color of the icon.
-        """
-        pixmap = QPixmap(self._icon)
-        pixmap_painter = QPainter(pixmap)
-        pixmap_painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        pixmap_painter.fillRect(pixmap.rect(), color)
-        pixmap_painter.end()
-        icon = QIcon(pixmap)
-        icon.paint(painter, rect)
+            painter.setBrush(on_color)
+            painter.drawRoundedRect(rect_middle, radius, radius)
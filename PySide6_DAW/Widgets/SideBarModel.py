@@ -0,0 +1,80 @@
+"""Side bar model class implementation."""
+
+from typing import Any, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+from PySide6.QtGui import QPixmap
+
+from PySide6_DAW.Utils.IconRasterizer import IconSource
+from PySide6_DAW.Widgets.SideBarButton import SideBarButton
+
+
+class SideBarModel(QAbstractListModel):
+    """List model of side bar entries
+
+    Any list model can back a side bar (see :meth:`SideBar.setModel`), as long as it provides the icon of an entry as
+    ``QPixmap`` or as :data:`IconSource`, i.e. an image or image file path rasterized in the background, for
+    ``Qt.DecorationRole``, its tool tip text for ``Qt.ToolTipRole`` and its alignment as
+    ``SideBarButton.Alignment`` for :attr:`AlignmentRole`. This model is a simple implementation storing the entries.
+    """
+
+    #: Item data role for the alignment of an entry within the side bar
+    AlignmentRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._entries: List[Tuple[Union[QPixmap, IconSource], Optional[str], SideBarButton.Alignment]] = []
+
+    def appendEntry(
+        self,
+        icon: Union[QPixmap, IconSource],
+        tool_tip: Optional[str] = None,
+        alignment: SideBarButton.Alignment = SideBarButton.Alignment.TOP,
+    ) -> int:
+        """Append a new entry.
+
+        Args:
+            icon: The icon of the entry, a pixmap or an icon source rasterized in the background at the entry size.
+            tool_tip: Text for the tool tip.
+            alignment: The alignment of the entry within the side bar.
+
+        Returns:
+            The row of the new entry.
+        """
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append((icon, tool_tip, alignment))
+        self.endInsertRows()
+        return row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        """Returns the number of entries.
+
+        Args:
+            parent: The parent index, entries have no children.
+        """
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        """Returns the data of an entry.
+
+        Args:
+            index: The index of the entry.
+            role: The item data role.
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self._entries):
+            return None
+        icon, tool_tip, alignment = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return icon
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tool_tip
+        if role == SideBarModel.AlignmentRole:
+            return alignment
+        return None
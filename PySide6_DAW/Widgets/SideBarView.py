@@ -0,0 +1,306 @@
+"""Side bar view class implementation."""
+
+import os
+from typing import Any, Optional, Tuple, Union
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QResizeEvent
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from PySide6_DAW.Utils.IconRasterizer import IconRasterizer
+from PySide6_DAW.Utils.Theme import Themed
+from PySide6_DAW.Widgets.SideBarButton import SideBarButton
+from PySide6_DAW.Widgets.SideBarModel import SideBarModel
+from PySide6_DAW.Widgets.ToolTip import ToolTip
+
+
+class _AlignmentFilterModel(QSortFilterProxyModel):
+    """Proxy model accepting the side bar entries with a single alignment"""
+
+    def __init__(self, alignment: SideBarButton.Alignment, parent: Optional[QObject] = None) -> None:
+        """Constructor
+
+        Args:
+            alignment: The alignment of the accepted entries.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+
+        self._alignment = alignment
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # type: ignore[override]
+        """Returns whether the entry has the accepted alignment, entries without alignment are aligned at the top.
+
+        Args:
+            source_row: The row of the entry in the source model.
+            source_parent: The parent index in the source model.
+        """
+        alignment = self.sourceModel().index(source_row, 0, source_parent).data(SideBarModel.AlignmentRole)
+        return (alignment or SideBarButton.Alignment.TOP) == self._alignment
+
+
+class _SideBarDelegate(QStyledItemDelegate):
+    """Item delegate painting side bar entries like side bar buttons"""
+
+    def __init__(self, view: "SideBarView") -> None:
+        """Constructor
+
+        Args:
+            view: The side bar view.
+        """
+        super().__init__(view)
+
+        self._view = view
+
+    def sizeHint(  # pylint: disable=unused-argument; All entries have the same size.
+        self, option: QStyleOptionViewItem, index: Union[QModelIndex, QPersistentModelIndex]
+    ) -> QSize:
+        """Returns the size of an entry, entries are square and span the whole view width.
+
+        Args:
+            option: The style options.
+            index: The index of the entry.
+        """
+        width = self._view.viewport().width()
+        return QSize(width, width)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: Union[QModelIndex, QPersistentModelIndex]
+    ) -> None:
+        """Paint an entry.
+
+        Args:
+            painter: The painter.
+            option: The style options.
+            index: The index of the entry.
+        """
+        if self._view.sourceRow(index) == self._view.currentRow():
+            state = SideBarButton.State.CHECKED
+        elif option.state & QStyle.StateFlag.State_MouseOver:  # type: ignore[attr-defined]
+            state = SideBarButton.State.HOVER
+        else:
+            state = SideBarButton.State.OFF
+
+        rect = option.rect  # type: ignore[attr-defined]
+        icon = self._view.entryIcon(
+            index.data(Qt.ItemDataRole.DecorationRole), QSize(rect.width() // 2, rect.height() // 2)
+        )
+        SideBarButton.paintEntry(
+            painter,
+            rect,
+            state,
+            icon,
+            self._view.entryColor,
+            radius=self._view.radius(),
+            device_pixel_ratio=self._view.devicePixelRatioF(),
+        )
+
+
+class SideBarView(Themed, QListView):
+    """View of the side bar entries with a single alignment
+
+    Only the visible entries are painted, by an item delegate reusing the side bar button sprites, so memory stays
+    constant with the number of entries. The view takes its colors from the ``SideBarButton`` section of the theme.
+
+    Signals:
+        entryClicked: Emitted with the source model row of a clicked entry.
+        entryHovered: Emitted with the source model row of a hovered entry or -1 when the pointer leaves the entries.
+    """
+
+    entryClicked = Signal(int)
+    entryHovered = Signal(int)
+
+    theme_section = "SideBarButton"
+
+    def __init__(self, alignment: SideBarButton.Alignment, radius: int = 8, parent: Optional[QWidget] = None) -> None:
+        """Constructor
+
+        Args:
+            alignment: The alignment of the shown entries.
+            radius: Radius of shape.
+            parent: The parent widget.
+        """
+        super().__init__(parent)
+
+        self._radius = radius
+        self._current_row = -1
+        self._proxy_model = _AlignmentFilterModel(alignment, self)
+        self._initTheme()
+
+        self.setModel(self._proxy_model)
+        self.setItemDelegate(_SideBarDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.viewport().setAutoFillBackground(False)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+        self.clicked.connect(self._clickedCallback)  # type: ignore[attr-defined]
+        self.entered.connect(self._enteredCallback)  # type: ignore[attr-defined]
+
+    def setSourceModel(self, model: QAbstractItemModel) -> None:
+        """Set the model holding the side bar entries.
+
+        Args:
+            model: The model.
+        """
+        self._proxy_model.setSourceModel(model)
+
+    def radius(self) -> int:
+        """Returns the radius of shape."""
+        return self._radius
+
+    def entryColor(self, name: str) -> QColor:
+        """Returns a side bar button color of the theme.
+
+        Args:
+            name: The name of the color.
+        """
+        return self._themeColor(name)
+
+    def entryIcon(self, icon: Any, size: QSize) -> QPixmap:
+        """Returns the icon of an entry to paint.
+
+        Icon sources, i.e. images and image file paths, are rasterized at the icon size by the shared
+        :class:`IconRasterizer` in the background. Entries with the same icon source share the rasterized pixmap. Until
+        it is rasterized, the entry is painted without icon and the visible entries are repainted once it is.
+
+        Args:
+            icon: The decoration of the entry, a pixmap or an icon source.
+            size: The size of the icon in device independent pixels.
+        """
+        if isinstance(icon, QPixmap):
+            return icon
+        if isinstance(icon, (QImage, str, os.PathLike)):
+            rasterizer = IconRasterizer.instance()
+            pixmap = rasterizer.pixmap(icon, size, self.devicePixelRatioF(), self._iconRasterizedCallback)
+            if pixmap is not None:
+                return pixmap
+        return QPixmap()
+
+    def sourceRow(self, index: Union[QModelIndex, QPersistentModelIndex]) -> int:
+        """Returns the source model row of an entry.
+
+        Args:
+            index: The index of the entry in the view.
+        """
+        return self._proxy_model.mapToSource(index).row()
+
+    def currentRow(self) -> int:
+        """Returns the source model row of the selected entry or -1 if no entry of this view is selected."""
+        return self._current_row
+
+    def setCurrentRow(self, row: int) -> None:
+        """Select an entry and repaint the previously and the newly selected entry.
+
+        Args:
+            row: The source model row of the entry, may belong to another view.
+        """
+        previous_row = self._current_row
+        self._current_row = row
+        for source_row in (previous_row, row):
+            source_model = self._proxy_model.sourceModel()
+            if source_row >= 0 and source_model is not None:
+                index = self._proxy_model.mapFromSource(source_model.index(source_row, 0))
+                if index.isValid():
+                    self.update(index)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Resize event
+
+        Args:
+            event: The event.
+        """
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self.scheduleDelayedItemsLayout()
+
+    def viewportEvent(self, event: QEvent) -> bool:
+        """Viewport event
+
+        Hide the shared tool tip when the mouse leaves the view and suppress the default item tool tips.
+
+        Args:
+            event: The event.
+
+        Returns:
+            Whether the event was handled.
+        """
+        if event.type() == QEvent.Type.ToolTip:
+            return True
+        if event.type() == QEvent.Type.Leave:
+            ToolTip.forWindow(self.window()).hideFor(self.viewport())
+            self.entryHovered.emit(-1)  # type: ignore[attr-defined]
+        return super().viewportEvent(event)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """Scroll the view and hide the shared tool tip.
+
+        Args:
+            dx: The horizontal scroll distance.
+            dy: The vertical scroll distance.
+        """
+        super().scrollContentsBy(dx, dy)
+        ToolTip.forWindow(self.window()).hideFor(self.viewport())
+        self.entryHovered.emit(-1)  # type: ignore[attr-defined]
+
+    def _themeChanged(self) -> None:
+        """Theme changed callback, schedules a repaint of the visible entries."""
+        self.viewport().update()
+
+    def _iconRasterizedCallback(self, key: Tuple) -> None:  # pylint: disable=unused-argument; Any icon repaints.
+        """Icon rasterized callback, schedules a repaint of the visible entries.
+
+        Args:
+            key: The key of the rasterized icon.
+        """
+        self.viewport().update()
+
+    def _clickedCallback(self, index: QModelIndex) -> None:
+        """Clicked callback
+
+        Args:
+            index: The index of the clicked entry.
+        """
+        ToolTip.forWindow(self.window()).hideFor(self.viewport())
+        self.entryClicked.emit(self.sourceRow(index))  # type: ignore[attr-defined]
+
+    def _enteredCallback(self, index: QModelIndex) -> None:
+        """Entered callback
+
+        Show the shared tool tip next to the hovered entry, unless the entry is selected.
+
+        Args:
+            index: The index of the hovered entry.
+        """
+        tool_tip = ToolTip.forWindow(self.window())
+        text = index.data(Qt.ItemDataRole.ToolTipRole)
+        if text and self.sourceRow(index) != self._current_row:
+            tool_tip.showFor(self.viewport(), text, self.visualRect(index))
+        else:
+            tool_tip.hideFor(self.viewport())
+        self.entryHovered.emit(self.sourceRow(index))  # type: ignore[attr-defined]
@@ -2,30 +2,38 @@
 
 from typing import Optional
 
-from PySide6.QtCore import Property, Qt
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QGridLayout, QLabel, QWidget
-
-#: Template for label stylesheet
-_LABEL_STYLESHEET = """\
-QLabel {{
-    color: {text_color};
-    background-color: {bg_color};
-    padding-left: 10px;
-    padding-right: 10px;
-    border-radius: 15px;
-    border: none;
-    border-left: 3px solid {hl_color};
-    font: 800 9pt Segoe UI;
-}}
-"""
+from PySide6.QtCore import Property, QRect, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPaintEvent
+from PySide6.QtWidgets import QWidget
+
+from PySide6_DAW.Utils.Instrumentation import instrumented
+from PySide6_DAW.Utils.Theme import Themed
+
+#: Horizontal padding between the tool tip border and its text
+_PADDING = 10
+
+#: Width of the highlighted left border
+_BORDER_WIDTH = 3
+
+#: Minimum height and corner radius of the tool tip
+_MIN_HEIGHT = 30
+_RADIUS = 15
+
+#: Object name of the tool tip shared by all widgets of a window
+_SHARED_OBJECT_NAME = "shared_tool_tip"
 
 
 # pylint: disable=duplicate-code; Properties appear in several widgets.
-class ToolTip(QWidget):
-    """Tool tip widget"""
+class ToolTip(Themed, QWidget):
+    """Tool tip widget
 
-    def __init__(self, text: str, parent: Optional[QWidget] = None) -> None:
+    A single tool tip per window is shared by all side bar buttons of the window, see :meth:`forWindow`. The buttons
+    show it on hover via :meth:`showFor` and hide it via :meth:`hideFor`.
+    """
+
+    theme_section = "ToolTip"
+
+    def __init__(self, text: str = "", parent: Optional[QWidget] = None) -> None:
         """Constructor
 
         Args:
@@ -34,62 +42,159 @@ class ToolTip(QWidget):
         """
         super().__init__(parent)
 
-        self._layout = QGridLayout(self)
-        self._layout.setContentsMargins(0, 0, 0, 0)
-        self._layout.setSpacing(0)
-
-        self._label = QLabel(self)
-        self._layout.addWidget(self._label)
-
-        # Define colors and set default values
-        self._bg_color = QColor("#191E23")
-        self._hl_color = QColor("#0066FF")
-        self._text_color = QColor("#A0A0A0")
-        self._setStyle()
-
-        self._label.setMinimumHeight(30)
-        self._label.setText(text)
-        self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._label.adjustSize()
-        self.setFixedSize(self._label.size())
-
-    def _setStyle(self) -> None:
-        """Apply stylesheet."""
-        self._label.setStyleSheet(
-            _LABEL_STYLESHEET.format(
-                text_color=self._text_color.name(), bg_color=self._bg_color.name(), hl_color=self._hl_color.name()
-            )
+        self._owner: Optional[QWidget] = None
+        self._owner_rect = QRect()
+        self._show_delay = 0
+        self._show_timer = QTimer(self)
+        self._show_timer.setSingleShot(True)
+        self._show_timer.timeout.connect(self._showTimerCallback)  # type: ignore[attr-defined]
+
+        self._text = ""
+        self._font = QFont("Segoe UI", 9, QFont.Weight.ExtraBold)
+        self._initTheme()
+        self.setText(text)
+
+    @classmethod
+    def forWindow(cls, window: QWidget) -> "ToolTip":
+        """Returns the tool tip shared by all widgets of a window and create it if necessary.
+
+        Args:
+            window: The top-level window.
+        """
+        tool_tip = window.findChild(cls, _SHARED_OBJECT_NAME, Qt.FindChildOption.FindDirectChildrenOnly)
+        if tool_tip is None:
+            tool_tip = cls(parent=window)
+            tool_tip.setObjectName(_SHARED_OBJECT_NAME)
+            tool_tip.hide()
+        return tool_tip
+
+    def text(self) -> str:
+        """Returns the text of the tool tip."""
+        return self._text
+
+    def setText(self, text: str) -> None:
+        """Set the text of the tool tip and resize the tool tip to fit it.
+
+        Args:
+            text: The text of the tool tip.
+        """
+        self._text = text
+        font_metrics = QFontMetrics(self._font)
+        width = font_metrics.horizontalAdvance(text) + 2 * _PADDING + _BORDER_WIDTH
+        self.setFixedSize(width, max(_MIN_HEIGHT, font_metrics.height()))
+        self.update()
+
+    def showFor(self, widget: QWidget, text: str, rect: Optional[QRect] = None) -> None:
+        """Show the tool tip next to a widget after the show delay.
+
+        Args:
+            widget: The widget the tool tip belongs to.
+            text: The text of the tool tip.
+            rect: The area within the widget the tool tip belongs to, e.g. an item of a view, or ``None`` for the
+                whole widget.
+        """
+        self._owner = widget
+        self._owner_rect = rect if rect is not None else widget.rect()
+        if text != self._text:
+            self.setText(text)
+        if self._show_delay > 0:
+            self.hide()
+            self._show_timer.start(self._show_delay)
+        else:
+            self._showTimerCallback()
+
+    def hideFor(self, widget: QWidget) -> None:
+        """Hide the tool tip if it is shown or about to be shown for the given widget.
+
+        Args:
+            widget: The widget the tool tip belongs to.
+        """
+        if self._owner is widget:
+            self._owner = None
+            self._show_timer.stop()
+            self.hide()
+
+    def _showTimerCallback(self) -> None:
+        """Show timer callback
+
+        Move the tool tip to the right of its widget and show it.
+        """
+        owner = self._owner
+        parent = self.parentWidget()
+        if owner is None or parent is None:
+            return
+        rect = self._owner_rect
+        owner_pos = owner.mapTo(parent, rect.topLeft())
+        self.move(owner_pos.x() + rect.width() + 5, owner_pos.y() + rect.height() // 2 - self.height() // 2)
+        self.raise_()
+        self.show()
+
+    @instrumented("paint")
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint event
+
+        Args:
+            event: The event.
+        """
+        super().paintEvent(event)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Draw highlighted left border and background
+        rect = self.rect()
+        painter.setBrush(self._themeColor("hl_color"))
+        painter.drawRoundedRect(rect, _RADIUS, _RADIUS)
+        painter.setBrush(self._themeColor("bg_color"))
+        painter.drawRoundedRect(rect.adjusted(_BORDER_WIDTH, 0, 0, 0), _RADIUS, _RADIUS)
+
+        # Draw text
+        painter.setFont(self._font)
+        painter.setPen(self._themeColor("text_color"))
+        painter.drawText(
+            rect.adjusted(_BORDER_WIDTH + _PADDING, 0, -_PADDING, 0), Qt.AlignmentFlag.AlignCenter, self._text
         )
 
+        painter.end()
+
+    @Property(int)
+    def show_delay(self) -> int:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
+        """Returns the delay in milliseconds between hovering a widget and showing the tool tip."""
+        return self._show_delay
+
+    @show_delay.setter  # type: ignore[no-redef]
+    def show_delay(self, delay: int) -> None:
+        """Sets the delay in milliseconds between hovering a widget and showing the tool tip."""
+        self._show_delay = delay
+
     @Property(QColor)
     def bg_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
-        """Returns the background color for the side bar."""
-        return self._bg_color
+        """Returns the background color of the tool tip."""
+        return self._themeColor("bg_color")
 
     @bg_color.setter  # type: ignore[no-redef]
     def bg_color(self, color: QColor) -> None:
-        """Sets the background color for the side bar."""
-        self._bg_color = color
-        self._setStyle()
+        """Sets the background color of the tool tip."""
+        self._setThemeColor("bg_color", color)
 
     @Property(QColor)
     def hl_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
-        """Returns the background color for the side bar."""
-        return self._hl_color
+        """Returns the highlight color of the left border of the tool tip."""
+        return self._themeColor("hl_color")
 
     @hl_color.setter  # type: ignore[no-redef]
     def hl_color(self, color: QColor) -> None:
-        """Sets the background color for the side bar."""
-        self._hl_color = color
-        self._setStyle()
+        """Sets the highlight color of the left border of the tool tip."""
+        self._setThemeColor("hl_color", color)
 
     @Property(QColor)
     def text_color(self) -> QColor:  # pylint: disable=method-hidden; Method is not hidden, as it is a property.
-        """Returns the background color for the side bar."""
-        return self._text_color
+        """Returns the text color of the tool tip."""
+        return self._themeColor("text_color")
 
     @text_color.setter  # type: ignore[no-redef]
     def text_color(self, color: QColor) -> None:
-        """Sets the background color for the side bar."""
-        self._text_color = color
-        self._setStyle()
+        """Sets the text color of the tool tip."""
+        self._setThemeColor("text_color", color)
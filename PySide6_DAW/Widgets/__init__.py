@@ -1,10 +1,37 @@
 """Widgets module
 
-Imports classes from their modules to shorten the namespace.
+Imports classes from their modules to shorten the namespace. The modules are imported on first access of a class, so
+importing the package itself does not import Qt.
 """
 
+from typing import TYPE_CHECKING
 
-from PySide6_DAW.Widgets.DesktopApplication import DesktopApplication
-from PySide6_DAW.Widgets.SideBar import SideBar
-from PySide6_DAW.Widgets.SideBarButton import SideBarButton
-from PySide6_DAW.Widgets.ToolTip import ToolTip
+from PySide6_DAW.Utils.LazyImport import lazyImport
+
+if TYPE_CHECKING:
+    from PySide6_DAW.Widgets.DesktopApplication import DesktopApplication
+    from PySide6_DAW.Widgets.LoadingPage import LoadingPage
+    from PySide6_DAW.Widgets.PageLoader import PageLoader
+    from PySide6_DAW.Widgets.PagePrefetcher import PagePrefetcher
+    from PySide6_DAW.Widgets.QuickSwitcher import QuickSwitcher
+    from PySide6_DAW.Widgets.SideBar import SideBar
+    from PySide6_DAW.Widgets.SideBarButton import SideBarButton
+    from PySide6_DAW.Widgets.SideBarModel import SideBarModel
+    from PySide6_DAW.Widgets.SideBarView import SideBarView
+    from PySide6_DAW.Widgets.ToolTip import ToolTip
+
+lazyImport(
+    __name__,
+    {
+        "DesktopApplication": "PySide6_DAW.Widgets.DesktopApplication",
+        "LoadingPage": "PySide6_DAW.Widgets.LoadingPage",
+        "PageLoader": "PySide6_DAW.Widgets.PageLoader",
+        "PagePrefetcher": "PySide6_DAW.Widgets.PagePrefetcher",
+        "QuickSwitcher": "PySide6_DAW.Widgets.QuickSwitcher",
+        "SideBar": "PySide6_DAW.Widgets.SideBar",
+        "SideBarButton": "PySide6_DAW.Widgets.SideBarButton",
+        "SideBarModel": "PySide6_DAW.Widgets.SideBarModel",
+        "SideBarView": "PySide6_DAW.Widgets.SideBarView",
+        "ToolTip": "PySide6_DAW.Widgets.ToolTip",
+    },
+)
@@ -0,0 +1,1061 @@
+"""Headless benchmark suite for the PySide6-DAW widgets.
+
+Run with ``python -m benchmarks``. The suite uses the ``offscreen`` Qt platform unless ``QT_QPA_PLATFORM`` is set,
+writes machine-readable results with ``--output`` and compares them against earlier results with ``--baseline``.
+"""
+
+# pylint: disable=too-many-lines; The benchmark suite is kept in a single module.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Optional, Union
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# pylint: disable=wrong-import-position; The Qt platform must be selected before Qt is imported.
+import PySide6
+from PySide6.QtCore import QEvent, QEventLoop, QPointF, QTimer
+from PySide6.QtGui import QColor, QEnterEvent, QPixmap
+from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QVBoxLayout, QWidget
+
+from PySide6_DAW.Utils import AnimationClock, SearchIndex, StallWatchdog, Theme, ThemeFile
+from PySide6_DAW.Widgets import DesktopApplication, PageLoader, SideBar, SideBarButton, SideBarModel, SideBarView
+
+#: Icon used by all benchmarks
+_ICON_PATH = Path(__file__).parent.parent.joinpath("example", "settings.svg")
+
+#: Theme style sheets used by the theme benchmarks
+_STYLE_PATHS = [Path(__file__).parent.parent.joinpath("example", name) for name in ("style.qss", "style2.qss")]
+
+#: Signature of a benchmark: takes the number of rounds and returns the duration of each round in seconds
+Benchmark = Callable[[int], List[float]]
+
+#: Registered benchmarks by name
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+#: Absolute budgets for the median duration in microseconds by benchmark name
+_BUDGETS: Dict[str, float] = {}
+
+#: Minimum number of samples of benchmarks which run several operations per sample, so the median is not a single run
+_MIN_ROUNDS = 5
+
+
+def benchmark(name: str, budget_us: Optional[float] = None) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark.
+
+    Args:
+        name: The unique name of the benchmark.
+        budget_us: Budget for the median duration in microseconds, exceeding it fails the run like a regression.
+
+    Returns:
+        Decorator registering the benchmark.
+    """
+
+    def decorator(function: Benchmark) -> Benchmark:
+        _BENCHMARKS[name] = function
+        if budget_us is not None:
+            _BUDGETS[name] = budget_us
+        return function
+
+    return decorator
+
+
+def measure(function: Callable[[], None], rounds: int) -> List[float]:
+    """Measure the duration of a function.
+
+    Args:
+        function: The function to measure.
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def createDesktopApplication(num_pages: int) -> DesktopApplication:
+    """Create and show a desktop application with simple pages.
+
+    Args:
+        num_pages: The number of pages.
+
+    Returns:
+        The desktop application.
+    """
+    icon = QPixmap(str(_ICON_PATH))
+    desktop_application = DesktopApplication()
+    desktop_application.resize(800, 600)
+    for index in range(num_pages):
+        alignment = SideBarButton.Alignment.TOP if index % 2 == 0 else SideBarButton.Alignment.BOTTOM
+        desktop_application.addPage(SideBarButton(icon, f"Page {index}"), alignment, QWidget())
+    desktop_application.show()
+    QApplication.processEvents()
+    return desktop_application
+
+
+def createSideBar(num_buttons: int, model: bool = False, icon_file: bool = False) -> SideBar:
+    """Create and show a side bar.
+
+    Args:
+        num_buttons: The number of side bar buttons.
+        model: Whether the side bar is backed by a model instead of holding side bar buttons.
+        icon_file: Whether the buttons rasterize their icon from the icon file instead of taking a pixmap.
+
+    Returns:
+        The side bar.
+    """
+    icon: Union[QPixmap, Path] = _ICON_PATH if icon_file else QPixmap(str(_ICON_PATH))
+    side_bar = SideBar()
+    if model:
+        side_bar.setModel(SideBarModel(side_bar))
+    for index in range(num_buttons):
+        side_bar.addButton(SideBarButton(icon, f"Button {index}"), SideBarButton.Alignment.TOP)
+    side_bar.resize(60, 600)
+    side_bar.show()
+    QApplication.processEvents()
+    return side_bar
+
+
+def _paintBenchmark(state: str) -> Benchmark:
+    """Create a benchmark for repainting a side bar button in the given state.
+
+    Args:
+        state: The button state, one of ``off``, ``hover`` and ``checked``.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        side_bar = createSideBar(2)
+        button = side_bar.button(1)
+        assert button is not None
+        button.setProperty("fade_duration", 0)
+        button.setChecked(state == "checked")
+        if state == "hover":
+            QApplication.sendEvent(button, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+        durations = measure(button.repaint, rounds)
+        side_bar.close()
+        return durations
+
+    return run
+
+
+for _state in ("off", "hover", "checked"):
+    benchmark(f"SideBarButton.paintEvent[{_state}]")(_paintBenchmark(_state))
+
+
+@benchmark("SideBarButton.hover[enter, leave]")
+def hoverSideBarButton(rounds: int) -> List[float]:
+    """Measure moving the mouse onto and off a side bar button, including the repaints of both state transitions.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    side_bar = createSideBar(2)
+    button = side_bar.button(1)
+    assert button is not None
+    button.setProperty("fade_duration", 0)
+
+    def hover() -> None:
+        QApplication.sendEvent(button, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+        QApplication.processEvents()
+        QApplication.sendEvent(button, QEvent(QEvent.Type.Leave))
+        QApplication.processEvents()
+
+    durations = measure(hover, rounds)
+    side_bar.close()
+    return durations
+
+
+@benchmark("AnimationClock.frame[fade, 20 buttons]")
+def fadeFrame(rounds: int) -> List[float]:
+    """Measure the CPU time per frame of the shared animation clock while 20 side bar buttons fade at once.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The CPU time per frame of each fade in seconds.
+    """
+    side_bar = createSideBar(20)
+    buttons = [button for button in map(side_bar.button, range(1, side_bar.count())) if button is not None]
+    clock = AnimationClock.instance()
+    durations = []
+    for round_index in range(max(1, rounds // 10)):
+        for button in buttons:
+            if round_index % 2 == 0:
+                QApplication.sendEvent(button, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+            else:
+                QApplication.sendEvent(button, QEvent(QEvent.Type.Leave))
+        frames = clock.frameCount()
+        start = time.process_time()
+        while clock.isTicking():
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+        QApplication.processEvents()
+        durations.append((time.process_time() - start) / max(1, clock.frameCount() - frames))
+    side_bar.close()
+    return durations
+
+
+def _badgeBenchmark(rate: Optional[int]) -> Benchmark:
+    """Create a benchmark for a worker thread updating the badge of a side bar button.
+
+    Args:
+        rate: The number of badge updates per second or ``None`` to update the badge as fast as possible.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        button = SideBarButton(QPixmap(str(_ICON_PATH)), "Inbox")
+        button.resize(60, 60)
+        button.show()
+        QApplication.processEvents()
+        button.resetRepaintStats()
+        durations = []
+        updates = [0]
+        for _ in range(max(1, rounds // 10)):
+            stop = threading.Event()
+
+            def update(stop: threading.Event) -> None:
+                deadline = time.perf_counter()
+                while not stop.is_set():
+                    updates[0] += 1
+                    button.setBadge(updates[0], "#2ecc71" if updates[0] % 2 else None)
+                    if rate is not None:
+                        deadline += 1.0 / rate
+                        ahead = deadline - time.perf_counter()
+                        if ahead > 0.001:
+                            time.sleep(ahead)
+
+            worker = threading.Thread(target=update, args=(stop,))
+            loop = QEventLoop()
+            QTimer.singleShot(100, loop.quit)
+            start = time.thread_time()
+            worker.start()
+            loop.exec()
+            durations.append(time.thread_time() - start)
+            stop.set()
+            worker.join()
+        QApplication.processEvents()
+        print(f"  badge updates: {updates[0]}, repaints: {button.repaintStats().repaints}")
+        button.close()
+        return durations
+
+    return run
+
+
+for _rate in (100, 1000, 10000, None):
+    benchmark(f"SideBarButton.setBadge[{f'{_rate}/s' if _rate else 'unthrottled'}, GUI CPU/100 ms]")(
+        _badgeBenchmark(_rate)
+    )
+
+
+def _watchdogBenchmark(enabled: bool) -> Benchmark:
+    """Create a benchmark for the GUI-thread cost of the stall watchdog while the application is idle.
+
+    Args:
+        enabled: Whether the stall watchdog is enabled.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        StallWatchdog.setEnabled(enabled, threshold=100)
+        durations = []
+        for _ in range(max(1, rounds // 10)):
+            loop = QEventLoop()
+            QTimer.singleShot(100, loop.quit)
+            start = time.thread_time()
+            loop.exec()
+            durations.append(time.thread_time() - start)
+        if enabled:
+            print(f"  stalls detected: {len(StallWatchdog.instance().incidents())}")
+        StallWatchdog.setEnabled(False)
+        return durations
+
+    return run
+
+
+benchmark("StallWatchdog.idle[off, GUI CPU/100 ms]")(_watchdogBenchmark(False))
+benchmark("StallWatchdog.idle[100 ms threshold, GUI CPU/100 ms]")(_watchdogBenchmark(True))
+
+
+def _addPageBenchmark(num_pages: int) -> Benchmark:
+    """Create a benchmark for adding pages to a desktop application.
+
+    Args:
+        num_pages: The number of pages added per round.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        durations = []
+        for _ in range(max(_MIN_ROUNDS, rounds // num_pages)):
+            desktop_application = DesktopApplication()
+            buttons = [SideBarButton(icon, f"Page {index}") for index in range(num_pages)]
+            pages = [QWidget() for _ in range(num_pages)]
+            start = time.perf_counter()
+            for button, page in zip(buttons, pages):
+                desktop_application.addPage(button, SideBarButton.Alignment.TOP, page)
+            durations.append(time.perf_counter() - start)
+            desktop_application.deleteLater()
+            QApplication.processEvents()
+        return durations
+
+    return run
+
+
+for _num_pages in (10, 100, 1000):
+    benchmark(f"DesktopApplication.addPage[{_num_pages}]")(_addPageBenchmark(_num_pages))
+
+
+def _addPagesShownBenchmark(bulk: bool) -> Benchmark:
+    """Create a benchmark for adding 1000 pages to a shown desktop application until it is laid out and painted.
+
+    Args:
+        bulk: Whether the pages are added in a single batch via ``addPages`` instead of one by one via ``addPage``.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        durations = []
+        for _ in range(max(1, rounds // 100)):
+            desktop_application = DesktopApplication()
+            desktop_application.resize(800, 600)
+            desktop_application.show()
+            QApplication.processEvents()
+            buttons = [SideBarButton(icon, f"Page {index}") for index in range(1000)]
+            pages = [QWidget() for _ in range(1000)]
+            start = time.perf_counter()
+            if bulk:
+                desktop_application.addPages(
+                    (button, SideBarButton.Alignment.TOP, page) for button, page in zip(buttons, pages)
+                )
+            else:
+                for button, page in zip(buttons, pages):
+                    desktop_application.addPage(button, SideBarButton.Alignment.TOP, page)
+            QApplication.processEvents()
+            durations.append(time.perf_counter() - start)
+            desktop_application.deleteLater()
+            QApplication.processEvents()
+        return durations
+
+    return run
+
+
+# Per-event Python overhead in the side bar widgets shows up here first, e.g. an event() override of the buttons
+benchmark("DesktopApplication.addPage[1000, shown]", budget_us=4e6)(_addPagesShownBenchmark(False))
+benchmark("DesktopApplication.addPages[1000, shown]", budget_us=1e6)(_addPagesShownBenchmark(True))
+
+
+#: Page titles of the quick switcher benchmarks
+_PAGE_TITLES = [
+    f"{name} {index}"
+    for index, name in enumerate(
+        ("Mixer", "Track List", "Piano Roll", "Audio Settings", "Plugin Browser", "Automation Lanes", "Sampler") * 143
+    )
+][:1000]
+
+
+@benchmark("SearchIndex.add[1000]")
+def searchIndexAdd(rounds: int) -> List[float]:
+    """Measure building the search index of 1000 page titles.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+
+    def run() -> None:
+        search_index = SearchIndex()
+        for index, title in enumerate(_PAGE_TITLES):
+            search_index.add(index, title, ("page",))
+
+    return measure(run, max(1, rounds // 10))
+
+
+@benchmark("QuickSwitcher.filter[1000 pages, keystroke]", budget_us=4000)
+def quickSwitcherFilter(rounds: int) -> List[float]:
+    """Measure filtering the quick switcher of 1000 pages on a keystroke, including the result list update.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    desktop_application = createDesktopApplication(0)
+    for title in _PAGE_TITLES:
+        desktop_application.addPage(SideBarButton(QPixmap(), title), SideBarButton.Alignment.TOP, QWidget)
+    desktop_application.showQuickSwitcher()
+    quick_switcher = desktop_application.quickSwitcher()
+    queries = ["a", "au", "aut", "auto", "autom", "automt", "automat", "automati", "automatio", "automation lanes 4"]
+    round_index = 0
+
+    def run() -> None:
+        nonlocal round_index
+        quick_switcher.filter(queries[round_index % len(queries)])
+        round_index += 1
+
+    durations = measure(run, rounds)
+    desktop_application.deleteLater()
+    QApplication.processEvents()
+    return durations
+
+
+@benchmark("DesktopApplication.switchPage")
+def switchPage(rounds: int) -> List[float]:
+    """Measure the latency of switching pages until the new page is painted.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    desktop_application = createDesktopApplication(20)
+    side_bar = desktop_application.findChild(SideBar)
+    assert side_bar is not None
+    index = 0
+
+    def switch() -> None:
+        nonlocal index
+        index = (index + 1) % side_bar.count()
+        side_bar.setCurrentIndex(index)
+        QApplication.processEvents()
+
+    durations = measure(switch, rounds)
+    desktop_application.close()
+    return durations
+
+
+class _LabelPageLoader(PageLoader):
+    """Page loader preparing texts on a worker thread and mounting a page with one label per text"""
+
+    def __init__(self, num_labels: int) -> None:
+        """Constructor
+
+        Args:
+            num_labels: The number of labels of the page.
+        """
+        self._num_labels = num_labels
+
+    def prepare(self, cancelled: threading.Event) -> List[str]:
+        """Prepare the label texts."""
+        return [f"Label {index}" for index in range(self._num_labels)]
+
+    def mount(self, data: List[str]) -> Generator[None, None, QWidget]:
+        """Mount the page label by label."""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        for text in data:
+            layout.addWidget(QLabel(text, page))
+            yield
+        return page
+
+
+@benchmark("DesktopApplication.loadPage[stall]")
+def loadPage(rounds: int) -> List[float]:
+    """Measure the event loop iterations while a page with 1000 labels is loaded in the background.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each event loop iteration in seconds.
+    """
+    durations: List[float] = []
+    while len(durations) < rounds:
+        desktop_application = DesktopApplication()
+        desktop_application.resize(800, 600)
+        desktop_application.addPage(
+            SideBarButton(QPixmap(str(_ICON_PATH)), "Page"), SideBarButton.Alignment.TOP, _LabelPageLoader(1000)
+        )
+        created: List[QWidget] = []
+        desktop_application.pageCreated.connect(created.append)  # type: ignore[attr-defined]
+        desktop_application.show()
+        while not created:
+            durations.extend(measure(QApplication.processEvents, 1))
+        desktop_application.close()
+        desktop_application.deleteLater()
+        QApplication.processEvents()
+    return durations
+
+
+def _createSideBarBenchmark(icon_file: bool) -> Benchmark:
+    """Create a benchmark for creating and showing a side bar with 40 buttons.
+
+    Args:
+        icon_file: Whether the buttons rasterize their icon from the icon file instead of taking a pixmap.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        durations = []
+        for _ in range(max(1, rounds // 10)):
+            start = time.perf_counter()
+            side_bar = createSideBar(40, icon_file=icon_file)
+            durations.append(time.perf_counter() - start)
+            side_bar.close()
+            side_bar.deleteLater()
+            QApplication.processEvents()
+        return durations
+
+    return run
+
+
+benchmark("SideBar.create[40 pixmap icons]")(_createSideBarBenchmark(False))
+benchmark("SideBar.create[40 icon files]")(_createSideBarBenchmark(True))
+
+
+def _createDashboardPage(num_labels: int = 400) -> QWidget:
+    """Create a page with a grid of labels, standing in for a complex dashboard page.
+
+    Args:
+        num_labels: The number of labels.
+
+    Returns:
+        The page.
+    """
+    page = QWidget()
+    layout = QGridLayout(page)
+    for index in range(num_labels):
+        layout.addWidget(QLabel(f"Value {index}", page), index // 20, index % 20)
+    return page
+
+
+def _switchDashboardBenchmark(snapshots: bool) -> Benchmark:
+    """Create a benchmark for the time until the first frame after switching between dashboard pages.
+
+    Args:
+        snapshots: Whether page snapshots are enabled.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        desktop_application = DesktopApplication()
+        desktop_application.resize(1000, 700)
+        for index in range(4):
+            desktop_application.addPage(
+                SideBarButton(icon, f"Page {index}"), SideBarButton.Alignment.TOP, _createDashboardPage()
+            )
+        desktop_application.setSnapshotsEnabled(snapshots)
+        desktop_application.show()
+        side_bar = desktop_application.sideBar()
+        durations = []
+        for round_index in range(rounds + side_bar.count()):
+            start = time.perf_counter()
+            side_bar.setCurrentIndex((round_index + 1) % side_bar.count())
+            desktop_application.repaint()
+            # The first round per page has no snapshot yet
+            if round_index >= side_bar.count():
+                durations.append(time.perf_counter() - start)
+            for _ in range(3):
+                QApplication.processEvents()
+        desktop_application.close()
+        return durations
+
+    return run
+
+
+benchmark("DesktopApplication.switchPage[dashboard]")(_switchDashboardBenchmark(False))
+benchmark("DesktopApplication.switchPage[dashboard, snapshots]")(_switchDashboardBenchmark(True))
+
+
+def _clickDashboardBenchmark(prefetch: bool) -> Benchmark:
+    """Create a benchmark for clicking side bar buttons of dashboard pages built by a factory after hovering them.
+
+    Every page is hibernated as soon as another page is shown, so each click finds its page not created.
+
+    Args:
+        prefetch: Whether pages are prefetched after the pointer rested on their side bar button.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        desktop_application = DesktopApplication()
+        desktop_application.resize(1000, 700)
+        buttons = [SideBarButton(icon, f"Page {index}") for index in range(4)]
+        for button in buttons:
+            desktop_application.addPage(button, SideBarButton.Alignment.TOP, _createDashboardPage)
+        desktop_application.setPageBudget(max_pages=1)
+        desktop_application.prefetcher().setEnabled(prefetch, dwell=20, history=False)
+        desktop_application.show()
+        QApplication.processEvents()
+        durations = []
+        for round_index in range(rounds):
+            button = buttons[(round_index + 1) % len(buttons)]
+            QApplication.sendEvent(button, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                QApplication.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+            start = time.perf_counter()
+            button.click()
+            desktop_application.repaint()
+            durations.append(time.perf_counter() - start)
+            QApplication.sendEvent(button, QEvent(QEvent.Type.Leave))
+            QApplication.processEvents()
+        if prefetch:
+            stats = desktop_application.prefetcher().stats()
+            print(
+                f"  prefetch hit rate: {stats.hit_rate:.0%} ({stats.hits}/{stats.prefetches}), misses: {stats.misses}"
+            )
+        desktop_application.close()
+        return durations
+
+    return run
+
+
+benchmark("DesktopApplication.click[dashboard, hover]")(_clickDashboardBenchmark(False))
+benchmark("DesktopApplication.click[dashboard, hover prefetch]")(_clickDashboardBenchmark(True))
+
+
+def _createLivePage() -> QWidget:
+    """Create a page with a label updated by a 10 ms timer, standing in for a page with a live plot.
+
+    Returns:
+        The page.
+    """
+    page = QWidget()
+    label = QLabel(page)
+    timer = QTimer(page)
+    timer.setInterval(10)
+    timer.timeout.connect(lambda: label.setText(str(sum(range(2000)))))  # type: ignore[attr-defined]
+    timer.start()
+    return page
+
+
+def _idleBenchmark(pause: bool) -> Benchmark:
+    """Create a benchmark for the CPU time spent per 50 ms by a desktop application with 20 live pages.
+
+    Args:
+        pause: Whether the timers of hidden pages are paused.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        desktop_application = DesktopApplication()
+        for index in range(20):
+            page = _createLivePage()
+            desktop_application.addPage(SideBarButton(icon, f"Page {index}"), SideBarButton.Alignment.TOP, page)
+            if pause:
+                desktop_application.pauseWhenHidden(page)
+        desktop_application.show()
+        loop = QEventLoop()
+        durations = []
+        for _ in range(max(1, rounds // 5)):
+            start = time.process_time()
+            QTimer.singleShot(50, loop.quit)
+            loop.exec()
+            durations.append(time.process_time() - start)
+        desktop_application.close()
+        return durations
+
+    return run
+
+
+benchmark("DesktopApplication.idleCpu[20 pages]")(_idleBenchmark(False))
+benchmark("DesktopApplication.idleCpu[20 pages, paused]")(_idleBenchmark(True))
+
+
+def _startupBenchmark(restore: bool) -> Benchmark:
+    """Create a benchmark for the startup of a desktop application with 50 dashboard pages, last left on page 40.
+
+    Args:
+        restore: Whether the session is restored, otherwise the first page is shown and then page 40 is selected.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        icon = QPixmap(str(_ICON_PATH))
+        session_path = Path(tempfile.mkdtemp()).joinpath("session.json")
+
+        def start() -> DesktopApplication:
+            desktop_application = DesktopApplication()
+            if restore:
+                desktop_application.restoreSession(session_path)
+            for index in range(50):
+                desktop_application.addPage(
+                    SideBarButton(icon, f"Page {index}"), SideBarButton.Alignment.TOP, _createDashboardPage
+                )
+            if not restore:
+                desktop_application.sideBar().setCurrentIndex(40)
+            return desktop_application
+
+        saved = start()
+        saved.sideBar().setCurrentIndex(40)
+        saved.saveSession(session_path)
+        saved.deleteLater()
+        durations = []
+        for _ in range(max(1, rounds // 10)):
+            begin = time.perf_counter()
+            desktop_application = start()
+            durations.append(time.perf_counter() - begin)
+            desktop_application.deleteLater()
+            QApplication.processEvents()
+        return durations
+
+    return run
+
+
+benchmark("DesktopApplication.startup[50 pages, switch]")(_startupBenchmark(False))
+benchmark("DesktopApplication.startup[50 pages, restored]")(_startupBenchmark(True))
+
+
+def _resizeSideBarBenchmark(num_buttons: int, vertical: bool = False) -> Benchmark:
+    """Create a benchmark for a drag-resize step of a side bar.
+
+    Args:
+        num_buttons: The number of side bar buttons.
+        vertical: Whether only the height changes, e.g. while the window is resized vertically.
+
+    Returns:
+        The benchmark.
+    """
+
+    def run(rounds: int) -> List[float]:
+        # The side bar is embedded like in a desktop application, top-level windows repaint completely on resize
+        window = QWidget()
+        side_bar = createSideBar(num_buttons)
+        side_bar.setParent(window)
+        height = max(600, side_bar.minimumSizeHint().height())
+        window.resize(200, height + 120)
+        side_bar.show()
+        window.show()
+        QApplication.processEvents()
+        sizes = list(range(60, 120)) + list(range(120, 60, -1))
+        step = 0
+
+        def resize() -> None:
+            nonlocal step
+            size = sizes[step % len(sizes)]
+            if vertical:
+                side_bar.resize(60, height + size)
+            else:
+                side_bar.resize(size, height)
+            step += 1
+            QApplication.processEvents()
+
+        durations = measure(resize, rounds)
+        window.close()
+        return durations
+
+    return run
+
+
+benchmark("SideBar.resizeEvent[drag]")(_resizeSideBarBenchmark(40))
+benchmark("SideBar.resizeEvent[drag, 200 buttons]")(_resizeSideBarBenchmark(200))
+benchmark("SideBar.resizeEvent[vertical drag, 200 buttons]")(_resizeSideBarBenchmark(200, vertical=True))
+
+
+@benchmark("SideBar.scroll[model 500]")
+def scrollSideBar(rounds: int) -> List[float]:
+    """Measure a scroll step of a model-backed side bar with 500 entries until it is painted.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    side_bar = createSideBar(500, model=True)
+    view = side_bar.findChild(SideBarView)
+    assert view is not None
+    scroll_bar = view.verticalScrollBar()
+    step = 0
+
+    def scroll() -> None:
+        nonlocal step
+        scroll_bar.setValue((step * 37) % (scroll_bar.maximum() + 1))
+        step += 1
+        view.viewport().repaint()
+
+    durations = measure(scroll, rounds)
+    side_bar.close()
+    return durations
+
+
+@benchmark("theme.setProperties")
+def setThemeProperties(rounds: int) -> List[float]:
+    """Measure setting all color properties of a desktop application with 40 pages.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    desktop_application = createDesktopApplication(40)
+    widgets: List[QWidget] = [desktop_application, *desktop_application.findChildren(QWidget)]
+    palettes = [QColor("#191E23"), QColor("#222222")]
+    step = 0
+
+    def setProperties() -> None:
+        nonlocal step
+        color = palettes[step % len(palettes)]
+        step += 1
+        for widget in widgets:
+            for name in ("bg_color", "on_color", "hl_color", "icon_off_color", "icon_on_color", "text_color"):
+                if widget.metaObject().indexOfProperty(name) != -1:
+                    widget.setProperty(name, color)
+        QApplication.processEvents()
+
+    durations = measure(setProperties, rounds)
+    desktop_application.close()
+    return durations
+
+
+@benchmark("theme.apply")
+def applyTheme(rounds: int) -> List[float]:
+    """Measure applying a whole palette to the shared theme of a desktop application with 40 pages.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    desktop_application = createDesktopApplication(40)
+    theme = Theme.instance()
+    palettes = [
+        {section: {name: color for name in section_colors} for section, section_colors in theme.colors().items()}
+        for color in ("#191E23", "#222222")
+    ]
+    step = 0
+
+    def apply() -> None:
+        nonlocal step
+        theme.apply(palettes[step % len(palettes)])
+        step += 1
+        QApplication.processEvents()
+
+    durations = measure(apply, rounds)
+    desktop_application.close()
+    return durations
+
+
+@benchmark("theme.setStyleSheet")
+def setThemeStyleSheet(rounds: int) -> List[float]:
+    """Measure applying the example theme style sheets to a desktop application with 40 pages.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    application: QApplication = QApplication.instance()  # type: ignore[assignment]
+    desktop_application = createDesktopApplication(40)
+    style_sheets = [path.read_text(encoding="utf-8") for path in _STYLE_PATHS]
+    step = 0
+
+    def setStyleSheet() -> None:
+        nonlocal step
+        application.setStyleSheet(style_sheets[step % len(style_sheets)])
+        step += 1
+        QApplication.processEvents()
+
+    durations = measure(setStyleSheet, max(1, rounds // 10))
+    application.setStyleSheet("")
+    desktop_application.close()
+    return durations
+
+
+@benchmark("theme.applyFile")
+def applyThemeFile(rounds: int) -> List[float]:
+    """Measure loading the cached example theme files and applying them to a desktop application with 40 pages.
+
+    Args:
+        rounds: The number of rounds.
+
+    Returns:
+        The duration of each round in seconds.
+    """
+    desktop_application = createDesktopApplication(40)
+    cache_dir = Path(tempfile.mkdtemp())
+    for path in _STYLE_PATHS:
+        ThemeFile.load(path, cache_dir)
+    step = 0
+
+    def apply() -> None:
+        nonlocal step
+        ThemeFile.load(_STYLE_PATHS[step % len(_STYLE_PATHS)], cache_dir).apply()
+        step += 1
+        QApplication.processEvents()
+
+    durations = measure(apply, rounds)
+    desktop_application.close()
+    return durations
+
+
+def _importBenchmark(statement: str) -> Benchmark:
+    """Create a benchmark for an import statement executed in a fresh interpreter.
+
+    Args:
+        statement: The import statement.
+
+    Returns:
+        The benchmark.
+    """
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+    def run(rounds: int) -> List[float]:
+        durations = []
+        for _ in range(max(1, rounds // 10)):
+            output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+            durations.append(float(output))
+        return durations
+
+    return run
+
+
+# Importing the packages must not import Qt, which takes well over 100 ms
+benchmark("import PySide6_DAW.Widgets", budget_us=30000)(_importBenchmark("import PySide6_DAW.Widgets"))
+benchmark("import PySide6_DAW.Utils", budget_us=30000)(_importBenchmark("import PySide6_DAW.Utils"))
+benchmark("from PySide6_DAW.Widgets import DesktopApplication")(
+    _importBenchmark("from PySide6_DAW.Widgets import DesktopApplication")
+)
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Summarize the durations of a benchmark.
+
+    Args:
+        durations: The duration of each round in seconds.
+
+    Returns:
+        The number of rounds and the minimum, median and mean duration in microseconds.
+    """
+    return {
+        "rounds": len(durations),
+        "min_us": min(durations) * 1e6,
+        "median_us": statistics.median(durations) * 1e6,
+        "mean_us": statistics.mean(durations) * 1e6,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Compare results against a baseline.
+
+    Args:
+        results: The benchmark results.
+        baseline: The baseline benchmark results.
+        tolerance: The relative slowdown of the median tolerated before a benchmark counts as regression.
+
+    Returns:
+        The names of the regressed benchmarks.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name in baseline and result["median_us"] > baseline[name]["median_us"] * (1.0 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def overBudget(results: Dict[str, Dict[str, float]]) -> List[str]:
+    """Check results against the benchmark budgets.
+
+    Args:
+        results: The benchmark results.
+
+    Returns:
+        The names of the benchmarks exceeding their budget.
+    """
+    return [name for name, result in results.items() if name in _BUDGETS and result["median_us"] > _BUDGETS[name]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code, 1 if a benchmark regressed against the baseline or exceeded its budget.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this string")
+    parser.add_argument("-r", "--rounds", type=int, default=100, help="number of rounds per benchmark")
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("-b", "--baseline", type=Path, help="compare the results against this JSON file")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.25, help="tolerated relative slowdown")
+    args = parser.parse_args(argv)
+
+    _application = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, function in _BENCHMARKS.items():
+        if args.filter in name:
+            results[name] = summarize(function(args.rounds))
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    over_budget = overBudget(results)
+
+    print(f"{'Benchmark':<52} {'Median [us]':>12} {'Min [us]':>12} {'Baseline [us]':>14}")
+    for name, result in results.items():
+        reference = f"{baseline[name]['median_us']:14.1f}" if name in baseline else f"{'-':>14}"
+        marker = "  REGRESSION" if name in regressions else ""
+        if name in over_budget:
+            marker += f"  OVER BUDGET ({_BUDGETS[name]:.0f} us)"
+        print(f"{name:<52} {result['median_us']:12.1f} {result['min_us']:12.1f} {reference}{marker}")
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa_platform": os.environ["QT_QPA_PLATFORM"],
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=4) + "\n", encoding="utf-8")
+
+    return 1 if regressions or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,30 @@ import sys
 from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QMainWindow, QWidget
 
 from PySide6_DAW.Widgets import DesktopApplication, SideBarButton
 
 
+def createPage(text: str) -> QWidget:
+    """Create a simple page showing a text.
+
+    Args:
+        text: The text of the page.
+
+    Returns:
+        The page.
+    """
+    page = QWidget()
+    page_layout = QGridLayout(page)
+    page_label = QLabel(page)
+    page_label.setText(text)
+    page_label.setStyleSheet('color: rgb(255, 255, 255); font: 700 48pt "Segoe UI";')
+    page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    page_layout.addWidget(page_label)
+    return page
+
+
 class MainWindow(QMainWindow):
     """Main Window class."""
 
@@ -23,40 +41,20 @@ class MainWindow(QMainWindow):
         desktop_application = DesktopApplication(self)
         self.setCentralWidget(desktop_application)
 
-        icon = QPixmap(Path(__file__).parent.joinpath("settings.svg"))
+        # The icon is rasterized at the button's icon size on a worker thread
+        icon = Path(__file__).parent.joinpath("settings.svg")
 
         # Page 1
         btn_1 = SideBarButton(icon, "Button 1")
-        page_1 = QWidget()
-        page_1_layout = QGridLayout(page_1)
-        page_1_label = QLabel(page_1)
-        page_1_label.setText("Page 1")
-        page_1_label.setStyleSheet('color: rgb(255, 255, 255); font: 700 48pt "Segoe UI";')
-        page_1_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        page_1_layout.addWidget(page_1_label)
-        desktop_application.addPage(btn_1, SideBarButton.Alignment.TOP, page_1)
-
-        # Page 2
+        desktop_application.addPage(btn_1, SideBarButton.Alignment.TOP, createPage("Page 1"))
+
+        # Page 2 (created when it is shown for the first time)
         btn_2 = SideBarButton(icon, "Button 2")
-        page_2 = QWidget()
-        page_2_layout = QGridLayout(page_2)
-        page_2_label = QLabel(page_2)
-        page_2_label.setText("Page 2")
-        page_2_label.setStyleSheet('color: rgb(255, 255, 255); font: 700 48pt "Segoe UI";')
-        page_2_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        page_2_layout.addWidget(page_2_label)
-        desktop_application.addPage(btn_2, SideBarButton.Alignment.TOP, page_2)
-
-        # Page 3
+        desktop_application.addPage(btn_2, SideBarButton.Alignment.TOP, lambda: createPage("Page 2"))
+
+        # Page 3 (created when it is shown for the first time)
         btn_3 = SideBarButton(icon, "Button 3")
-        page_3 = QWidget()
-        page_3_layout = QGridLayout(page_3)
-        page_3_label = QLabel(page_3)
-        page_3_label.setText("Page 3")
-        page_3_label.setStyleSheet('color: rgb(255, 255, 255); font: 700 48pt "Segoe UI";')
-        page_3_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        page_3_layout.addWidget(page_3_label)
-        desktop_application.addPage(btn_3, SideBarButton.Alignment.BOTTOM, page_3)
+        desktop_application.addPage(btn_3, SideBarButton.Alignment.BOTTOM, lambda: createPage("Page 3"))
 
 
 def main() -> None:
@@ -73,6 +71,10 @@ def main() -> None:
     # with open(Path(__file__).parent.joinpath("style2.qss"), "r", encoding="utf-8") as style_sheet:
     #    app.setStyleSheet(style_sheet.read())
 
+    # Custom color theme compiled and applied directly to the DAW widgets, without re-polishing the application
+    # from PySide6_DAW.Utils import ThemeFile
+    # ThemeFile.load(Path(__file__).parent.joinpath("style2.qss")).apply()
+
     sys.exit(app.exec())
 
 